@@ -105,6 +105,68 @@ class TestApplication:
         assert response.body["error"] == "Custom error"
         assert response.body["message"] == "Test error"
 
+    def test_error_handler_most_specific_wins(self):
+        """예외 클래스에 가장 가까운 상위 타입의 에러 핸들러 선택"""
+
+        class AppError(Exception):
+            pass
+
+        class NotFoundError(AppError):
+            pass
+
+        @Controller("/api")
+        class ApiController:
+            @Get("/missing")
+            def missing(self):
+                raise NotFoundError("missing")
+
+            @Get("/broken")
+            def broken(self):
+                raise AppError("broken")
+
+        app = Application("__main__")
+        app.initialize()
+        app.add_error_handler(
+            AppError, lambda e: HttpResponse(status_code=500, body={"handler": "app"})
+        )
+        app.add_error_handler(
+            NotFoundError,
+            lambda e: HttpResponse(status_code=404, body={"handler": "not_found"}),
+        )
+
+        for _ in range(2):
+            response = app.handle_request(
+                HttpRequest(method="GET", path="/api/missing")
+            )
+            assert response.body == {"handler": "not_found"}
+
+        response = app.handle_request(HttpRequest(method="GET", path="/api/broken"))
+        assert response.body == {"handler": "app"}
+
+    def test_validation_error_handler_override(self):
+        """ValidationError도 에러 핸들러 테이블에서 처리되어 재정의 가능"""
+        from vessel.web.router.parameter_injection import ValidationError
+
+        @Controller("/api")
+        class ApiController:
+            @Get("/items/{item_id}")
+            def get_item(self, item_id: int) -> dict:
+                return {"item_id": item_id}
+
+        app = Application("__main__")
+        app.initialize()
+
+        request = HttpRequest(method="GET", path="/api/items/abc")
+        assert app.handle_request(request).status_code == 400
+
+        app.add_error_handler(
+            ValidationError,
+            lambda e: HttpResponse(status_code=422, body={"fields": len(e.errors)}),
+        )
+        response = app.handle_request(request)
+        assert response.status_code == 422
+        assert response.body == {"fields": 1}
+
     def test_default_error_handling(self):
         """기본 에러 처리 테스트"""
 
@@ -147,12 +209,22 @@ class TestApplication:
             app.get_instance(type)
 
     def test_handle_request_before_initialization(self):
-        """초기화 전 handle_request 호출 시 에러"""
+        """초기화 전 handle_request 호출 시 첫 요청에서 자동 초기화"""
+
+        @Controller("/auto")
+        class AutoController:
+            @Get("/ping")
+            def ping(self) -> dict:
+                return {"pong": True}
+
         app = Application("__main__")
-        request = HttpRequest(method="GET", path="/test")
+        request = HttpRequest(method="GET", path="/auto/ping")
 
-        with pytest.raises(RuntimeError, match="not initialized"):
-            app.handle_request(request)
+        response = app.handle_request(request)
+
+        assert app.is_initialized
+        assert response.body == {"pong": True}
+        assert app.handle_request(request).body == {"pong": True}
 
     def test_multiple_packages(self):
         """여러 패키지 스캔 테스트"""
@@ -0,0 +1,66 @@
+"""
+ASGI 어댑터 테스트
+"""
+
+import asyncio
+import json
+
+from vessel.decorators.web.controller import Controller
+from vessel.decorators.web.mapping import Post
+from vessel.web.application import Application
+from vessel.web.http.injection_types import HttpHeader
+
+
+class TestAsgiApp:
+    """Application._asgi_app 테스트"""
+
+    def _call(self, app, scope, chunks):
+        messages = [
+            {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+            for i, chunk in enumerate(chunks)
+        ]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(app._asgi_app(scope, receive, send))
+        return sent
+
+    def test_http_request(self):
+        """바디 청크 조립, 헤더/쿼리 변환 후 JSON 응답 전송"""
+
+        @Controller("/asgi")
+        class AsgiController:
+            @Post("/echo")
+            def echo(
+                self, name: str, token: HttpHeader["X-Token"], page: int = 1
+            ) -> dict:
+                return {"name": name, "token": token.value, "page": page}
+
+        app = Application("__main__")
+        app.initialize()
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/asgi/echo",
+            "query_string": b"page=3",
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"x-token", b"abc"),
+            ],
+        }
+        sent = self._call(app, scope, [b'{"name": ', b'"vessel"}'])
+
+        assert sent[0]["type"] == "http.response.start"
+        assert sent[0]["status"] == 200
+        assert (b"content-type", b"application/json") in sent[0]["headers"]
+        assert json.loads(sent[1]["body"]) == {
+            "name": "vessel",
+            "token": "abc",
+            "page": 3,
+        }
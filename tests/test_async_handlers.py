@@ -185,3 +185,22 @@ class TestAsyncHandlers:
         # 둘 다 정상적으로 실행되었는지만 확인
         assert sync_time > 0
         assert async_time > 0
+
+    def test_is_async_callable_cache(self):
+        """weakref 가능한 callable만 캐시하고, 나머지는 캐시 없이 판정"""
+        from vessel.utils.async_support import _async_cache, is_async_callable
+
+        class SlottedHandler:
+            __slots__ = ()
+
+            async def __call__(self):
+                return None
+
+        async def handler():
+            return None
+
+        slotted = SlottedHandler()
+        assert is_async_callable(slotted) is True
+        assert is_async_callable(len) is False
+        assert is_async_callable(handler) is True
+        assert _async_cache[handler] is True
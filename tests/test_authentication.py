@@ -359,6 +359,44 @@ class TestCustomAuthentication:
         assert response.body["username"] == "admin"
 
 
+    def test_authentication_extra_attributes(self):
+        """생성자로 넘기거나 나중에 대입한 추가 속성은 인스턴스 속성으로 저장"""
+        auth = Authentication(user_id="u1", authenticated=True, roles=["admin"])
+
+        assert auth.roles == ["admin"]
+        assert getattr(auth, "missing", None) is None
+
+        auth.tenant = "t1"
+        assert auth.tenant == "t1"
+        assert auth.__dict__ == {"roles": ["admin"], "tenant": "t1"}
+        del auth.tenant
+        assert not hasattr(auth, "tenant")
+        assert repr(auth) == (
+            "Authentication(user_id='u1', authenticated=True, roles=['admin'])"
+        )
+
+    def test_middleware_stores_authentication_on_request(self):
+        """AuthMiddleware는 인증 결과를 request.authentication에 저장"""
+
+        class HeaderAuthenticator(Authenticator):
+            def authenticate(self, request: HttpRequest) -> Authentication:
+                return Authentication(user_id="u1", authenticated=True)
+
+            def supports(self, request: HttpRequest) -> bool:
+                return "X-User" in request.headers
+
+        middleware = AuthMiddleware()
+        middleware.register(HeaderAuthenticator())
+
+        request = HttpRequest(method="GET", path="/", headers={"X-User": "u1"})
+        assert request.authentication is None
+        middleware.process_request(request)
+        assert request.authentication.user_id == "u1"
+
+        anonymous = HttpRequest(method="GET", path="/")
+        middleware.process_request(anonymous)
+        assert anonymous.authentication is None
+
 class TestOptionalAuthentication:
     """선택적 인증 테스트"""
 
@@ -431,6 +469,24 @@ class TestOptionalAuthentication:
         assert response2.body["content"] == "free content"
 
 
+    def test_prepare_descriptor(self):
+        """파라미터 타입별 Authentication 해석 결과"""
+        from typing import Optional
+        from vessel.web.auth.injector import AuthenticationInjector
+
+        class CustomAuthentication(Authentication):
+            pass
+
+        injector = AuthenticationInjector()
+
+        assert injector.prepare(Authentication).is_optional is False
+        descriptor = injector.prepare(Optional[CustomAuthentication])
+        assert descriptor.is_optional is True
+        assert descriptor.target_cls is CustomAuthentication
+        assert injector.prepare(Authentication | None).is_optional is True
+        assert injector.prepare(str) is None
+        assert injector.prepare(Optional[str]) is None
+
 class TestAuthMiddlewareFactory:
     """AuthMiddleware Factory 패턴 테스트"""
 
@@ -549,3 +605,94 @@ class TestAuthenticatorPriority:
 
         assert response.status_code == 200
         assert execution_order == ["first", "second"]
+
+
+    def test_scheme_dispatch(self):
+        """scheme을 선언한 인증기는 Authorization 스킴이 일치할 때만 실행"""
+        from vessel.web.auth import AuthenticatorRegistry
+
+        calls = []
+
+        class BearerAuthenticator(Authenticator):
+            scheme = "Bearer"
+
+            def authenticate(self, request: HttpRequest) -> Authentication:
+                calls.append("bearer")
+                return Authentication(user_id="bearer", authenticated=True)
+
+            def supports(self, request: HttpRequest) -> bool:
+                raise AssertionError("scheme 인증기는 supports()를 호출하지 않음")
+
+        class ApiKeyAuthenticator(Authenticator):
+            def authenticate(self, request: HttpRequest) -> Authentication:
+                calls.append("api_key")
+                return Authentication(user_id="api_key", authenticated=True)
+
+            def supports(self, request: HttpRequest) -> bool:
+                return "X-Api-Key" in request.headers
+
+        registry = AuthenticatorRegistry()
+        registry.register(BearerAuthenticator())
+        registry.register(ApiKeyAuthenticator())
+
+        bearer = HttpRequest(
+            method="GET", path="/", headers={"Authorization": "bearer abc"}
+        )
+        api_key = HttpRequest(method="GET", path="/", headers={"X-Api-Key": "k"})
+        basic = HttpRequest(
+            method="GET", path="/", headers={"Authorization": "Basic abc"}
+        )
+
+        assert registry.authenticate(bearer).user_id == "bearer"
+        assert registry.authenticate(api_key).user_id == "api_key"
+        assert registry.authenticate(basic) is None
+        assert calls == ["bearer", "api_key"]
+
+class TestAuthenticationCache:
+    """AuthenticatorRegistry 인증 결과 캐시 테스트"""
+
+    def _create_registry(self, exp=None):
+        from vessel.web.auth import AuthenticatorRegistry
+
+        calls = []
+
+        class CountingAuthenticator(Authenticator):
+            def authenticate(self, request: HttpRequest) -> Authentication:
+                calls.append(request.headers["Authorization"])
+                return Authentication(user_id="user123", authenticated=True, exp=exp)
+
+            def supports(self, request: HttpRequest) -> bool:
+                return "Authorization" in request.headers
+
+        registry = AuthenticatorRegistry()
+        registry.register(CountingAuthenticator())
+        registry.enable_cache(ttl=30)
+        return registry, calls
+
+    def _request(self, token: str) -> HttpRequest:
+        return HttpRequest(
+            method="GET", path="/", headers={"Authorization": f"Bearer {token}"}
+        )
+
+    def test_same_token_authenticated_once(self):
+        """같은 토큰은 인증기를 다시 실행하지 않고 복사본 반환"""
+        registry, calls = self._create_registry()
+
+        first = registry.authenticate(self._request("a"))
+        first.user_id = "changed"
+        second = registry.authenticate(self._request("a"))
+        registry.authenticate(self._request("b"))
+
+        assert second.user_id == "user123"
+        assert calls == ["Bearer a", "Bearer b"]
+
+    def test_expired_token_not_cached(self):
+        """exp가 지난 인증 결과는 캐시하지 않음"""
+        import time
+
+        registry, calls = self._create_registry(exp=time.time() - 1)
+
+        registry.authenticate(self._request("a"))
+        registry.authenticate(self._request("a"))
+
+        assert calls == ["Bearer a", "Bearer a"]
@@ -0,0 +1,158 @@
+"""
+마이크로 배칭 테스트
+"""
+
+import asyncio
+
+from vessel.decorators.web.controller import Controller
+from vessel.decorators.web.mapping import Get
+from vessel.web.application import Application
+from vessel.web.http.request import HttpRequest, HttpResponse
+
+
+class TestMicroBatching:
+    """Application.enable_batching 테스트"""
+
+    def _create_app(self):
+        @Controller("/batch")
+        class BatchController:
+            @Get("/items/{item_id}")
+            def get_item(self, item_id: int) -> dict:
+                return {"item_id": item_id}
+
+        app = Application("__main__")
+        app.initialize()
+        return app
+
+    def test_default_batch_handler(self):
+        """기본 배치 핸들러는 각 요청을 라우트 핸들러로 처리"""
+        app = self._create_app().enable_batching(max_batch_size=4, max_wait_ms=50)
+
+        async def run():
+            return await asyncio.gather(
+                *(
+                    app.handle_request(
+                        HttpRequest(method="GET", path=f"/batch/items/{i}")
+                    )
+                    for i in range(3)
+                )
+            )
+
+        responses = asyncio.run(run())
+        assert [r.body for r in responses] == [{"item_id": i} for i in range(3)]
+
+    def test_custom_batch_handler(self):
+        """max_batch_size 단위로 묶어 batch_handler에 전달"""
+        batch_sizes = []
+
+        async def batch_handler(requests):
+            batch_sizes.append(len(requests))
+            return [HttpResponse(body={"path": r.path}) for r in requests]
+
+        app = self._create_app().enable_batching(
+            max_batch_size=2, max_wait_ms=50, batch_handler=batch_handler
+        )
+
+        async def run():
+            return await asyncio.gather(
+                *(
+                    app.handle_request(HttpRequest(method="GET", path=f"/p/{i}"))
+                    for i in range(5)
+                )
+            )
+
+        responses = asyncio.run(run())
+        assert [r.body["path"] for r in responses] == [f"/p/{i}" for i in range(5)]
+        assert batch_sizes == [2, 2, 1]
+
+    def test_sync_call_not_batched(self):
+        """동기 호출은 배칭 없이 바로 처리"""
+
+        async def batch_handler(requests):
+            raise AssertionError("sync calls must not be batched")
+
+        app = self._create_app().enable_batching(batch_handler=batch_handler)
+
+        response = app.handle_request(HttpRequest(method="GET", path="/batch/items/1"))
+        assert response.body == {"item_id": 1}
+
+    def test_slow_batch_does_not_block_next_batch(self):
+        """느린 배치가 처리되는 동안 다음 배치도 처리"""
+
+        async def batch_handler(requests):
+            if requests[0].path == "/slow":
+                await asyncio.sleep(0.5)
+            return [HttpResponse(body={"path": r.path}) for r in requests]
+
+        app = self._create_app().enable_batching(
+            max_batch_size=1, max_wait_ms=1, batch_handler=batch_handler
+        )
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            slow = asyncio.ensure_future(
+                app.handle_request(HttpRequest(method="GET", path="/slow"))
+            )
+            await asyncio.sleep(0.01)
+            started = loop.time()
+            fast = await app.handle_request(HttpRequest(method="GET", path="/fast"))
+            elapsed = loop.time() - started
+            await slow
+            return fast, elapsed
+
+        fast, elapsed = asyncio.run(run())
+        assert fast.body == {"path": "/fast"}
+        assert elapsed < 0.25
+
+    def test_close_cancels_pending_requests(self):
+        """close() 시 대기 중인 요청은 멈추지 않고 취소됨"""
+
+        async def batch_handler(requests):
+            await asyncio.sleep(10)
+
+        app = self._create_app().enable_batching(
+            max_batch_size=1, max_wait_ms=1, batch_handler=batch_handler
+        )
+
+        async def run():
+            pending = [
+                asyncio.ensure_future(
+                    app.handle_request(HttpRequest(method="GET", path=f"/p/{i}"))
+                )
+                for i in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            app.stop()
+            return await asyncio.wait_for(
+                asyncio.gather(*pending, return_exceptions=True), 1
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+    def test_failed_request_does_not_fail_batch(self):
+        """기본 배치 핸들러는 실패한 요청만 에러 응답으로 변환"""
+        app = self._create_app().enable_batching(max_batch_size=4, max_wait_ms=50)
+        handle_request = app.request_handler.handle_request
+
+        async def flaky_handle_request(request):
+            if request.path == "/batch/items/1":
+                raise RuntimeError("boom")
+            return await handle_request(request)
+
+        app.request_handler.handle_request = flaky_handle_request
+
+        async def run():
+            return await asyncio.gather(
+                *(
+                    app.handle_request(
+                        HttpRequest(method="GET", path=f"/batch/items/{i}")
+                    )
+                    for i in range(3)
+                )
+            )
+
+        responses = asyncio.run(run())
+        assert [r.status_code for r in responses] == [200, 500, 200]
+        assert responses[1].body["message"] == "boom"
+        assert responses[2].body == {"item_id": 2}
@@ -0,0 +1,271 @@
+"""
+DevServer 테스트
+"""
+
+import asyncio
+import http.client
+import json
+import threading
+
+import pytest
+
+from vessel.decorators.web.controller import Controller
+from vessel.decorators.web.mapping import Get, Post
+from vessel.web.application import Application
+from vessel.web.http.request import HttpResponse
+from vessel.web.server import AsyncDevServer, DevServer
+
+
+class TestDevServer:
+    """DevServer 요청 처리 테스트"""
+
+    @pytest.fixture
+    def server_address(self):
+        released = threading.Event()
+
+        @Controller("/dev")
+        class DevController:
+            @Get("/wait")
+            def wait(self) -> dict:
+                return {"released": released.wait(timeout=5)}
+
+            @Get("/created")
+            def created(self) -> HttpResponse:
+                return HttpResponse(
+                    status_code=201, body={"id": 1}, headers={"X-Request-Id": "abc"}
+                )
+
+            @Get("/release")
+            def release(self) -> dict:
+                released.set()
+                return {"released": True}
+
+            @Post("/echo")
+            def echo(self, name: str, count: int = 1) -> dict:
+                return {"name": name, "count": count}
+
+            @Get("/loop")
+            async def loop(self) -> dict:
+                return {"loop": id(asyncio.get_running_loop())}
+
+        app = Application("__main__")
+        app.initialize()
+
+        httpd = DevServer(app, max_workers=4)._create_server(("127.0.0.1", 0))
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        yield httpd.server_address
+        httpd.shutdown()
+        httpd.server_close()
+
+    def _get(self, server_address, path: str):
+        conn = http.client.HTTPConnection(*server_address, timeout=10)
+        try:
+            conn.request("GET", path)
+            return json.loads(conn.getresponse().read())
+        finally:
+            conn.close()
+
+    def _post(self, server_address, body: bytes, content_type: str):
+        conn = http.client.HTTPConnection(*server_address, timeout=5)
+        try:
+            conn.request(
+                "POST", "/dev/echo", body=body, headers={"Content-Type": content_type}
+            )
+            response = conn.getresponse()
+            return response.status, response.read()
+        finally:
+            conn.close()
+
+    def test_json_body(self, server_address):
+        """JSON 바디를 읽어 핸들러에 주입하고 JSON 응답 반환"""
+        payload = {"name": "vessel", "count": 3, "pad": "x" * 100_000}
+        status, body = self._post(
+            server_address, json.dumps(payload).encode(), "application/json"
+        )
+
+        assert status == 200
+        assert json.loads(body) == {"name": "vessel", "count": 3}
+
+    def test_body_decoded_as_json_regardless_of_content_type(self, server_address):
+        """Content-Type이 JSON이 아니어도 바디는 JSON으로 디코딩"""
+        status, body = self._post(
+            server_address, json.dumps({"name": "plain"}).encode(), "text/plain"
+        )
+
+        assert status == 200
+        assert json.loads(body) == {"name": "plain", "count": 1}
+
+    def test_chunked_body_keep_alive(self, server_address):
+        """chunked 바디를 끝까지 읽어 같은 연결의 다음 요청과 섞이지 않음"""
+        conn = http.client.HTTPConnection(*server_address, timeout=5)
+        try:
+            conn.request(
+                "POST",
+                "/dev/echo",
+                body=iter([b'{"name": ', b'"chunked", "count": 2}']),
+                headers={"Content-Type": "application/json"},
+                encode_chunked=True,
+            )
+            first = conn.getresponse()
+            first_body = json.loads(first.read())
+
+            conn.request("GET", "/dev/created")
+            second = conn.getresponse()
+            second_body = json.loads(second.read())
+        finally:
+            conn.close()
+
+        assert first.status == 200
+        assert first_body == {"name": "chunked", "count": 2}
+        assert second.status == 201
+        assert second_body == {"id": 1}
+
+    def test_unsupported_transfer_encoding_rejected(self, server_address):
+        """chunked 외의 Transfer-Encoding은 400으로 거부하고 연결을 닫음"""
+        conn = http.client.HTTPConnection(*server_address, timeout=5)
+        try:
+            conn.putrequest("POST", "/dev/echo")
+            conn.putheader("Transfer-Encoding", "gzip")
+            conn.endheaders()
+            response = conn.getresponse()
+            response.read()
+        finally:
+            conn.close()
+
+        assert response.status == 400
+        assert response.will_close
+
+    def test_concurrent_requests(self, server_address):
+        """처리 중인 요청이 있어도 다른 요청을 동시에 처리"""
+        results = []
+        waiter = threading.Thread(
+            target=lambda: results.append(self._get(server_address, "/dev/wait"))
+        )
+        waiter.start()
+
+        assert self._get(server_address, "/dev/release") == {"released": True}
+        waiter.join(timeout=10)
+        assert results == [{"released": True}]
+
+    def test_event_loop_reused(self, server_address):
+        """요청마다 새 이벤트 루프를 만들지 않고 서버 루프를 재사용"""
+        first = self._get(server_address, "/dev/loop")
+        second = self._get(server_address, "/dev/loop")
+        assert first == second
+
+    def test_keep_alive(self, server_address):
+        """HTTP/1.1 연결 하나로 여러 요청 처리"""
+        conn = http.client.HTTPConnection(*server_address, timeout=5)
+        try:
+            conn.request("GET", "/dev/created")
+            first = conn.getresponse()
+            first.read()
+            sock = conn.sock
+
+            conn.request("GET", "/dev/created")
+            second = conn.getresponse()
+            second.read()
+            assert conn.sock is sock
+        finally:
+            conn.close()
+
+        assert first.version == 11
+        assert not first.will_close
+        assert second.status == 201
+
+    def test_response_status_and_headers(self, server_address):
+        """상태 줄, 응답 헤더, Content-Length를 함께 전송"""
+        conn = http.client.HTTPConnection(*server_address, timeout=5)
+        try:
+            conn.request("GET", "/dev/created")
+            response = conn.getresponse()
+            body = response.read()
+        finally:
+            conn.close()
+
+        assert response.status == 201
+        assert response.reason == "Created"
+        assert response.getheader("Content-Type") == "application/json"
+        assert response.getheader("X-Request-Id") == "abc"
+        assert int(response.getheader("Content-Length")) == len(body)
+        assert json.loads(body) == {"id": 1}
+
+
+class TestAsyncDevServer:
+    """AsyncDevServer 요청 처리 테스트"""
+
+    @pytest.fixture
+    def server_address(self):
+        @Controller("/adev")
+        class AsyncDevController:
+            @Post("/echo")
+            def echo(self, name: str, count: int = 1) -> dict:
+                return {"name": name, "count": count}
+
+        app = Application("__main__")
+        app.initialize()
+
+        loop = asyncio.new_event_loop()
+        server = loop.run_until_complete(
+            AsyncDevServer(app, host="127.0.0.1", port=0).start()
+        )
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        yield server.sockets[0].getsockname()[:2]
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        server.close()
+        loop.run_until_complete(server.wait_closed())
+        loop.close()
+
+    def test_keep_alive_requests(self, server_address):
+        """한 연결에서 여러 요청을 처리하고 쿼리/JSON 바디를 주입"""
+        conn = http.client.HTTPConnection(*server_address, timeout=5)
+        try:
+            for count in (1, 2):
+                conn.request(
+                    "POST",
+                    f"/adev/echo?count={count}",
+                    body=json.dumps({"name": "vessel"}).encode(),
+                    headers={"Content-Type": "application/json"},
+                )
+                response = conn.getresponse()
+                assert response.status == 200
+                assert response.getheader("Connection") == "keep-alive"
+                assert json.loads(response.read()) == {"name": "vessel", "count": count}
+
+            conn.request("GET", "/adev/missing")
+            response = conn.getresponse()
+            assert response.status == 404
+            response.read()
+        finally:
+            conn.close()
+
+    def test_chunked_body_keep_alive(self, server_address):
+        """chunked 바디를 끝까지 읽고 같은 연결에서 다음 요청 처리"""
+        conn = http.client.HTTPConnection(*server_address, timeout=5)
+        try:
+            conn.request(
+                "POST",
+                "/adev/echo",
+                body=iter([b'{"name": ', b'"chunked"}']),
+                headers={"Content-Type": "application/json"},
+                encode_chunked=True,
+            )
+            response = conn.getresponse()
+            assert response.status == 200
+            assert json.loads(response.read()) == {"name": "chunked", "count": 1}
+
+            conn.request(
+                "POST",
+                "/adev/echo?count=2",
+                body=json.dumps({"name": "next"}).encode(),
+                headers={"Content-Type": "application/json"},
+            )
+            response = conn.getresponse()
+            assert response.status == 200
+            assert json.loads(response.read()) == {"name": "next", "count": 2}
+        finally:
+            conn.close()
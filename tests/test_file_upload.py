@@ -88,6 +88,37 @@ class TestBasicFileUpload:
         assert response.body["content"] == "Test file content"
         assert response.body["size"] == len(file_content)
 
+    def test_partial_read(self):
+        """read(size)는 읽은 위치부터 이어서 읽고, read()는 전체 내용 반환"""
+        from vessel.web.http.uploaded_file import UploadedFile
+
+        file = UploadedFile("data.bin", b"0123456789")
+
+        assert file.read(4) == b"0123"
+        assert file.read(4) == b"4567"
+        assert file.read(4) == b"89"
+        assert file.read(4) == b""
+        assert file.read() == b"0123456789"
+
+    def test_from_dicts(self):
+        """키가 모두 있는 dict와 키가 빠진 dict를 섞어서 생성"""
+        from vessel.web.http.uploaded_file import UploadedFile
+
+        files = UploadedFile.from_dicts(
+            [
+                {"filename": "a.txt", "content": b"aa", "content_type": "text/plain"},
+                {"content": b"bbb"},
+                {"filename": "c.png", "content": b"c", "content_type": "image/png"},
+            ]
+        )
+
+        assert [(f.filename, f.size, f.content_type) for f in files] == [
+            ("a.txt", 2, "text/plain"),
+            ("unnamed", 3, "application/octet-stream"),
+            ("c.png", 1, "image/png"),
+        ]
+        assert files[0].read(1) == b"a"
+
     def test_file_save(self):
         """파일 저장"""
         import tempfile
@@ -366,6 +397,16 @@ class TestFilenameSanitization:
         assert "/" not in response.body["safe"]
 
 
+    def test_secure_filename_characters(self):
+        """허용되지 않는 문자(비 ASCII 포함)는 "_"로, 연속된 점은 하나로"""
+        from vessel.web.http.uploaded_file import UploadedFile
+
+        assert UploadedFile("my file?.tar..gz", b"").secure_filename() == (
+            "my_file_.tar.gz"
+        )
+        assert UploadedFile("보고서 2024.pdf", b"").secure_filename() == "____2024.pdf"
+        assert UploadedFile("...", b"").secure_filename() == "unnamed"
+
 class TestTypeHintBasedFileInjection:
     """타입 힌트 기반 파일 주입 테스트"""
 
@@ -100,6 +100,37 @@ class TestHttpHeaderInjection:
         assert response.body["accept_language"] == "en-US"
         assert response.body["accept_language_name"] == "Accept-Language"
 
+    def test_header_lookup_case_insensitive(self):
+        """Test header lookup ignores the case sent by the client"""
+
+        @Controller("/api")
+        class UserController:
+            @Get("/user")
+            def get_user(self, user_agent: HttpHeader) -> dict:
+                return {"name": user_agent.name, "value": user_agent.value}
+
+        app = Application("__main__")
+        app.initialize()
+
+        request = HttpRequest(
+            method="GET", path="/api/user", headers={"user-agent": "curl/8.0"}
+        )
+
+        response = app.handle_request(request)
+        assert response.status_code == 200
+        assert response.body == {"name": "User-Agent", "value": "curl/8.0"}
+
+    def test_lower_header_map_built_once(self):
+        """Test the lowercased header map is built once per request"""
+        request = HttpRequest(
+            method="GET", path="/", headers={"X-Trace-Id": "abc", "Accept": "*/*"}
+        )
+
+        assert request.get_header_ignore_case("x-trace-id") == "abc"
+        lower_headers = request._lower_headers
+        assert request.get_header_ignore_case("x-missing") is None
+        assert request._lower_headers is lower_headers
+
     def test_missing_required_header(self):
         """Test missing required header raises error"""
 
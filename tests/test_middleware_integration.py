@@ -8,6 +8,8 @@ from vessel import (
     Configuration,
     Factory,
     Application,
+    Controller,
+    Get,
     Middleware,
     MiddlewareChain,
     HttpRequest,
@@ -166,5 +168,316 @@ def test_middleware_execution_order():
     ]
 
 
+def test_middleware_chain_change_after_initialize():
+    """초기화 후 미들웨어 구성이 바뀌면 합성된 체인을 다시 만듦"""
+
+    @Component
+    class BlockMiddleware(Middleware):
+        def process_request(self, request: HttpRequest):
+            return HttpResponse(status_code=403, body={"blocked": True})
+
+        def process_response(self, request: HttpRequest, response: HttpResponse):
+            return response
+
+    @Configuration
+    class TestConfig:
+        @Factory
+        def middleware_chain(self, block: BlockMiddleware) -> MiddlewareChain:
+            chain = MiddlewareChain()
+            chain.get_default_group().add(block)
+            return chain
+
+    app = Application("__main__", debug=False)
+    app.initialize()
+
+    request = HttpRequest(method="GET", path="/test", headers={})
+    assert app.handle_request(request).status_code == 403
+
+    app.middleware_chain.get_default_group().disable()
+    assert app.handle_request(request).status_code == 404
+
+
+def test_middleware_early_return_must_be_response():
+    """early return 값이 HttpResponse가 아니면 500 에러"""
+
+    @Component
+    class DictMiddleware(Middleware):
+        def process_request(self, request: HttpRequest):
+            return {"not": "a response"}
+
+        def process_response(self, request: HttpRequest, response: HttpResponse):
+            return response
+
+    @Configuration
+    class TestConfig:
+        @Factory
+        def middleware_chain(self, mw: DictMiddleware) -> MiddlewareChain:
+            chain = MiddlewareChain()
+            chain.get_default_group().add(mw)
+            return chain
+
+    app = Application("__main__", debug=False)
+    app.initialize()
+
+    response = app.handle_request(HttpRequest(method="GET", path="/test"))
+    assert response.status_code == 500
+    assert response.body["error"] == "RuntimeError"
+
+def test_falsy_early_return_continues_to_handler():
+    """{} / "" / 0 같은 거짓 값은 early return이 아니라 핸들러로 진행"""
+    import asyncio
+
+    class FalsyMiddleware(Middleware):
+        def __init__(self, value):
+            self.value = value
+
+        def process_request(self, request: HttpRequest):
+            return self.value
+
+        def process_response(self, request: HttpRequest, response: HttpResponse):
+            return response
+
+    class AsyncFalsyMiddleware(FalsyMiddleware):
+        async def process_request(self, request: HttpRequest):
+            return self.value
+
+    async def handler(request):
+        return HttpResponse(body={"handled": True})
+
+    for middleware_class in (FalsyMiddleware, AsyncFalsyMiddleware):
+        for value in ({}, "", 0):
+            chain = MiddlewareChain()
+            chain.get_default_group().add(middleware_class(value))
+            dispatch = chain.build_composed(handler)
+            request = HttpRequest(method="GET", path="/test", headers={})
+            response = asyncio.run(dispatch(request))
+            assert response.body == {"handled": True}
+
+def test_async_middleware_hooks():
+    """async process_request/process_response도 await 후 적용"""
+
+    @Component
+    class AsyncHeaderMiddleware(Middleware):
+        async def process_request(self, request: HttpRequest):
+            request.context["async_seen"] = True
+            return None
+
+        async def process_response(self, request: HttpRequest, response: HttpResponse):
+            response.headers["X-Async"] = str(request.context["async_seen"])
+            return response
+
+    @Configuration
+    class TestConfig:
+        @Factory
+        def middleware_chain(self, mw: AsyncHeaderMiddleware) -> MiddlewareChain:
+            chain = MiddlewareChain()
+            chain.get_default_group().add(mw)
+            return chain
+
+    @Controller("/api")
+    class TestController:
+        @Get("/ping")
+        def ping(self) -> dict:
+            return {"pong": True}
+
+    app = Application("__main__", debug=False)
+    app.initialize()
+
+    response = app.handle_request(HttpRequest(method="GET", path="/api/ping"))
+    assert response.status_code == 200
+    assert response.headers["X-Async"] == "True"
+
+def test_active_middlewares_cached_until_change():
+    """활성 미들웨어 튜플은 구성이 바뀔 때까지 재사용"""
+
+    class NoopMiddleware(Middleware):
+        def process_request(self, request: HttpRequest):
+            return None
+
+        def process_response(self, request: HttpRequest, response: HttpResponse):
+            return response
+
+    first, second = NoopMiddleware(), NoopMiddleware()
+    chain = MiddlewareChain()
+    chain.get_default_group().add(first)
+
+    active = chain.get_all_middlewares()
+    assert active == (first,)
+    assert chain.get_all_middlewares() is active
+
+    chain.add_group("extra").add(second)
+    assert chain.get_all_middlewares() == (first, second)
+
+    with pytest.raises(TypeError):
+        chain.get_default_group().add(second, object())
+    assert chain.get_default_group().middlewares == [first]
+
+    chain.disable(first)
+    assert chain.get_all_middlewares() == ()
+
+    async def handler(request):
+        return HttpResponse()
+
+    # 활성 미들웨어가 없으면 합성 없이 핸들러 그대로 사용
+    assert chain.build_composed(handler) is handler
+    request = HttpRequest(method="GET", path="/test", headers={})
+    assert chain.execute_request(request) is None
+
+def test_frozen_chain_rejects_changes():
+    """freeze() 이후에는 체인과 그룹 변경을 거부"""
+
+    class NoopMiddleware(Middleware):
+        def process_request(self, request: HttpRequest):
+            return None
+
+        def process_response(self, request: HttpRequest, response: HttpResponse):
+            return response
+
+    middleware = NoopMiddleware()
+    chain = MiddlewareChain()
+    chain.get_default_group().add(middleware)
+    chain.freeze()
+
+    assert chain.frozen
+    assert chain.get_all_middlewares() == (middleware,)
+    with pytest.raises(RuntimeError):
+        chain.get_default_group().add(NoopMiddleware())
+    with pytest.raises(RuntimeError):
+        chain.get_default_group().disable()
+    with pytest.raises(RuntimeError):
+        chain.add_group("extra")
+    with pytest.raises(RuntimeError):
+        chain.disable(middleware)
+    assert chain.get_all_middlewares() == (middleware,)
+
+def test_direct_attribute_assignment_invalidates_cache():
+    """그룹/체인 속성을 직접 대입해도 다음 조회부터 반영"""
+
+    class NoopMiddleware(Middleware):
+        def process_request(self, request: HttpRequest):
+            return None
+
+        def process_response(self, request: HttpRequest, response: HttpResponse):
+            return response
+
+    first, second = NoopMiddleware(), NoopMiddleware()
+    chain = MiddlewareChain()
+    group = chain.get_default_group()
+    group.add(first)
+    assert chain.get_all_middlewares() == (first,)
+
+    group.middlewares = [second]
+    assert chain.get_all_middlewares() == (second,)
+
+    group.enabled = False
+    assert chain.get_all_middlewares() == ()
+
+    group.enabled = True
+    chain.disabled_middlewares = {NoopMiddleware}
+    assert chain.get_all_middlewares() == ()
+
+    chain.disabled_middlewares = set()
+    chain.freeze()
+    with pytest.raises(RuntimeError):
+        group.enabled = False
+    with pytest.raises(RuntimeError):
+        chain.disabled_middlewares = {NoopMiddleware}
+    assert chain.get_all_middlewares() == (second,)
+
+def test_cors_middleware_headers():
+    """CORS 헤더 추가 및 설정 변경 반영"""
+    from vessel import CorsMiddleware
+
+    cors = CorsMiddleware()
+    request = HttpRequest(method="GET", path="/test", headers={})
+
+    response = cors.process_response(request, HttpResponse(body={}))
+    assert response.headers["Access-Control-Allow-Origin"] == "*"
+
+    cors.set_allowed_origins("https://example.com").set_max_age(600)
+    request = HttpRequest(
+        method="GET", path="/test", headers={"Origin": "https://example.com"}
+    )
+    response = cors.process_response(
+        request, HttpResponse(body={}, headers={"X-Custom": "1"})
+    )
+    assert response.headers["Access-Control-Allow-Origin"] == "https://example.com"
+    assert response.headers["Access-Control-Max-Age"] == "600"
+    assert response.headers["X-Custom"] == "1"
+
+    other = HttpRequest(
+        method="OPTIONS", path="/test", headers={"Origin": "https://evil.com"}
+    )
+    preflight = cors.process_request(other)
+    assert preflight.status_code == 204
+    assert "Access-Control-Allow-Origin" not in preflight.headers
+
+    # 설정 속성을 직접 대입해도 다음 응답부터 반영
+    cors.allowed_origins = ["*"]
+    cors.allowed_methods = ["GET"]
+    cors.allowed_headers = ["X-Token"]
+    response = cors.process_response(request, HttpResponse(body={}))
+    assert response.headers["Access-Control-Allow-Origin"] == "*"
+    assert response.headers["Access-Control-Allow-Methods"] == "GET"
+    assert response.headers["Access-Control-Allow-Headers"] == "X-Token"
+
+
+
+def test_logging_middleware_uses_access_logger():
+    """LoggingMiddleware는 print 대신 vessel.access 로거로 기록"""
+    import logging
+    from vessel import LoggingMiddleware
+    from vessel.web.middleware.builtins import access_logger
+
+    records = []
+
+    class ListHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record.getMessage())
+
+    handler = ListHandler()
+    access_logger.addHandler(handler)
+    previous_level = access_logger.level
+    access_logger.setLevel(logging.INFO)
+    try:
+        middleware = LoggingMiddleware()
+        request = HttpRequest(method="GET", path="/test", headers={})
+        middleware.process_request(request)
+        middleware.process_response(request, HttpResponse(status_code=201))
+    finally:
+        access_logger.removeHandler(handler)
+        access_logger.setLevel(previous_level)
+
+    assert records == ["→ GET /test", "← 201"]
+
+
+def test_access_logs_propagate_to_parent_loggers():
+    """vessel / root 로거에 붙인 핸들러도 접근 로그를 받음"""
+    import logging
+    from vessel import LoggingMiddleware
+    from vessel.web.middleware.builtins import access_logger
+
+    records = []
+
+    class ListHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record.getMessage())
+
+    handler = ListHandler()
+    parent = logging.getLogger("vessel")
+    parent.addHandler(handler)
+    previous_level = access_logger.level
+    access_logger.setLevel(logging.INFO)
+    try:
+        middleware = LoggingMiddleware()
+        request = HttpRequest(method="GET", path="/test", headers={})
+        middleware.process_request(request)
+    finally:
+        parent.removeHandler(handler)
+        access_logger.setLevel(previous_level)
+
+    assert access_logger.propagate
+    assert records == ["→ GET /test"]
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -166,6 +166,41 @@ class TestParameterInjectorIntegration:
         assert response.body["username"] == "john"
         assert response.body["age"] == 30
 
+    def test_trusted_body_skips_validation(self):
+        """@TrustedBody 핸들러는 Pydantic 검증 없이 모델 생성"""
+        from vessel import TrustedBody
+
+        class UserModel(BaseModel):
+            username: str = Field(min_length=3)
+            age: int = 0
+
+        @Controller("/api")
+        class InternalController:
+            @Post("/internal/users")
+            @TrustedBody
+            def create_internal(self, body: RequestBody[UserModel]) -> dict:
+                return {"username": body.username, "age": body.age}
+
+            @Post("/users")
+            def create_user(self, body: RequestBody[UserModel]) -> dict:
+                return {"username": body.username, "age": body.age}
+
+        app = Application("__main__")
+        app.initialize()
+
+        def post(path):
+            return app.handle_request(
+                HttpRequest(method="POST", path=path, body={"username": "jo"})
+            )
+
+        response = post("/api/internal/users")
+        assert response.status_code == 200
+        assert response.body == {"username": "jo", "age": 0}
+
+        response = post("/api/users")
+        assert response.status_code == 400
+        assert response.body["details"][0]["field"] == "body.username"
+
     def test_file_upload_injection(self):
         """UploadedFile 주입 테스트 (Priority 200)"""
 
@@ -388,6 +423,26 @@ class TestParameterInjectorIntegration:
         assert response.body["active_type"] == "bool"
         assert response.body["tags"] == "python,test"
 
+    def test_generic_list_query_parameter(self):
+        """list[int] 쿼리 파라미터 변환 테스트"""
+
+        @Controller("/api")
+        class ListQueryController:
+            @Get("/ids")
+            def get_ids(self, ids: list[int]) -> dict:
+                return {"ids": ids}
+
+        app = Application("__main__")
+        app.initialize()
+
+        request = HttpRequest(
+            method="GET", path="/api/ids", query_params={"ids": "1, 2,3"}
+        )
+        response = app.handle_request(request)
+
+        assert response.status_code == 200
+        assert response.body["ids"] == [1, 2, 3]
+
     def test_validation_error_handling(self):
         """Validation 에러 처리 테스트"""
 
@@ -697,6 +752,55 @@ class TestParameterInjectorEdgeCases:
         assert response.body["username"] == "john"
         assert response.body["age"] == 30
 
+        # 모델 타입 해석은 라우트 등록 시 한 번만 수행
+        spec = app.route_handler.find_route("POST", "/api/users").param_plan[0]
+        bound = spec.injector.bind(spec.name, spec.param, {"body": spec.param_type})
+        request_data = {"username": "kim", "age": "7", "extra": 1}
+        assert bound(None, request_data) == (UserData("kim", 7), False)
+        assert request_data == {"extra": 1}
+
+    def test_param_name_shared_with_body_field(self):
+        """query 파라미터와 같은 이름의 body 필드도 함께 주입됨"""
+
+        @dataclass
+        class Item:
+            user_id: int
+            name: str
+
+        @Controller("/api")
+        class ItemController:
+            @Post("/items")
+            def create_item(self, user_id: int, item: RequestBody[Item]) -> dict:
+                return {"user_id": user_id, "item_user_id": item.user_id}
+
+        app = Application("__main__")
+        app.initialize()
+
+        response = app.handle_request(
+            HttpRequest(
+                method="POST", path="/api/items", body={"user_id": 5, "name": "n"}
+            )
+        )
+        assert response.status_code == 200
+        assert response.body == {"user_id": 5, "item_user_id": 5}
+
+        # 컴파일되지 않은 주입 경로도 모든 주입 후에 request_data에서 제거
+        route_handler = app.route_handler
+        route = route_handler.find_route("POST", "/api/items")
+        registry = route_handler.injector_registry
+        request = HttpRequest(method="POST", path="/api/items")
+        for inject in (
+            lambda data: registry.inject_planned(
+                route.param_plan, request, data, route.type_hints
+            ),
+            lambda data: registry.inject_parameters(
+                route.handler, request, data, route.type_hints
+            ),
+        ):
+            kwargs = inject({"user_id": "5", "name": "n"})
+            assert kwargs["user_id"] == 5
+            assert kwargs["item"] == Item(5, "n")
+
     def test_empty_request_body(self):
         """빈 request body 처리"""
 
@@ -833,5 +937,125 @@ class TestParameterInjectorEdgeCases:
         assert response.body["second_field4"] == 20.5
 
 
+class TestParameterInjectorRegistry:
+    """ParameterInjectorRegistry 등록/고정 동작 테스트"""
+
+    def test_registry_frozen_after_initialize(self):
+        """초기화 후 registry가 고정되고 추가 등록이 거부되는지 테스트"""
+        from vessel.web.router.parameter_injection import HttpRequestInjector
+
+        app = Application("__main__")
+        app.initialize()
+        registry = app.route_handler.injector_registry
+
+        assert registry.is_frozen
+        priorities = [injector.priority for injector in registry._injectors]
+        assert priorities == sorted(priorities)
+
+        with pytest.raises(RuntimeError):
+            registry.register(HttpRequestInjector())
+
+    def test_param_plan_built_at_registration(self):
+        """라우트 등록 시 파라미터별 injector가 미리 선택되는지 테스트"""
+        from vessel.web.router.parameter_injection import (
+            DefaultValueInjector,
+            HttpHeaderInjector,
+        )
+
+        @Controller("/api")
+        class PlanController:
+            @Get("/plan")
+            def plan(
+                self, request: HttpRequest, user_agent: HttpHeader, page: int = 1
+            ) -> dict:
+                return {"page": page}
+
+        app = Application("__main__")
+        app.initialize()
+
+        route = app.route_handler.find_route("GET", "/api/plan")
+        plan = route.param_plan
+
+        assert [spec.name for spec in plan] == ["request", "user_agent", "page"]
+        assert plan[0].injector is None
+        assert isinstance(plan[1].injector, HttpHeaderInjector)
+        assert isinstance(plan[2].injector, DefaultValueInjector)
+
+        # 계획을 펼친 주입 함수도 함께 생성
+        assert route.compiled_injector is not None
+        response = app.handle_request(
+            HttpRequest(
+                method="GET",
+                path="/api/plan",
+                headers={"User-Agent": "pytest"},
+                query_params={"page": "3"},
+            )
+        )
+        assert response.body == {"page": 3}
+
+        # 기본값 파라미터는 등록 시 준비한 전용 주입 함수 사용
+        bound = plan[2].injector.bind("page", plan[2].param, route.type_hints)
+        assert bound(None, {"page": "5"}) == (5, True)
+        assert bound(None, {}) == (1, True)
+        assert plan[1].injector.bind("user_agent", plan[1].param, {}) is None
+
+
+    def test_dataclass_decoder_compiled_per_type(self):
+        """dataclass별 디코더를 한 번 생성하고 변환/기본값/에러를 처리"""
+        from dataclasses import field
+        from vessel.web.router.parameter_injection import ValidationError
+        from vessel.web.router.parameter_injection.dataclass_injector import (
+            DataclassInjector,
+        )
+
+        @dataclass
+        class Profile:
+            name: str
+            age: int
+            active: bool = True
+            tags: list[str] = field(default_factory=list)
+
+        injector = DataclassInjector()
+        decoder = injector.get_decoder(Profile)
+        assert injector.get_decoder(Profile) is decoder
+
+        profile = decoder({"name": "kim", "age": "30", "tags": "a, b"}, "profile")
+        assert profile == Profile(name="kim", age=30, active=True, tags=["a", "b"])
+
+        with pytest.raises(ValidationError) as exc_info:
+            decoder({"age": "old"}, "profile")
+        assert [err["field"] for err in exc_info.value.errors] == [
+            "profile.name",
+            "profile.age",
+        ]
+
+        # 중첩 dataclass 에러는 상위 필드 이름과 함께 기록
+        @dataclass
+        class Account:
+            owner: Profile
+            plan: str = "free"
+
+        with pytest.raises(ValidationError) as exc_info:
+            injector.get_decoder(Account)({"owner": {"name": "kim"}}, "account")
+        assert [err["field"] for err in exc_info.value.errors] == ["owner.age"]
+
+        # 필드 타입별 변환 함수도 재사용
+        assert injector._get_converter(list[str]) is injector._get_converter(list[str])
+
+    def test_dataclass_string_annotations_resolved(self):
+        """문자열 필드 타입(전방 참조)도 실제 타입으로 변환"""
+        from vessel.web.router.parameter_injection.dataclass_injector import (
+            DataclassInjector,
+        )
+
+        @dataclass
+        class Page:
+            number: "int"
+            sizes: "list[int]"
+
+        decoder = DataclassInjector().get_decoder(Page)
+        page = decoder({"number": "2", "sizes": "10,20"}, "page")
+        assert page == Page(number=2, sizes=[10, 20])
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,238 @@
+"""
+라우트 매칭 테스트
+"""
+
+import pytest
+from typing import List
+from vessel.decorators.web.controller import Controller
+from vessel.decorators.web.mapping import Get, Post
+from vessel.web.application import Application
+from vessel.web.http.request import HttpRequest
+
+
+class TestRouteMatching:
+    """정적/동적 라우트 매칭 테스트"""
+
+    @pytest.fixture
+    def app(self):
+        @Controller("/users")
+        class UserController:
+            @Get("/me")
+            def me(self) -> dict:
+                return {"route": "me"}
+
+            @Get("/{user_id}")
+            def get_user(self, user_id: int) -> dict:
+                return {"route": "get_user", "user_id": user_id}
+
+            @Post("/{user_id}")
+            def update_user(self, user_id: int) -> dict:
+                return {"route": "update_user", "user_id": user_id}
+
+            @Get("/me/settings")
+            def my_settings(self) -> dict:
+                return {"route": "my_settings"}
+
+            @Get("/{user_id}/posts/{post_id}")
+            def get_post(self, user_id: int, post_id: int) -> dict:
+                return {"route": "get_post", "user_id": user_id, "post_id": post_id}
+
+        app = Application("__main__")
+        app.initialize()
+        return app
+
+    def test_static_route_preferred_over_param(self, app):
+        """고정 세그먼트가 {param}보다 우선"""
+        response = app.handle_request(HttpRequest(method="GET", path="/users/me"))
+        assert response.body == {"route": "me"}
+
+    def test_path_params(self, app):
+        """path parameter 추출"""
+        response = app.handle_request(HttpRequest(method="GET", path="/users/7"))
+        assert response.body == {"route": "get_user", "user_id": 7}
+
+        response = app.handle_request(
+            HttpRequest(method="GET", path="/users/7/posts/3")
+        )
+        assert response.body == {"route": "get_post", "user_id": 7, "post_id": 3}
+
+    def test_backtrack_to_param_segment(self, app):
+        """고정 세그먼트 경로가 막히면 {param} 경로로 되돌아가 탐색"""
+        response = app.handle_request(
+            HttpRequest(method="GET", path="/users/me/posts/3")
+        )
+        # get_post로 매칭되어 user_id="me"의 int 변환 검증에서 실패
+        assert response.status_code == 400
+        assert response.body["details"][0]["field"] == "user_id"
+
+    def test_method_dispatch(self, app):
+        """같은 경로에서 HTTP 메서드별 라우트 선택"""
+        response = app.handle_request(HttpRequest(method="POST", path="/users/7"))
+        assert response.body == {"route": "update_user", "user_id": 7}
+
+    def test_route_not_found(self, app):
+        """매칭되는 라우트가 없으면 404"""
+        response = app.handle_request(HttpRequest(method="DELETE", path="/users/7"))
+        assert response.status_code == 404
+
+        response = app.handle_request(HttpRequest(method="GET", path="/users/7/x"))
+        assert response.status_code == 404
+
+    def test_match_cache(self, app):
+        """트라이 매칭 결과는 캐시하되 path parameter dict는 매번 새로 생성"""
+        route_handler = app.route_handler
+
+        first = route_handler._match_route("GET", "/users/7")
+        first[1]["user_id"] = "changed"
+        second = route_handler._match_route("GET", "/users/7")
+
+        assert second[0] is first[0]
+        assert second[1] == {"user_id": "7"}
+        assert ("GET", "/users/7") in route_handler._match_cache
+        assert route_handler._match_route("GET", "/users/7/x") is None
+        assert ("GET", "/users/7/x") not in route_handler._match_cache
+
+    def test_match_cache_cleared_on_add_route(self, app):
+        """캐시된 매칭 후 라우트가 추가되면 고정 세그먼트 우선 규칙을 다시 적용"""
+        from vessel.web.router.handler import Route
+
+        route_handler = app.route_handler
+        old_route = route_handler.find_route("GET", "/users/7/posts/3")
+        assert ("GET", "/users/7/posts/3") in route_handler._match_cache
+
+        new_route = Route(
+            "/users/7/posts/{post_id}",
+            "GET",
+            old_route.handler,
+            old_route.controller_instance,
+            old_route.controller_class,
+        )
+        route_handler._add_route(new_route)
+
+        assert route_handler.find_route("GET", "/users/7/posts/3") is new_route
+
+    def test_compiled_trie_matches_trie_walk(self, app):
+        """생성된 매칭 함수는 트라이 탐색과 같은 결과를 반환"""
+        route_handler = app.route_handler
+        root = route_handler._route_tries["GET"]
+        compiled = route_handler._compile_trie(root)
+        walker = route_handler._trie_walker(root)
+
+        for path in [
+            "/users/7",
+            "/users/me/posts/3",
+            "/users/7/posts/3",
+            "/users/7/x",
+            "/users/",
+            "/posts/1",
+        ]:
+            assert compiled(path) == walker(path)
+        assert compiled("/users/me/posts/3")[1] == ("me", "3")
+
+    def test_request_data_skipped_when_unused(self):
+        """request_data를 읽지 않는 핸들러는 요청 데이터 병합 생략"""
+        from vessel.web.http.injection_types import HttpHeader
+
+        @Controller("/api")
+        class HeaderController:
+            @Get("/agent")
+            def agent(self, request: HttpRequest, user_agent: HttpHeader) -> dict:
+                return {"agent": user_agent.value, "path": request.path}
+
+            @Get("/echo")
+            def echo(self, q: str) -> dict:
+                return {"q": q}
+
+        app = Application("__main__")
+        app.initialize()
+
+        agent_route = app.route_handler.find_route("GET", "/api/agent")
+        echo_route = app.route_handler.find_route("GET", "/api/echo")
+        assert agent_route.needs_request_data is False
+        assert echo_route.needs_request_data is True
+
+        response = app.handle_request(
+            HttpRequest(
+                method="GET",
+                path="/api/agent",
+                headers={"User-Agent": "test"},
+                query_params={"x": "1"},
+            )
+        )
+        assert response.body == {"agent": "test", "path": "/api/agent"}
+
+
+class TestCacheableParams:
+    """@CacheableParams 파라미터 캐시 테스트"""
+
+    def test_cached_params_reused(self):
+        """같은 query/path 값이면 파싱 결과 재사용"""
+        from vessel import CacheableParams
+
+        @Controller("/api")
+        class PollController:
+            @Get("/items/{item_id}")
+            @CacheableParams
+            def get_item(self, item_id: int, verbose: bool = False) -> dict:
+                return {"item_id": item_id, "verbose": verbose}
+
+        app = Application("__main__")
+        app.initialize()
+
+        route = app.route_handler.find_route("GET", "/api/items/1")
+        assert route.params_cache is not None
+
+        for _ in range(2):
+            response = app.handle_request(
+                HttpRequest(
+                    method="GET",
+                    path="/api/items/1",
+                    query_params={"verbose": "true"},
+                )
+            )
+            assert response.body == {"item_id": 1, "verbose": True}
+
+        response = app.handle_request(HttpRequest(method="GET", path="/api/items/2"))
+        assert response.body == {"item_id": 2, "verbose": False}
+        assert len(route.params_cache._entries) == 2
+
+    def test_not_cached_with_mutable_param(self):
+        """list 파라미터는 요청 간 공유되면 안 되므로 캐시하지 않음"""
+        from vessel import CacheableParams
+
+        @Controller("/api")
+        class TagController:
+            @Get("/tags")
+            @CacheableParams
+            def tags(self, tags: List[str]) -> dict:
+                tags.append("seen")
+                return {"tags": list(tags)}
+
+        app = Application("__main__")
+        app.initialize()
+
+        route = app.route_handler.find_route("GET", "/api/tags")
+        assert route.params_cache is None
+
+        for _ in range(2):
+            response = app.handle_request(
+                HttpRequest(method="GET", path="/api/tags", query_params={"tags": "a"})
+            )
+            assert response.body == {"tags": ["a", "seen"]}
+
+    def test_not_cached_with_request_param(self):
+        """HttpRequest 등 요청 의존 파라미터가 있으면 캐시하지 않음"""
+        from vessel import CacheableParams
+
+        @Controller("/api")
+        class PollController:
+            @Get("/status")
+            @CacheableParams
+            def status(self, request: HttpRequest) -> dict:
+                return {"path": request.path}
+
+        app = Application("__main__")
+        app.initialize()
+
+        route = app.route_handler.find_route("GET", "/api/status")
+        assert route.params_cache is None
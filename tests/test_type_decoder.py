@@ -0,0 +1,70 @@
+"""
+타입 힌트 디코더 테스트
+"""
+
+from typing import Annotated, Optional, Union
+
+from vessel.web.http.injection_types import HttpHeader
+from vessel.web.http.uploaded_file import UploadedFile
+from vessel.web.router.parameter_injection.type_decoder import (
+    ANNOTATED,
+    LIST,
+    OPTIONAL,
+    TypeInfo,
+    decode_annotation,
+    resolve_type_hints,
+)
+
+
+class TestTypeDecoder:
+    """decode_annotation 테스트"""
+
+    def test_plain_type(self):
+        assert decode_annotation(HttpHeader) == TypeInfo(HttpHeader, None, 0)
+
+    def test_annotated_key(self):
+        info = decode_annotation(HttpHeader["User-Agent"])
+        assert info == TypeInfo(HttpHeader, "User-Agent", ANNOTATED)
+
+    def test_optional(self):
+        assert decode_annotation(Optional[HttpHeader]).flags == OPTIONAL
+        assert decode_annotation(HttpHeader | None).flags == OPTIONAL
+
+        info = decode_annotation(Optional[HttpHeader["X-Token"]])
+        assert info == TypeInfo(HttpHeader, "X-Token", OPTIONAL | ANNOTATED)
+
+    def test_list(self):
+        assert decode_annotation(list[UploadedFile]) == TypeInfo(
+            UploadedFile, None, LIST
+        )
+        info = decode_annotation(list[UploadedFile["docs"]])
+        assert info == TypeInfo(UploadedFile, "docs", LIST | ANNOTATED)
+
+    def test_ambiguous_union_is_not_unwrapped(self):
+        union_type = Union[HttpHeader, int]
+        assert decode_annotation(union_type) == TypeInfo(union_type, None, 0)
+
+    def test_unhashable_metadata(self):
+        info = decode_annotation(Annotated[HttpHeader, ["unhashable"]])
+        assert info.base_type is HttpHeader
+        assert info.key == ["unhashable"]
+
+
+class TestResolveTypeHints:
+    """resolve_type_hints 테스트"""
+
+    def test_evaluated_annotations(self):
+        def handler(self, token: HttpHeader["X-Token"], page: int = 1) -> dict:
+            pass
+
+        hints = resolve_type_hints(handler)
+        assert hints["token"] == HttpHeader["X-Token"]
+        assert hints["page"] is int
+
+    def test_forward_reference(self):
+        def handler(self, file: "UploadedFile", page: "int") -> dict:
+            pass
+
+        hints = resolve_type_hints(handler)
+        assert hints["file"] is UploadedFile
+        assert hints["page"] is int
@@ -0,0 +1,59 @@
+"""
+[DEPRECATED] ParameterValidator 하위 호환성 테스트
+"""
+
+import pytest
+
+from vessel.validation import ParameterValidator, ValidationError
+
+
+def handler(a: int, flag: bool, c: list, d: dict, e: float = 1.0):
+    pass
+
+
+def _errors(request_data: dict) -> dict:
+    with pytest.raises(ValidationError) as exc_info:
+        ParameterValidator.validate_and_convert(handler, request_data)
+    return {err["field"]: err["message"] for err in exc_info.value.errors}
+
+
+class TestParameterValidator:
+    """기존 변환 규칙과 에러 메시지 유지"""
+
+    def test_valid_conversion(self):
+        params = ParameterValidator.validate_and_convert(
+            handler, {"a": "3", "flag": "yes", "c": [1], "d": {"k": 1}, "e": "2.5"}
+        )
+        assert params == {"a": 3, "flag": True, "c": [1], "d": {"k": 1}, "e": 2.5}
+
+    def test_legacy_error_messages(self):
+        errors = _errors({"a": "abc", "flag": "x", "c": [], "d": {}, "e": "z"})
+        assert errors == {
+            "a": "Invalid type for 'a': Cannot convert 'abc' to int",
+            "flag": "Invalid type for 'flag': Cannot convert 'x' to bool",
+            "e": "Invalid type for 'e': Cannot convert 'z' to float",
+        }
+
+    def test_legacy_rejections(self):
+        """bool은 on/off를 받지 않고, list/dict는 타입이 맞아야 함"""
+        errors = _errors({"a": 1, "flag": "on", "c": "x", "d": "y"})
+        assert errors == {
+            "flag": "Invalid type for 'flag': Cannot convert 'on' to bool",
+            "c": "Invalid type for 'c': Expected list, got str",
+            "d": "Invalid type for 'd': Expected dict, got str",
+        }
+
+    def test_bound_and_unbound_share_cache(self):
+        """바운드/언바운드 호출 순서와 무관하게 signature가 맞아야 함"""
+
+        class Handler:
+            def get(this: object, a: int):
+                pass
+
+        data = {"this": "x", "a": "1"}
+        bound = ParameterValidator.validate_and_convert(Handler().get, dict(data))
+        unbound = ParameterValidator.validate_and_convert(Handler.get, dict(data))
+
+        assert bound == {"a": 1}
+        assert unbound == {"this": "x", "a": 1}
+        assert ParameterValidator.validate_and_convert(Handler().get, data) == {"a": 1}
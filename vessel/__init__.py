@@ -21,6 +21,8 @@ from vessel.decorators.web.mapping import (
     Delete,
     Patch,
     HttpMethodMappingHandler,
+    CacheableParams,
+    TrustedBody,
 )
 from vessel.di.core.container_manager import ContainerManager
 from vessel.web.http.request import HttpRequest, HttpResponse
@@ -51,6 +53,8 @@ __all__ = [
     "HandlerInterceptor",
     "HandlerContainer",
     "HttpMethodMappingHandler",
+    "CacheableParams",
+    "TrustedBody",
     "ContainerManager",
     "HttpRequest",
     "HttpResponse",
@@ -33,7 +33,7 @@ class ComponentContainer(Container):
 
         try:
             hints = get_type_hints(self.target)
-        except:
+        except Exception:
             hints = {}
 
         # 인스턴스 생성 (기본 생성자)
@@ -31,7 +31,7 @@ class ConfigurationContainer(Container):
 
         try:
             hints = get_type_hints(self.target)
-        except:
+        except Exception:
             hints = {}
 
         # 인스턴스 생성
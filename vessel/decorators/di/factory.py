@@ -24,7 +24,7 @@ class FactoryContainer(Container):
         try:
             hints = get_type_hints(target)
             self.return_type = hints.get("return")
-        except:
+        except Exception:
             pass
 
     def initialize(self, dependencies: dict = None, parent_instance=None) -> any:
@@ -63,7 +63,7 @@ class HandlerContainer(Container):
             # 타입 힌트를 통한 의존성 주입
             try:
                 hints = get_type_hints(interceptor_class)
-            except:
+            except Exception:
                 hints = {}
 
             # 속성에 의존성 주입
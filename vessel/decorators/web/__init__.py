@@ -4,6 +4,8 @@ Vessel Decorators - Web Module
 Web 관련 데코레이터:
 - @Controller: 컨트롤러 등록
 - @Get, @Post, @Put, @Delete, @Patch: HTTP 메서드 매핑
+- @CacheableParams: GET 핸들러 파라미터 파싱 결과 캐시
+- @TrustedBody: 신뢰할 수 있는 RequestBody 입력의 Pydantic 검증 생략
 """
 
 from vessel.decorators.web.controller import (
@@ -17,6 +19,8 @@ from vessel.decorators.web.mapping import (
     Delete,
     Patch,
     HttpMethodMappingHandler,
+    CacheableParams,
+    TrustedBody,
 )
 
 __all__ = [
@@ -28,4 +32,6 @@ __all__ = [
     "Delete",
     "Patch",
     "HttpMethodMappingHandler",
+    "CacheableParams",
+    "TrustedBody",
 ]
@@ -89,3 +89,40 @@ Post = _create_http_handler_decorator("POST")
 Put = _create_http_handler_decorator("PUT")
 Delete = _create_http_handler_decorator("DELETE")
 Patch = _create_http_handler_decorator("PATCH")
+
+
+def CacheableParams(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    파라미터 파싱 결과 캐시 허용 데코레이터 (GET 핸들러 전용, opt-in)
+
+    같은 query / path 값으로 반복 호출되는 상태 없는 GET 핸들러(헬스 체크,
+    폴링 등)에서 파라미터 변환 결과를 라우트별 LRU 캐시에 보관합니다.
+    query / path 값만으로 주입되는 불변 타입 파라미터(int, float, str, bool
+    및 이들의 Optional)만 있는 핸들러에만 적용됩니다. 캐시된 값은 요청 간에
+    공유되므로 list[int] 등 가변 타입 파라미터가 있으면 캐시하지 않습니다.
+
+    사용법:
+        @Get("/health")
+        @CacheableParams
+        def health(self, verbose: bool = False): ...
+    """
+    func.__pydi_cacheable_params__ = True
+    return func
+
+
+def TrustedBody(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    RequestBody 검증 생략 데코레이터 (opt-in)
+
+    이미 검증된 입력만 받는 핸들러(내부 서비스 간 호출 등)에서
+    RequestBody[PydanticModel] 파라미터를 model_construct()로 생성하여
+    Pydantic 검증을 건너뜁니다. 타입 변환과 validator가 실행되지 않으므로
+    신뢰할 수 있는 입력에만 사용해야 합니다. dataclass 모델에는 영향이 없습니다.
+
+    사용법:
+        @Post("/internal/users")
+        @TrustedBody
+        def create(self, user: RequestBody[UserModel]): ...
+    """
+    func.__pydi_trusted_body__ = True
+    return func
@@ -87,5 +87,5 @@ class ContainerCollector:
 
                         # 레지스트리에도 등록
                         register_container(attr, factory_container)
-                except:
+                except Exception:
                     pass
@@ -55,7 +55,7 @@ class InterceptorResolver:
                             for attr_type in hints.values():
                                 if attr_type in components:
                                     interceptor_dep_types.add(attr_type)
-                        except:
+                        except Exception:
                             pass
 
         return interceptor_dep_types
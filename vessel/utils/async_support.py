@@ -6,15 +6,22 @@ asgiref를 사용하여 sync/async 함수를 유연하게 처리하는 유틸리
 
 import asyncio
 import inspect
+import types
 from typing import Any, Awaitable, Callable, Coroutine, TypeVar, Union, cast
+from weakref import WeakKeyDictionary
 from asgiref.sync import sync_to_async, async_to_sync
 
 T = TypeVar("T")
 
+_MISSING = object()
+
+# callable -> async 여부 캐시 (callable이 사라지면 항목도 함께 제거)
+_async_cache: "WeakKeyDictionary[Any, bool]" = WeakKeyDictionary()
+
 
 def is_async_callable(func: Callable[..., Any]) -> bool:
     """
-    함수가 async 함수인지 확인
+    함수가 async 함수인지 확인 (callable별로 결과 캐시)
 
     Args:
         func: 확인할 함수
@@ -22,6 +29,24 @@ def is_async_callable(func: Callable[..., Any]) -> bool:
     Returns:
         bool: async 함수면 True, 아니면 False
     """
+    # 바운드 메서드는 호출마다 새 객체이므로 원본 함수를 캐시 키로 사용
+    key = func.__func__ if type(func) is types.MethodType else func
+
+    try:
+        result = _async_cache.get(key, _MISSING)
+    except TypeError:
+        # weakref를 만들 수 없는 callable(내장 함수, __slots__ 객체 등)은
+        # 캐시 없이 판정
+        return _is_async_callable(func)
+    if result is not _MISSING:
+        return result  # type: ignore[return-value]
+
+    result = _async_cache[key] = _is_async_callable(func)
+    return result
+
+
+def _is_async_callable(func: Callable[..., Any]) -> bool:
+    """캐시 없이 async 함수 여부 판정"""
     # 코루틴 함수인지 확인
     if asyncio.iscoroutinefunction(func):
         return True
@@ -8,6 +8,7 @@ Note: ValidationError와 파라미터 주입 로직은 vessel.web.router.paramet
 """
 
 import inspect
+from weakref import WeakKeyDictionary
 from typing import (
     Any,
     Callable,
@@ -25,6 +26,34 @@ from vessel.web.router.parameter_injection import ValidationError
 # 하위 호환성을 위해 re-export
 __all__ = ["ValidationError", "ParameterValidator"]
 
+# 원본 함수 -> (signature, 바운드 메서드용 signature, 타입 힌트) 캐시
+# (함수가 사라지면 함께 제거)
+_HANDLER_INFO_CACHE: (
+    "WeakKeyDictionary[Callable, Tuple[inspect.Signature, inspect.Signature, Dict]]"
+) = WeakKeyDictionary()
+
+
+def _get_handler_info(handler_func: Callable) -> Tuple[inspect.Signature, Dict]:
+    """
+    핸들러의 signature와 타입 힌트 반환 (함수별로 한 번만 계산)
+
+    바운드 메서드는 접근할 때마다 새 객체이므로 __func__를 키로 사용합니다.
+    signature는 원본 함수 기준으로 계산하고, 바운드 메서드로 호출되면
+    바운드된 첫 번째 파라미터를 제외한 signature를 반환합니다.
+    """
+    func = getattr(handler_func, "__func__", handler_func)
+    try:
+        cached = _HANDLER_INFO_CACHE.get(func)
+    except TypeError:
+        # weakref를 지원하지 않는 callable은 캐시하지 않음
+        return inspect.signature(handler_func), get_type_hints(handler_func)
+    if cached is None:
+        sig = inspect.signature(func)
+        bound_sig = sig.replace(parameters=list(sig.parameters.values())[1:])
+        cached = _HANDLER_INFO_CACHE[func] = (sig, bound_sig, get_type_hints(func))
+    sig, bound_sig, type_hints = cached
+    return (bound_sig if handler_func is not func else sig), type_hints
+
 
 class ParameterValidator:
     """
@@ -61,8 +90,7 @@ class ParameterValidator:
         if skip_params is None:
             skip_params = set()
 
-        sig = inspect.signature(handler_func)
-        type_hints = get_type_hints(handler_func)
+        sig, type_hints = _get_handler_info(handler_func)
 
         validated_params = {}
         errors = []
@@ -150,19 +178,19 @@ class ParameterValidator:
             return value
 
         # 기본 타입 변환
-        if target_type == int:
+        if target_type is int:
             try:
                 return int(value)
             except (ValueError, TypeError):
                 raise ValueError(f"Cannot convert '{value}' to int")
 
-        elif target_type == float:
+        elif target_type is float:
             try:
                 return float(value)
             except (ValueError, TypeError):
                 raise ValueError(f"Cannot convert '{value}' to float")
 
-        elif target_type == bool:
+        elif target_type is bool:
             if isinstance(value, str):
                 if value.lower() in ("true", "1", "yes"):
                     return True
@@ -170,7 +198,7 @@ class ParameterValidator:
                     return False
             raise ValueError(f"Cannot convert '{value}' to bool")
 
-        elif target_type == str:
+        elif target_type is str:
             return str(value)
 
         # List, Dict 등은 그대로 반환
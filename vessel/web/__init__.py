@@ -11,7 +11,8 @@ Vessel Web Module - 웹 애플리케이션 프레임워크
 from vessel.web.application import Application, create_app
 from vessel.web.initializer import ApplicationInitializer
 from vessel.web.request_handler import RequestHandler
-from vessel.web.server import DevServer
+from vessel.web.server import AsyncDevServer, DevServer
+from vessel.web.batching import MicroBatcher
 
 __all__ = [
     "Application",
@@ -19,4 +20,6 @@ __all__ = [
     "ApplicationInitializer",
     "RequestHandler",
     "DevServer",
+    "AsyncDevServer",
+    "MicroBatcher",
 ]
@@ -8,13 +8,18 @@ Spring Boot의 SpringApplication과 유사한 역할
 - DevServer: 개발 서버
 """
 
-from typing import TYPE_CHECKING, Optional, Any, Callable, Protocol
+from typing import TYPE_CHECKING, Optional, Any, Callable, List, Protocol
+import asyncio
 import logging
+import threading
 import inspect
+from urllib.parse import parse_qsl
 from vessel.di.core.container_manager import ContainerManager
 from vessel.web.http.request import HttpRequest, HttpResponse
 from vessel.web.initializer import ApplicationInitializer
 from vessel.web.request_handler import RequestHandler
+from vessel.web.server import _decode_body, _json_dumps
+from vessel.web.batching import BatchHandler, MicroBatcher
 
 if TYPE_CHECKING:
     from vessel.web.middleware.chain import MiddlewareChain
@@ -22,6 +27,29 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# 프로세스 전체에서 logging.basicConfig를 한 번만 호출하기 위한 플래그
+_logging_configured = False
+
+
+def configure_logging(debug: bool = False) -> None:
+    """
+    루트 로거 설정 (프로세스당 한 번)
+
+    Application을 여러 번 생성해도 루트 로거 설정과 logging 모듈 락 획득은
+    처음 한 번만 수행합니다.
+
+    Args:
+        debug: True면 DEBUG, 아니면 INFO 레벨
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    logging.basicConfig(
+        level=logging.DEBUG if debug else logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    _logging_configured = True
+
 
 class Application:
     """
@@ -50,6 +78,7 @@ class Application:
         debug: bool = False,
         host: str = "0.0.0.0",
         port: int = 8080,
+        configure_logging: bool = True,
     ):
         """
         Application 초기화
@@ -59,6 +88,7 @@ class Application:
             debug: 디버그 모드 (상세 로그 출력)
             host: 서버 호스트
             port: 서버 포트
+            configure_logging: 루트 로거 설정 여부 (False면 로깅 설정을 사용자에게 맡김)
         """
         # 설정
         self.packages = list(packages) if packages else []
@@ -78,17 +108,19 @@ class Application:
         # 하위 컴포넌트 (초기화 후 생성)
         self._initializer: Optional[ApplicationInitializer] = None
         self._request_handler: Optional[RequestHandler] = None
+        # 첫 요청 시 자동 초기화를 한 번만 수행하기 위한 락
+        self._init_lock = threading.Lock()
+
+        # 마이크로 배칭 (enable_batching 호출 시 생성)
+        self._batcher: Optional[MicroBatcher] = None
 
         # 로깅 설정
-        self._setup_logging()
+        if configure_logging:
+            self._setup_logging()
 
     def _setup_logging(self):
-        """로깅 설정"""
-        log_level = logging.DEBUG if self.debug else logging.INFO
-        logging.basicConfig(
-            level=log_level,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        )
+        """로깅 설정 (프로세스당 한 번, configure_logging 참고)"""
+        configure_logging(self.debug)
 
     def initialize(self) -> "Application":
         """
@@ -121,6 +153,8 @@ class Application:
         )
 
         self.is_initialized = True
+        # 이후 요청은 초기화 확인 없이 바로 처리
+        self.handle_request = self._handle_request_fast  # type: ignore[method-assign]
 
         return self
 
@@ -140,6 +174,59 @@ class Application:
         self.request_handler.add_error_handler(exception_type, handler)
         return self
 
+    def enable_batching(
+        self,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 10.0,
+        batch_handler: Optional[BatchHandler] = None,
+    ) -> "Application":
+        """
+        비동기 요청 처리에 마이크로 배칭 적용
+
+        이벤트 루프 안에서 들어온 요청을 max_batch_size개 또는 max_wait_ms까지
+        모은 뒤 batch_handler로 한 번에 처리합니다. 동기 호출(asyncio.run)은
+        요청마다 루프가 새로 만들어지므로 배칭하지 않습니다.
+
+        Args:
+            max_batch_size: 한 배치의 최대 요청 수
+            max_wait_ms: 첫 요청 이후 배치를 기다리는 최대 시간 (밀리초)
+            batch_handler: 요청 목록 -> 응답 목록 async 함수
+                          None이면 각 요청을 asyncio.gather로 동시에 처리
+
+        Returns:
+            Application: self (메서드 체이닝용)
+        """
+        if self._batcher is not None:
+            self._batcher.close()
+        self._batcher = MicroBatcher(
+            batch_handler or self._handle_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+        )
+        return self
+
+    async def _handle_batch(self, requests: List[HttpRequest]) -> List[HttpResponse]:
+        """
+        기본 배치 핸들러: 배치 내 요청을 동시에 처리
+
+        한 요청의 예외가 배치 전체를 실패시키지 않도록, 예외는 해당 요청의
+        에러 응답으로 변환합니다.
+        """
+        request_handler = self.request_handler
+        results = await asyncio.gather(
+            *(request_handler.handle_request(request) for request in requests),
+            return_exceptions=True,
+        )
+        responses: List[HttpResponse] = []
+        for request, result in zip(requests, results):
+            if isinstance(result, Exception):
+                result = request_handler._handle_error(result, request)
+            elif isinstance(result, BaseException):
+                # 취소 등은 에러 응답으로 바꾸지 않고 그대로 전파
+                raise result
+            responses.append(result)
+        return responses
+
     def handle_request(self, request: HttpRequest) -> HttpResponse:
         """
         HTTP 요청 처리 (sync/async 호환)
@@ -148,6 +235,9 @@ class Application:
         비동기 호출 시: await로 호출 가능
 
         RequestHandler에 위임
+        initialize()가 호출되지 않았다면 첫 요청에서 한 번 자동으로 초기화합니다.
+        초기화가 끝나면 인스턴스의 handle_request가 _handle_request_fast로
+        교체되어 이후 요청은 초기화 여부를 확인하지 않습니다.
 
         Args:
             request: HTTP 요청
@@ -162,20 +252,103 @@ class Application:
             >>> # 비동기 호출 (새로운 스타일)
             >>> response = await app.handle_request(request)
         """
-
-        # async 함수를 호출하여 코루틴 얻기
-        coro = self.request_handler.handle_request(request)
-
+        if not self.is_initialized:
+            with self._init_lock:
+                if not self.is_initialized:
+                    logger.info("Initializing application on first request")
+                    self.initialize()
+        return self._handle_request_fast(request)
+
+    def _handle_request_fast(self, request: HttpRequest) -> HttpResponse:
+        """초기화 이후의 handle_request (초기화 여부 확인 없음)"""
         # 현재 이벤트 루프가 실행 중인지 확인
-        import asyncio
-
         try:
-            loop = asyncio.get_running_loop()
-            # 이미 async 컨텍스트에 있으면 코루틴 반환 (await 가능)
-            return coro  # type: ignore
+            asyncio.get_running_loop()
         except RuntimeError:
             # 동기 컨텍스트에 있으면 asyncio.run으로 실행
-            return asyncio.run(coro)
+            return asyncio.run(self._request_handler.handle_request(request))
+
+        # 이미 async 컨텍스트에 있으면 코루틴 반환 (await 가능)
+        if self._batcher is not None:
+            return self._batcher.submit(request)  # type: ignore
+        return self._request_handler.handle_request(request)  # type: ignore
+
+    async def _asgi_app(self, scope: dict, receive: Callable, send: Callable):
+        """
+        ASGI 애플리케이션 어댑터
+
+        Uvicorn 등 ASGI 서버에서 handle_request를 호출할 수 있도록
+        scope/receive/send 인터페이스를 HttpRequest/HttpResponse로 변환합니다.
+
+        Args:
+            scope: ASGI 연결 정보
+            receive: ASGI 이벤트 수신 함수
+            send: ASGI 이벤트 전송 함수
+        """
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        if scope["type"] != "http":
+            return
+
+        # 요청 바디 수집 (more_body가 False가 될 때까지)
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunk = message.get("body", b"")
+            if chunk:
+                chunks.append(chunk)
+            more_body = message.get("more_body", False)
+        body_bytes = b"".join(chunks)
+
+        # ASGI 헤더 이름은 소문자이므로 DevServer와 같은 표기(Content-Type)로 변환
+        headers = {
+            key.decode("latin-1").title(): value.decode("latin-1")
+            for key, value in scope.get("headers", ())
+        }
+
+        # 바디는 DevServer와 같이 JSON으로 디코딩
+        body = _decode_body(body_bytes)
+
+        query_string = scope.get("query_string", b"").decode("latin-1")
+        request = HttpRequest(
+            method=scope["method"],
+            path=scope["path"],
+            headers=headers,
+            query_params=dict(parse_qsl(query_string)) if query_string else {},
+            body=body,
+        )
+
+        response = await self.handle_request(request)  # type: ignore[misc]
+
+        response_headers = {"content-type": "application/json"}
+        for key, value in response.headers.items():
+            response_headers[key.lower()] = str(value)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": [
+                    (key.encode("latin-1"), value.encode("latin-1"))
+                    for key, value in response_headers.items()
+                ],
+            }
+        )
+        await send(
+            {
+                "type": "http.response.body",
+                "body": _json_dumps(response.body),
+            }
+        )
 
     def get_instance(self, target_type: type) -> Any:
         """
@@ -201,7 +374,8 @@ class Application:
 
         Args:
             server: WSGI/ASGI 서버 (예: Uvicorn, Gunicorn)
-                   None인 경우 개발용 간단한 서버 시작
+                   None인 경우 Uvicorn이 설치되어 있으면 ASGI 어댑터로 실행하고,
+                   없으면 asyncio 기반 개발 서버(AsyncDevServer) 시작
         """
         if not self.is_initialized:
             self.initialize()
@@ -212,11 +386,32 @@ class Application:
             # 외부 서버 사용 (예: Uvicorn)
             logger.info("Starting with external server...")
             server.run(self)
+            return
+
+        try:
+            import uvicorn
+        except ImportError:
+            uvicorn = None
+
+        if uvicorn is not None:
+            # Uvicorn 사용 (uvloop/httptools가 설치되어 있으면 자동 선택)
+            logger.info("Starting Uvicorn at http://%s:%s", self.host, self.port)
+            try:
+                uvicorn.run(
+                    self._asgi_app,
+                    host=self.host,
+                    port=self.port,
+                    loop="auto",
+                    http="auto",
+                    log_config=None,
+                )
+            finally:
+                self.is_running = False
         else:
-            # DevServer 사용
-            from vessel.web.server import DevServer
+            # asyncio 기반 개발 서버 사용 (스레드 기반 DevServer도 직접 사용 가능)
+            from vessel.web.server import AsyncDevServer
 
-            dev_server = DevServer(self, host=self.host, port=self.port)
+            dev_server = AsyncDevServer(self, host=self.host, port=self.port)
             try:
                 dev_server.run()
             except KeyboardInterrupt:
@@ -228,6 +423,8 @@ class Application:
         """애플리케이션 중지"""
         logger.info("Stopping application...")
         self.is_running = False
+        if self._batcher is not None:
+            self._batcher.close()
         logger.info("✓ Application stopped")
 
     def __repr__(self) -> str:
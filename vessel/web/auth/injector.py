@@ -2,13 +2,26 @@
 Authentication Parameter Injector
 """
 
-from typing import get_origin, get_args, Optional, Tuple, Any
+import types
+from typing import (
+    get_origin,
+    get_args,
+    Any,
+    Dict,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 from vessel.web.router.parameter_injection.base import (
     ParameterInjector,
     InjectionContext,
 )
 from vessel.web.auth.middleware import Authentication
 
+# Optional[T] (typing.Union)와 T | None (types.UnionType)의 origin
+_UNION_ORIGINS = (Union, types.UnionType)
+
 
 class AuthenticationException(Exception):
     """인증 관련 예외"""
@@ -19,6 +32,13 @@ class AuthenticationException(Exception):
         super().__init__(message)
 
 
+class _AuthDescriptor(NamedTuple):
+    """Authentication 파라미터 타입 해석 결과"""
+
+    is_optional: bool  # Optional[Authentication] 여부
+    target_cls: type  # Optional을 벗겨낸 Authentication (하위) 클래스
+
+
 class AuthenticationInjector(ParameterInjector):
     """
     Authentication 파라미터를 주입하는 Injector
@@ -29,40 +49,73 @@ class AuthenticationInjector(ParameterInjector):
     Supports:
         - Authentication
         - CustomAuthentication (Authentication을 상속한 클래스)
-        - Optional[Authentication]
-        - Optional[CustomAuthentication]
+        - Optional[Authentication], Authentication | None
+        - Optional[CustomAuthentication], CustomAuthentication | None
     """
 
+    reads_request_data = False
+
     @property
     def priority(self) -> int:
         """우선순위: 150 (일반 주입기보다 높음)"""
         return 150
 
-    def can_inject(self, context: InjectionContext) -> bool:
+    def __init__(self):
+        # 파라미터 타입 -> _AuthDescriptor (Authentication 파라미터가 아니면 None)
+        self._descriptors: Dict[Any, Optional[_AuthDescriptor]] = {}
+
+    def prepare(self, param_type: Any) -> Optional["_AuthDescriptor"]:
         """
-        파라미터가 Authentication 타입 또는 그 하위 타입인지 확인
+        파라미터 타입을 해석하여 _AuthDescriptor 반환 (타입별 캐시)
+
+        get_origin/get_args/issubclass 검사는 타입당 한 번만 수행하고,
+        요청마다 호출되는 inject는 캐시 조회만 합니다.
 
         Args:
-            context: 주입 컨텍스트
+            param_type: 파라미터 타입 힌트
 
         Returns:
-            주입 가능하면 True
+            Authentication 파라미터면 _AuthDescriptor, 아니면 None
         """
-        param_type = context.param_type
+        try:
+            return self._descriptors[param_type]
+        except KeyError:
+            descriptor = self._describe(param_type)
+            self._descriptors[param_type] = descriptor
+            return descriptor
+        except TypeError:
+            # hashable하지 않은 타입 힌트는 캐시 없이 해석
+            return self._describe(param_type)
+
+    def _describe(self, param_type: Any) -> Optional["_AuthDescriptor"]:
+        """캐시 없이 파라미터 타입 해석"""
+        is_optional = False
+        target_cls = param_type
 
         # Optional[Authentication] 처리
-        if (
-            get_origin(param_type) is type(None)
-            or str(get_origin(param_type)) == "typing.Union"
-        ):
+        if get_origin(param_type) in _UNION_ORIGINS:
             args = get_args(param_type)
-            if args and len(args) == 2 and type(None) in args:
+            if len(args) == 2 and type(None) in args:
                 # Optional[T]는 Union[T, None]과 동일
-                actual_type = args[0] if args[1] is type(None) else args[1]
-                return self._is_authentication_type(actual_type)
+                is_optional = True
+                target_cls = args[0] if args[1] is type(None) else args[1]
 
         # Authentication 또는 그 하위 클래스
-        return self._is_authentication_type(param_type)
+        if not self._is_authentication_type(target_cls):
+            return None
+        return _AuthDescriptor(is_optional, target_cls)
+
+    def can_inject(self, context: InjectionContext) -> bool:
+        """
+        파라미터가 Authentication 타입 또는 그 하위 타입인지 확인
+
+        Args:
+            context: 주입 컨텍스트
+
+        Returns:
+            주입 가능하면 True
+        """
+        return self.prepare(context.param_type) is not None
 
     def inject(self, context: InjectionContext) -> Tuple[Any, bool]:
         """
@@ -77,27 +130,19 @@ class AuthenticationInjector(ParameterInjector):
         Raises:
             AuthenticationException: 인증 필수인데 인증되지 않은 경우
         """
-        param_type = context.param_type
-
-        # Optional 타입 체크
-        is_optional = self._is_optional(param_type)
-
-        # request에서 인증 정보 가져오기
-        authentication = None
-        if hasattr(context.request, "_auth_data") and context.request._auth_data:
-            authentication = context.request._auth_data.get("authentication")
-
-        # Optional이 아닌데 인증 정보가 없으면 401 에러
-        if not is_optional and (
-            authentication is None or not authentication.authenticated
-        ):
-            raise AuthenticationException("Authentication required", 401)
-
-        # Optional이면 None 반환 가능
-        if is_optional and (authentication is None or not authentication.authenticated):
+        # request에서 인증 정보 가져오기 (인증된 요청은 타입 정보 조회 없이 반환)
+        authentication = context.request.authentication
+        if authentication is not None and authentication.authenticated:
+            return (authentication, False)
+
+        # 인증되지 않은 경우에만 Optional 여부 확인
+        descriptor = self.prepare(context.param_type)
+        if descriptor is not None and descriptor.is_optional:
+            # Optional이면 None 반환 가능
             return (None, False)
 
-        return (authentication, False)
+        # Optional이 아닌데 인증 정보가 없으면 401 에러
+        raise AuthenticationException("Authentication required", 401)
 
     def _is_authentication_type(self, param_type: type) -> bool:
         """
@@ -125,7 +170,7 @@ class AuthenticationInjector(ParameterInjector):
 
     def _is_optional(self, param_type: type) -> bool:
         """
-        파라미터가 Optional 타입인지 확인
+        파라미터가 Optional[Authentication] 타입인지 확인
 
         Args:
             param_type: 확인할 타입
@@ -133,13 +178,5 @@ class AuthenticationInjector(ParameterInjector):
         Returns:
             Optional이면 True
         """
-        origin = get_origin(param_type)
-
-        # Union 타입 확인
-        if origin is type(None) or str(origin) == "typing.Union":
-            args = get_args(param_type)
-            # Optional[T]는 Union[T, None]
-            if args and len(args) == 2 and type(None) in args:
-                return True
-
-        return False
+        descriptor = self.prepare(param_type)
+        return descriptor is not None and descriptor.is_optional
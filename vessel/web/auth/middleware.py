@@ -2,8 +2,13 @@
 Authentication Middleware and Components
 """
 
+import copy
+import hashlib
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Any
+from collections import OrderedDict
+from typing import ClassVar, Dict, List, Optional, Any, Tuple
 from vessel.web.http.request import HttpRequest
 from vessel.web.middleware.chain import Middleware
 
@@ -13,15 +18,21 @@ class Authentication:
     기본 인증 정보 클래스
 
     사용자는 이 클래스를 확장하여 자신만의 인증 정보를 담을 수 있습니다.
+    user_id/authenticated는 __slots__에 저장하고, 생성자에 넘기거나 나중에
+    대입한 추가 속성은 일반 인스턴스 속성(__dict__)으로 저장됩니다.
 
     Example:
         class UserAuthentication(Authentication):
+            __slots__ = ("username", "roles")
+
             def __init__(self, user_id: str, username: str, roles: list[str], **kwargs):
                 super().__init__(user_id=user_id, authenticated=True, **kwargs)
                 self.username = username
                 self.roles = roles
     """
 
+    __slots__ = ("user_id", "authenticated", "__dict__")
+
     def __init__(self, user_id: str = None, authenticated: bool = False, **kwargs):
         self.user_id = user_id
         self.authenticated = authenticated
@@ -30,8 +41,15 @@ class Authentication:
             setattr(self, key, value)
 
     def __repr__(self):
-        attrs = ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
-        return f"{self.__class__.__name__}({attrs})"
+        attrs = {"user_id": self.user_id, "authenticated": self.authenticated}
+        attrs.update(self.__dict__)
+        # 서브클래스가 __slots__로 선언한 속성
+        for klass in type(self).__mro__[:-2]:
+            for slot in klass.__dict__.get("__slots__", ()):
+                if slot not in attrs and slot != "__dict__" and hasattr(self, slot):
+                    attrs[slot] = getattr(self, slot)
+        attrs_repr = ", ".join(f"{k}={v!r}" for k, v in attrs.items())
+        return f"{self.__class__.__name__}({attrs_repr})"
 
 
 class Authenticator(ABC):
@@ -53,8 +71,17 @@ class Authenticator(ABC):
 
             def supports(self, request: HttpRequest) -> bool:
                 return 'Authorization' in request.headers
+
+    scheme를 지정하면 Authorization 헤더의 스킴(예: "Bearer")이 일치하는 요청에만
+    supports() 확인 없이 사용됩니다.
+
+        class BearerAuthenticator(Authenticator):
+            scheme = "Bearer"
     """
 
+    # Authorization 헤더 스킴 (None이면 모든 요청에 대해 supports()로 판단)
+    scheme: ClassVar[Optional[str]] = None
+
     @abstractmethod
     def authenticate(self, request: HttpRequest) -> Optional[Authentication]:
         """
@@ -83,6 +110,60 @@ class Authenticator(ABC):
         pass
 
 
+class _AuthenticationCache:
+    """
+    Authorization 헤더별 인증 결과 TTL 캐시
+
+    키는 원본 토큰이 아닌 SHA-256 해시이며, 최대 maxsize개까지 LRU로 보관합니다.
+    Authentication에 exp(만료 시각, epoch 초) 속성이 있으면 그 이전까지만 보관합니다.
+    """
+
+    def __init__(self, ttl: float = 30.0, maxsize: int = 10000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, Tuple[float, Authentication]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(credential: str) -> bytes:
+        """자격 증명 해시 (원본 토큰은 보관하지 않음)"""
+        return hashlib.sha256(credential.encode("utf-8")).digest()[:16]
+
+    def get(self, key: bytes) -> Optional[Authentication]:
+        """만료되지 않은 인증 결과의 복사본 반환"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, authentication = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # 핸들러가 수정해도 캐시된 원본에 영향이 없도록 복사
+        return copy.copy(authentication)
+
+    def put(self, key: bytes, authentication: Authentication) -> None:
+        """인증 결과 저장 (exp가 있으면 남은 유효 시간과 ttl 중 짧은 쪽 사용)"""
+        ttl = self.ttl
+        exp = getattr(authentication, "exp", None)
+        if isinstance(exp, (int, float)):
+            ttl = min(ttl, exp - time.time())
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, copy.copy(authentication))
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
 class AuthenticatorRegistry:
     """
     인증기들을 관리하는 레지스트리
@@ -90,6 +171,27 @@ class AuthenticatorRegistry:
 
     def __init__(self):
         self._authenticators: list[Authenticator] = []
+        # Authorization 스킴(소문자) -> 해당 스킴을 선언한 인증기 목록
+        self._by_scheme: Dict[str, List[Authenticator]] = {}
+        # scheme을 선언하지 않은 인증기 (supports()로 판단)
+        self._fallback: List[Authenticator] = []
+        # enable_cache() 호출 시 생성 (기본은 캐시하지 않음)
+        self._cache: Optional[_AuthenticationCache] = None
+
+    def enable_cache(self, ttl: float = 30.0, maxsize: int = 10000) -> None:
+        """
+        Authorization 헤더 기준 인증 결과 캐시 사용
+
+        같은 Authorization 헤더로 들어온 요청은 ttl(초) 동안 인증기를 다시
+        실행하지 않고 이전 인증 결과의 복사본을 사용합니다. 인증기가
+        Authorization 헤더 외의 값(쿠키, 다른 헤더 등)으로 인증한다면
+        사용하지 않아야 합니다.
+
+        Args:
+            ttl: 캐시 유지 시간 (초)
+            maxsize: 최대 캐시 항목 수
+        """
+        self._cache = _AuthenticationCache(ttl=ttl, maxsize=maxsize)
 
     def register(self, authenticator: Authenticator) -> None:
         """
@@ -103,18 +205,63 @@ class AuthenticatorRegistry:
                 f"Expected Authenticator instance, got {type(authenticator).__name__}"
             )
         self._authenticators.append(authenticator)
+        if authenticator.scheme:
+            self._by_scheme.setdefault(authenticator.scheme.lower(), []).append(
+                authenticator
+            )
+        else:
+            self._fallback.append(authenticator)
+        if self._cache is not None:
+            self._cache.clear()
+
+    def has_authenticators(self) -> bool:
+        """등록된 인증기가 있는지 여부"""
+        return bool(self._authenticators)
 
     def authenticate(self, request: HttpRequest) -> Optional[Authentication]:
         """
         등록된 인증기들을 순회하며 인증을 시도합니다.
 
+        Authorization 헤더 스킴과 일치하는 scheme 인증기를 먼저 시도하고,
+        그 다음 scheme이 없는 인증기를 supports()로 확인하며 시도합니다.
+
         Args:
             request: HTTP 요청 객체
 
         Returns:
             첫 번째로 성공한 인증 결과, 모두 실패하면 None
         """
-        for authenticator in self._authenticators:
+        cache = self._cache
+        if cache is None:
+            return self._authenticate(request)
+
+        credential = request.headers.get("Authorization")
+        if not credential:
+            return self._authenticate(request)
+
+        key = cache.make_key(credential)
+        authentication = cache.get(key)
+        if authentication is not None:
+            return authentication
+
+        authentication = self._authenticate(request)
+        # 인증에 성공한 결과만 캐시 (실패는 매번 다시 시도)
+        if authentication is not None and authentication.authenticated:
+            cache.put(key, authentication)
+        return authentication
+
+    def _authenticate(self, request: HttpRequest) -> Optional[Authentication]:
+        """캐시 없이 인증기 순회"""
+        if self._by_scheme:
+            credential = request.headers.get("Authorization")
+            if credential:
+                scheme = credential.split(" ", 1)[0].lower()
+                for authenticator in self._by_scheme.get(scheme, ()):
+                    authentication = authenticator.authenticate(request)
+                    if authentication is not None:
+                        return authentication
+
+        for authenticator in self._fallback:
             if authenticator.supports(request):
                 authentication = authenticator.authenticate(request)
                 if authentication is not None:
@@ -193,6 +340,16 @@ class AuthMiddleware(Middleware):
         """
         self._registry.register(authenticator)
 
+    def enable_cache(self, ttl: float = 30.0, maxsize: int = 10000) -> None:
+        """
+        Authorization 헤더 기준 인증 결과 캐시 사용 (AuthenticatorRegistry.enable_cache 참고)
+
+        Args:
+            ttl: 캐시 유지 시간 (초)
+            maxsize: 최대 캐시 항목 수
+        """
+        self._registry.enable_cache(ttl=ttl, maxsize=maxsize)
+
     def process_request(self, request: HttpRequest) -> Optional[Any]:
         """
         요청 처리 전 인증 수행
@@ -203,13 +360,15 @@ class AuthMiddleware(Middleware):
         Returns:
             None (항상 다음 핸들러로 진행)
         """
+        # 등록된 인증기가 없으면 인증 생략 (request.authentication은 None 유지)
+        if not self._registry.has_authenticators():
+            return None
+
         # 인증 시도
         authentication = self._registry.authenticate(request)
 
         # 인증 결과를 request에 저장
-        if not hasattr(request, "_auth_data"):
-            request._auth_data = {}
-        request._auth_data["authentication"] = authentication
+        request.authentication = authentication
 
         # 다음 핸들러로 진행
         return None
@@ -0,0 +1,160 @@
+"""
+MicroBatcher - 요청을 모아 한 번에 처리하는 마이크로 배칭
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Set, Tuple
+
+from vessel.web.http.request import HttpRequest, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+BatchHandler = Callable[[List[HttpRequest]], Awaitable[Sequence[HttpResponse]]]
+
+
+class MicroBatcher:
+    """
+    요청을 큐에 모았다가 배치 단위로 처리하는 클래스
+
+    max_batch_size개가 모이거나, 첫 요청 이후 max_wait_ms가 지나면
+    모인 요청을 batch_handler에 한 번에 넘깁니다.
+    batch_handler는 요청 목록과 같은 순서의 응답 목록을 반환해야 합니다.
+
+    큐와 배치 처리 태스크는 처음 요청이 들어온 이벤트 루프에 만들어지며,
+    다른 루프에서 요청이 들어오면 해당 루프에 새로 만듭니다.
+    모인 배치는 각각 별도 태스크로 처리하므로 느린 배치가 다음 배치의 수집과
+    처리를 막지 않습니다.
+    """
+
+    def __init__(
+        self,
+        batch_handler: BatchHandler,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 10.0,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.batch_handler = batch_handler
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # 처리 중인 배치 태스크 (태스크가 GC되지 않도록 참조 유지)
+        self._dispatch_tasks: Set[asyncio.Task] = set()
+        # 아직 응답을 받지 못한 요청의 Future (close() 시 취소)
+        self._pending: Set["asyncio.Future[Any]"] = set()
+
+    async def submit(self, request: HttpRequest) -> HttpResponse:
+        """
+        요청을 큐에 넣고 배치 처리 결과를 기다림
+
+        Args:
+            request: HTTP 요청
+
+        Returns:
+            HttpResponse: 이 요청에 대한 응답
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._task = loop.create_task(self._run_batch_loop(self._queue))
+
+        future = loop.create_future()
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        self._queue.put_nowait((request, future))  # type: ignore[union-attr]
+        return await future
+
+    def close(self) -> None:
+        """
+        배치 처리 태스크 중지
+
+        큐에 남았거나 처리 중인 요청의 Future는 모두 취소되어 기다리던
+        호출자가 멈추지 않습니다. 다른 스레드에서 호출되면 배치 루프의
+        이벤트 루프에서 정리합니다.
+        """
+        loop = self._loop
+        tasks = list(self._dispatch_tasks)
+        if self._task is not None:
+            tasks.append(self._task)
+        futures = list(self._pending)
+        self._task = None
+        self._queue = None
+        self._loop = None
+        self._dispatch_tasks = set()
+        self._pending = set()
+
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._cancel_all(tasks, futures)
+        else:
+            loop.call_soon_threadsafe(self._cancel_all, tasks, futures)
+
+    @staticmethod
+    def _cancel_all(
+        tasks: List[asyncio.Task], futures: List["asyncio.Future[Any]"]
+    ) -> None:
+        """배치 태스크와 대기 중인 요청 Future 취소"""
+        for task in tasks:
+            task.cancel()
+        for future in futures:
+            future.cancel()
+
+    async def _run_batch_loop(self, queue: asyncio.Queue) -> None:
+        """큐에서 배치를 모아 처리하는 백그라운드 루프"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                # 이미 쌓인 요청은 대기 없이 가져옴
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # 배치마다 별도 태스크로 처리하고 바로 다음 배치를 모음
+            task = loop.create_task(self._dispatch(batch))
+            self._dispatch_tasks.add(task)
+            task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch(
+        self, batch: List[Tuple[HttpRequest, "asyncio.Future[Any]"]]
+    ) -> None:
+        """배치를 batch_handler에 넘기고 결과를 각 요청의 Future에 전달"""
+        requests = [request for request, _ in batch]
+        try:
+            responses = await self.batch_handler(requests)
+            if len(responses) != len(requests):
+                raise RuntimeError(
+                    f"Batch handler returned {len(responses)} responses "
+                    f"for {len(requests)} requests"
+                )
+        except Exception as e:
+            logger.error("Batch handler failed: %s", e, exc_info=True)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
+
+
+__all__ = ["MicroBatcher", "BatchHandler"]
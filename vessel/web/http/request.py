@@ -19,7 +19,25 @@ class HttpMethod(Enum):
 
 
 class HttpRequest:
-    """HTTP 요청 객체"""
+    """
+    HTTP 요청 객체
+
+    요청마다 생성되므로 __slots__로 선언하여 인스턴스 __dict__ 할당을 피합니다.
+    미들웨어/핸들러 간에 추가 데이터를 넘길 때는 context를 사용합니다.
+    """
+
+    __slots__ = (
+        "method",
+        "path",
+        "headers",
+        "query_params",
+        "body",
+        "path_params",
+        "cookies",
+        "context",
+        "authentication",
+        "_lower_headers",
+    )
 
     def __init__(
         self,
@@ -39,11 +57,28 @@ class HttpRequest:
         self.path_params = path_params or {}
         self.cookies = cookies or {}
         self.context: Dict[str, Any] = {}  # 미들웨어/핸들러 간 데이터 공유용
+        # AuthMiddleware가 저장하는 Authentication (인증 전/실패 시 None)
+        self.authentication: Optional[Any] = None
+        # 소문자 헤더 이름 -> 값 (대소문자 무시 조회 시 한 번만 생성)
+        self._lower_headers: Optional[Dict[str, str]] = None
 
     def get_header(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """헤더 값 조회"""
         return self.headers.get(key, default)
 
+    def get_header_ignore_case(self, lower_key: str) -> Optional[str]:
+        """
+        소문자로 정규화된 이름으로 헤더 값 조회
+
+        소문자 헤더 맵은 요청당 처음 조회할 때 한 번만 만듭니다.
+        """
+        lower_headers = self._lower_headers
+        if lower_headers is None:
+            lower_headers = self._lower_headers = {
+                key.lower(): value for key, value in self.headers.items()
+            }
+        return lower_headers.get(lower_key)
+
     def get_query_param(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
         """쿼리 파라미터 조회"""
         return self.query_params.get(key, default)
@@ -56,6 +91,8 @@ class HttpRequest:
 class HttpResponse:
     """HTTP 응답 객체"""
 
+    __slots__ = ("body", "status_code", "headers")
+
     def __init__(
         self,
         body: Any = None,
@@ -6,8 +6,23 @@ File Upload Module
 
 import os
 import re
+from operator import itemgetter
 from typing import Optional, Annotated
-from io import BytesIO
+
+# secure_filename에서 허용하는 문자 (알파벳, 숫자, 점, 하이픈, 언더스코어)
+_SAFE_FILENAME_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._-"
+)
+# ASCII 파일명용: 허용되지 않는 문자를 "_"로 바꾸는 변환 테이블 (정규식 없이 한 번에 처리)
+_UNSAFE_ASCII_TABLE = str.maketrans(
+    {chr(code): "_" for code in range(128) if chr(code) not in _SAFE_FILENAME_CHARS}
+)
+# ASCII가 아닌 문자가 섞인 파일명용
+_UNSAFE_FILENAME_RE = re.compile(r"[^a-zA-Z0-9._-]")
+_REPEATED_DOTS_RE = re.compile(r"\.{2,}")
+
+# 파일 dict에서 세 키를 한 번에 꺼내는 getter (키가 모두 있을 때만 사용)
+_get_file_fields = itemgetter("filename", "content", "content_type")
 
 
 class UploadedFile:
@@ -16,8 +31,13 @@ class UploadedFile:
 
     DO NOT instantiate this class directly. It is created by the framework during injection.
     Use type hints (UploadedFile or UploadedFile["key"]) in function parameters instead.
+
+    원본 content를 복사하지 않고 그대로 보관하며, 부분 읽기(read(size))가
+    처음 호출될 때만 memoryview를 만들어 위치 단위로 잘라 반환합니다.
     """
 
+    __slots__ = ("filename", "content_type", "size", "_content", "_view", "_position")
+
     def __init__(
         self,
         filename: str,
@@ -32,7 +52,9 @@ class UploadedFile:
         self._content = content
         self.content_type = content_type
         self.size = len(content)
-        self._stream = BytesIO(content)
+        # read(size)용 memoryview와 읽기 위치 (필요할 때 생성)
+        self._view: Optional[memoryview] = None
+        self._position = 0
 
     def read(self, size: int = -1) -> bytes:
         """
@@ -46,7 +68,15 @@ class UploadedFile:
         """
         if size == -1:
             return self._content
-        return self._stream.read(size)
+
+        view = self._view
+        if view is None:
+            view = self._view = memoryview(self._content)
+
+        start = self._position
+        end = self.size if size < 0 else min(start + size, self.size)
+        self._position = end
+        return bytes(view[start:end])
 
     def save(self, path: str) -> None:
         """
@@ -77,10 +107,14 @@ class UploadedFile:
 
         # 위험한 문자 제거
         # 알파벳, 숫자, 점, 하이픈, 언더스코어만 허용
-        filename = re.sub(r"[^a-zA-Z0-9._-]", "_", filename)
+        if filename.isascii():
+            filename = filename.translate(_UNSAFE_ASCII_TABLE)
+        else:
+            filename = _UNSAFE_FILENAME_RE.sub("_", filename)
 
         # 연속된 점 제거 (..을 . 하나로)
-        filename = re.sub(r"\.+", ".", filename)
+        if ".." in filename:
+            filename = _REPEATED_DOTS_RE.sub(".", filename)
 
         # 앞뒤 공백 및 점 제거
         filename = filename.strip(". ")
@@ -91,6 +125,33 @@ class UploadedFile:
 
         return filename
 
+    @classmethod
+    def from_dicts(cls, files_list: "list[dict]") -> "list[UploadedFile]":
+        """
+        파일 dict 목록으로부터 UploadedFile 목록 생성
+
+        세 키가 모두 있는 dict는 itemgetter로 한 번에 꺼내고 __init__을 거치지
+        않고 생성합니다. 키가 빠진 dict는 parse_file_from_dict로 기본값을 채웁니다.
+        """
+        new = cls.__new__
+        files = []
+        append = files.append
+        for file_dict in files_list:
+            try:
+                filename, content, content_type = _get_file_fields(file_dict)
+            except KeyError:
+                append(parse_file_from_dict(file_dict))
+                continue
+            file = new(cls)
+            file.filename = filename
+            file._content = content
+            file.content_type = content_type
+            file.size = len(content)
+            file._view = None
+            file._position = 0
+            append(file)
+        return files
+
     def __repr__(self) -> str:
         return f"<UploadedFile: {self.filename} ({self.size} bytes)>"
 
@@ -135,4 +196,4 @@ def parse_files_from_list(files_list: list) -> list[UploadedFile]:
     Returns:
         UploadedFile 리스트
     """
-    return [parse_file_from_dict(file_dict) for file_dict in files_list]
+    return UploadedFile.from_dicts(files_list)
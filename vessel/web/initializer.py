@@ -73,7 +73,7 @@ class ApplicationInitializer:
     def _scan_components(self, packages: List[str]):
         """컴포넌트 스캔"""
         if packages:
-            logger.info(f"Scanning packages: {', '.join(packages)}")
+            logger.info("Scanning packages: %s", ", ".join(packages))
             for package in packages:
                 self.container_manager.component_scan(package)
         else:
@@ -90,12 +90,12 @@ class ApplicationInitializer:
             if middleware_chain:
                 middleware_count = len(middleware_chain.get_all_middlewares())
                 logger.info(
-                    f"✓ MiddlewareChain detected with {middleware_count} middleware(s)"
+                    "✓ MiddlewareChain detected with %d middleware(s)", middleware_count
                 )
 
                 if self.debug:
                     for middleware in middleware_chain.get_all_middlewares():
-                        logger.debug(f"  - {type(middleware).__name__}")
+                        logger.debug("  - %s", type(middleware).__name__)
 
                 return middleware_chain
             else:
@@ -106,7 +106,7 @@ class ApplicationInitializer:
             logger.debug("MiddlewareChain not available")
             return MiddlewareChain()
         except Exception as e:
-            logger.warning(f"Failed to detect MiddlewareChain: {e}")
+            logger.warning("Failed to detect MiddlewareChain: %s", e)
             return MiddlewareChain()
 
     def _create_route_handler(self):
@@ -118,8 +118,8 @@ class ApplicationInitializer:
     def _log_controllers(self):
         """등록된 컨트롤러 로깅"""
         controllers = self.container_manager.get_controllers()
-        logger.info(f"Registered {len(controllers)} controller(s)")
+        logger.info("Registered %d controller(s)", len(controllers))
 
         if self.debug:
             for controller_type in controllers:
-                logger.debug(f"  - {controller_type.__name__}")
+                logger.debug("  - %s", controller_type.__name__)
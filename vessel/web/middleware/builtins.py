@@ -3,21 +3,62 @@ Built-in Middleware 구현
 Middleware들은 @Component가 아닌 @Factory로 생성되어야 함
 """
 
-from typing import Optional, List, Any, Literal
+import atexit
+import logging
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Dict, FrozenSet, List, Any, Literal, Tuple
 from vessel.web.middleware.chain import Middleware
 from vessel.web.http.request import HttpRequest, HttpResponse
 
 HttpMethod = Literal["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"]
 
+# LoggingMiddleware 접근 로그 (QueueHandler로 넘기고 별도 스레드에서 출력)
+access_logger = logging.getLogger("vessel.access")
+_access_listener: Optional[QueueListener] = None
+_access_listener_lock = threading.Lock()
+
+
+def _start_access_log_listener() -> None:
+    """
+    접근 로그용 QueueListener 시작 (프로세스당 한 번)
+
+    요청 스레드는 큐에 레코드를 넣기만 하고, stdout 출력은 리스너 스레드가
+    담당합니다. vessel.access 또는 상위 로거(vessel, root)에 핸들러가 이미
+    있으면 그 핸들러를 그대로 사용합니다. 레코드는 항상 상위 로거로도
+    전파되므로, 나중에 root / vessel 로거에 붙인 핸들러도 접근 로그를 받습니다.
+    """
+    global _access_listener
+    with _access_listener_lock:
+        if _access_listener is not None or access_logger.hasHandlers():
+            return
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        _access_listener = QueueListener(log_queue, stream_handler)
+        _access_listener.start()
+        atexit.register(_access_listener.stop)
+
+        access_logger.addHandler(QueueHandler(log_queue))
+        access_logger.setLevel(logging.INFO)
+
 
 class CorsMiddleware(Middleware):
     """
     CORS (Cross-Origin Resource Sharing) 미들웨어
 
     설정 가능한 CORS 정책 제공
+    설정 속성을 직접 대입해도 미리 만들어 둔 헤더가 다시 생성됩니다.
     """
 
     def __init__(self):
+        # Origin과 무관한 CORS 헤더 (설정이 바뀌면 None으로 초기화 후 재생성)
+        self._base_headers: Optional[Dict[str, str]] = None
+        # 허용 Origin 조회용 집합 (_base_headers와 함께 재생성)
+        self._allowed_origin_set: FrozenSet[str] = frozenset()
+        self._allow_any_origin = False
         self.allowed_origins: List[str] = ["*"]
         self.allowed_methods: List[HttpMethod] = [
             "GET",
@@ -31,6 +72,56 @@ class CorsMiddleware(Middleware):
         self.allow_credentials: bool = False
         self.max_age: Optional[int] = None
 
+    @property
+    def allowed_origins(self) -> List[str]:
+        """허용할 Origin 목록"""
+        return self._allowed_origins
+
+    @allowed_origins.setter
+    def allowed_origins(self, origins: List[str]) -> None:
+        self._allowed_origins = origins
+        self._base_headers = None
+
+    @property
+    def allowed_methods(self) -> List[HttpMethod]:
+        """허용할 HTTP 메서드 목록"""
+        return self._allowed_methods
+
+    @allowed_methods.setter
+    def allowed_methods(self, methods: List[HttpMethod]) -> None:
+        self._allowed_methods = methods
+        self._base_headers = None
+
+    @property
+    def allowed_headers(self) -> List[str]:
+        """허용할 헤더 목록"""
+        return self._allowed_headers
+
+    @allowed_headers.setter
+    def allowed_headers(self, headers: List[str]) -> None:
+        self._allowed_headers = headers
+        self._base_headers = None
+
+    @property
+    def allow_credentials(self) -> bool:
+        """자격 증명 허용 여부"""
+        return self._allow_credentials
+
+    @allow_credentials.setter
+    def allow_credentials(self, allow: bool) -> None:
+        self._allow_credentials = allow
+        self._base_headers = None
+
+    @property
+    def max_age(self) -> Optional[int]:
+        """Preflight 요청 캐시 시간 (초)"""
+        return self._max_age
+
+    @max_age.setter
+    def max_age(self, seconds: Optional[int]) -> None:
+        self._max_age = seconds
+        self._base_headers = None
+
     def set_allowed_origins(self, *origins: str) -> "CorsMiddleware":
         """
         허용할 Origin 설정
@@ -109,7 +200,7 @@ class CorsMiddleware(Middleware):
         if request.method == "OPTIONS":
             # Preflight 요청에 대한 응답
             response = HttpResponse(status_code=204, body={})
-            response.headers = self._get_cors_headers(request)
+            response.headers = dict(self._get_cors_headers(request))
             return response
 
         return None
@@ -127,25 +218,25 @@ class CorsMiddleware(Middleware):
         Returns:
             CORS 헤더가 추가된 응답
         """
-        if not hasattr(response, "headers"):
-            response.headers = {}
-
-        cors_headers = self._get_cors_headers(request)
-        response.headers.update(cors_headers)
+        base_headers, origin = self._resolve_cors_headers(request)
+        if not response.headers:
+            response.headers = dict(base_headers)
+        else:
+            response.headers.update(base_headers)
+        if origin is not None:
+            response.headers["Access-Control-Allow-Origin"] = origin
 
         return response
 
-    def _get_cors_headers(self, request: HttpRequest) -> dict:
-        """CORS 헤더 생성"""
+    def _build_base_headers(self) -> Dict[str, str]:
+        """Origin과 무관한 CORS 헤더 생성 (설정당 한 번)"""
+        self._allowed_origin_set = frozenset(self.allowed_origins)
+        self._allow_any_origin = "*" in self._allowed_origin_set
         headers = {}
 
-        # Origin
-        if "*" in self.allowed_origins:
+        # Origin (와일드카드인 경우 요청과 무관)
+        if self._allow_any_origin:
             headers["Access-Control-Allow-Origin"] = "*"
-        else:
-            origin = request.headers.get("Origin", "")
-            if origin in self.allowed_origins:
-                headers["Access-Control-Allow-Origin"] = origin
 
         # Methods
         headers["Access-Control-Allow-Methods"] = ", ".join(self.allowed_methods)
@@ -163,6 +254,41 @@ class CorsMiddleware(Middleware):
 
         return headers
 
+    def _resolve_cors_headers(
+        self, request: HttpRequest
+    ) -> Tuple[Dict[str, str], Optional[str]]:
+        """
+        (Origin과 무관한 헤더, 돌려줄 Origin) 반환
+
+        첫 번째 값은 미리 만들어 둔 dict이므로 호출 측에서 수정하면 안 됩니다.
+        두 번째 값은 허용 목록에 있는 요청 Origin이며, 와일드카드이거나
+        허용되지 않은 Origin이면 None입니다.
+        """
+        base_headers = self._base_headers
+        if base_headers is None:
+            base_headers = self._base_headers = self._build_base_headers()
+
+        if self._allow_any_origin:
+            return base_headers, None
+
+        # 허용 목록에 있는 Origin만 그대로 돌려줌
+        origin = request.headers.get("Origin")
+        if origin in self._allowed_origin_set:
+            return base_headers, origin
+        return base_headers, None
+
+    def _get_cors_headers(self, request: HttpRequest) -> Dict[str, str]:
+        """
+        CORS 헤더 반환
+
+        Origin과 무관한 헤더는 미리 만들어 둔 dict를 그대로 반환하므로
+        호출 측에서 수정하면 안 됩니다 (필요하면 복사해서 사용).
+        """
+        base_headers, origin = self._resolve_cors_headers(request)
+        if origin is not None:
+            return {"Access-Control-Allow-Origin": origin, **base_headers}
+        return base_headers
+
 
 class LoggingMiddleware(Middleware):
     """
@@ -171,15 +297,16 @@ class LoggingMiddleware(Middleware):
 
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
+        _start_access_log_listener()
 
     def process_request(self, request: HttpRequest) -> Optional[Any]:
         """요청 로깅"""
-        print(f"→ {request.method} {request.path}")
+        access_logger.info("→ %s %s", request.method, request.path)
 
-        if self.verbose:
-            print(f"  Headers: {request.headers}")
+        if self.verbose and access_logger.isEnabledFor(logging.INFO):
+            access_logger.info("  Headers: %s", request.headers)
             if request.body:
-                print(f"  Body: {request.body}")
+                access_logger.info("  Body: %s", request.body)
 
         return None
 
@@ -187,10 +314,10 @@ class LoggingMiddleware(Middleware):
         self, request: HttpRequest, response: HttpResponse
     ) -> HttpResponse:
         """응답 로깅"""
-        print(f"← {response.status_code}")
+        access_logger.info("← %s", response.status_code)
 
-        if self.verbose:
-            print(f"  Body: {response.body}")
+        if self.verbose and access_logger.isEnabledFor(logging.INFO):
+            access_logger.info("  Body: %s", response.body)
 
         return response
 
@@ -201,7 +328,10 @@ class AuthenticationMiddleware(Middleware):
     """
 
     def __init__(self, exclude_paths: Optional[List[str]] = None):
-        self.exclude_paths = exclude_paths or ["/health", "/api/public"]
+        # 요청마다 조회하므로 set으로 보관
+        self.exclude_paths: FrozenSet[str] = frozenset(
+            exclude_paths or ("/health", "/api/public")
+        )
 
     def process_request(self, request: HttpRequest) -> Optional[Any]:
         """인증 확인"""
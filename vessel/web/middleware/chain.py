@@ -2,11 +2,19 @@
 Middleware 추상 클래스 및 MiddlewareChain 구현
 """
 
-from typing import Optional, Any, List
+from typing import Optional, Any, Awaitable, Callable, List, Sequence, Tuple
 from abc import ABC, abstractmethod
+from vessel.utils.async_support import is_async_callable
 from vessel.web.http.request import HttpRequest, HttpResponse
 
 
+def _ensure_response(response: Any) -> HttpResponse:
+    """HttpResponse가 아니면 RuntimeError (라우트 핸들러는 항상 HttpResponse 반환)"""
+    if not isinstance(response, HttpResponse):
+        raise RuntimeError(f"Handler must return HttpResponse, got {type(response)}")
+    return response
+
+
 class Middleware(ABC):
     """
     미들웨어 추상 클래스
@@ -26,6 +34,8 @@ class Middleware(ABC):
         Returns:
             None: 다음 미들웨어/핸들러로 진행
             Any: 반환값이 있으면 early return (라우트 핸들러 스킵)
+                ({}, "", 0 처럼 거짓으로 평가되는 값은 남은 미들웨어를
+                건너뛰고 라우트 핸들러로 진행)
         """
         pass
 
@@ -46,13 +56,56 @@ class Middleware(ABC):
         pass
 
 
+# 비활성 그룹이 반환하는 공유 빈 시퀀스
+_EMPTY: Tuple[Middleware, ...] = ()
+
+
 class MiddlewareGroup:
-    """미들웨어 그룹 - 순서가 있는 미들웨어 컬렉션"""
+    """
+    미들웨어 그룹 - 순서가 있는 미들웨어 컬렉션
+
+    middlewares / enabled를 직접 대입해도 소속 체인의 version이 올라가
+    다음 요청부터 반영됩니다.
+    """
 
     def __init__(self, name: str = "default"):
         self.name = name
-        self.middlewares: List[Middleware] = []
-        self.enabled = True
+        self._middlewares: List[Middleware] = []
+        self._enabled = True
+        # 소속 체인 (구성 변경 시 체인의 version을 올리기 위해 사용)
+        self._chain: Optional["MiddlewareChain"] = None
+
+    @property
+    def middlewares(self) -> List[Middleware]:
+        """그룹에 속한 미들웨어 목록"""
+        return self._middlewares
+
+    @middlewares.setter
+    def middlewares(self, middlewares: List[Middleware]) -> None:
+        self._check_mutable()
+        self._middlewares = middlewares
+        self._touch()
+
+    @property
+    def enabled(self) -> bool:
+        """그룹 활성화 여부"""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        self._check_mutable()
+        self._enabled = enabled
+        self._touch()
+
+    def _check_mutable(self) -> None:
+        """소속 체인이 고정(freeze)된 경우 변경 거부"""
+        if self._chain is not None:
+            self._chain._check_mutable()
+
+    def _touch(self) -> None:
+        """구성 변경을 소속 체인에 알림"""
+        if self._chain is not None:
+            self._chain.version += 1
 
     def add(self, *middlewares: Middleware) -> "MiddlewareGroup":
         """
@@ -64,10 +117,13 @@ class MiddlewareGroup:
         Returns:
             self (메서드 체이닝용)
         """
-        for middleware in middlewares:
-            if not isinstance(middleware, Middleware):
-                raise TypeError(f"{middleware} is not a Middleware instance")
-            self.middlewares.append(middleware)
+        self._check_mutable()
+        # 하나라도 잘못된 값이 있으면 아무것도 추가하지 않음
+        invalid = next((m for m in middlewares if not isinstance(m, Middleware)), None)
+        if invalid is not None:
+            raise TypeError(f"{invalid} is not a Middleware instance")
+        self.middlewares.extend(middlewares)
+        self._touch()
         return self
 
     def disable(self) -> "MiddlewareGroup":
@@ -80,9 +136,9 @@ class MiddlewareGroup:
         self.enabled = True
         return self
 
-    def get_active_middlewares(self) -> List[Middleware]:
-        """활성화된 미들웨어 목록 반환"""
-        return self.middlewares if self.enabled else []
+    def get_active_middlewares(self) -> Sequence[Middleware]:
+        """활성화된 미들웨어 목록 반환 (비활성 그룹은 공유 빈 튜플)"""
+        return self._middlewares if self._enabled else _EMPTY
 
 
 class MiddlewareChain:
@@ -93,10 +149,67 @@ class MiddlewareChain:
     """
 
     def __init__(self):
+        # 구성이 바뀔 때마다 증가 (build_composed 결과 재생성 판단용)
+        self.version = 0
         self.groups: List[MiddlewareGroup] = []
-        self.default_group = MiddlewareGroup("default")
+        self.default_group = self._new_group("default")
         self.groups.append(self.default_group)
-        self.disabled_middlewares: set = set()
+        self._disabled_middlewares: set = set()
+        # get_all_middlewares() 결과 캐시 (version이 바뀌면 다시 계산)
+        self._cached_version = -1
+        self._cached_active: Tuple[Middleware, ...] = ()
+        self._cached_reversed: Tuple[Middleware, ...] = ()
+        # 위 튜플의 process_request / process_response 바운드 메서드
+        self._cached_request_fns: Tuple[Callable, ...] = ()
+        self._cached_response_fns: Tuple[Callable, ...] = ()
+        # freeze() 이후에는 구성 변경 불가
+        self._frozen = False
+
+    def _new_group(self, name: str) -> MiddlewareGroup:
+        """이 체인에 소속된 그룹 생성"""
+        group = MiddlewareGroup(name)
+        group._chain = self
+        return group
+
+    @property
+    def disabled_middlewares(self) -> set:
+        """개별적으로 비활성화된 미들웨어 타입 집합"""
+        return self._disabled_middlewares
+
+    @disabled_middlewares.setter
+    def disabled_middlewares(self, disabled: set) -> None:
+        # 직접 대입해도 다음 요청부터 반영되도록 version 증가
+        self._check_mutable()
+        self._disabled_middlewares = disabled
+        self.version += 1
+
+    @property
+    def frozen(self) -> bool:
+        """freeze() 호출 여부"""
+        return self._frozen
+
+    def freeze(self) -> "MiddlewareChain":
+        """
+        현재 구성을 고정
+
+        활성 미들웨어 튜플을 확정하고, 이후 그룹/미들웨어 추가나
+        활성화/비활성화를 RuntimeError로 거부합니다.
+        구성이 더 이상 바뀌지 않는 배포 환경에서 명시적으로 호출합니다.
+
+        Returns:
+            self (메서드 체이닝용)
+        """
+        self._refresh_cache()
+        self.groups = tuple(self.groups)  # type: ignore[assignment]
+        for group in self.groups:
+            group._middlewares = tuple(group._middlewares)  # type: ignore[assignment]
+        self._frozen = True
+        return self
+
+    def _check_mutable(self) -> None:
+        """고정된 체인이면 RuntimeError"""
+        if self._frozen:
+            raise RuntimeError("MiddlewareChain is frozen")
 
     def get_default_group(self) -> MiddlewareGroup:
         """기본 그룹 반환"""
@@ -112,8 +225,10 @@ class MiddlewareChain:
         Returns:
             생성된 그룹
         """
-        group = MiddlewareGroup(name)
+        self._check_mutable()
+        group = self._new_group(name)
         self.groups.append(group)
+        self.version += 1
         return group
 
     def add_group_before(
@@ -129,12 +244,14 @@ class MiddlewareChain:
         Returns:
             생성된 그룹
         """
+        self._check_mutable()
         target = target_group or self.default_group
         index = self.groups.index(target)
 
-        new_group = MiddlewareGroup(f"before_{target.name}")
+        new_group = self._new_group(f"before_{target.name}")
         new_group.add(*middlewares)
         self.groups.insert(index, new_group)
+        self.version += 1
 
         return new_group
 
@@ -151,12 +268,14 @@ class MiddlewareChain:
         Returns:
             생성된 그룹
         """
+        self._check_mutable()
         target = target_group or self.default_group
         index = self.groups.index(target) + 1
 
-        new_group = MiddlewareGroup(f"after_{target.name}")
+        new_group = self._new_group(f"after_{target.name}")
         new_group.add(*middlewares)
         self.groups.insert(index, new_group)
+        self.version += 1
 
         return new_group
 
@@ -170,8 +289,10 @@ class MiddlewareChain:
         Returns:
             self (메서드 체이닝용)
         """
+        self._check_mutable()
         for middleware in middlewares:
-            self.disabled_middlewares.add(type(middleware))
+            self._disabled_middlewares.add(type(middleware))
+        self.version += 1
         return self
 
     def enable(self, *middlewares: Middleware) -> "MiddlewareChain":
@@ -184,29 +305,48 @@ class MiddlewareChain:
         Returns:
             self (메서드 체이닝용)
         """
+        self._check_mutable()
         for middleware in middlewares:
-            self.disabled_middlewares.discard(type(middleware))
+            self._disabled_middlewares.discard(type(middleware))
+        self.version += 1
         return self
 
-    def get_all_middlewares(self) -> List[Middleware]:
+    def get_all_middlewares(self) -> Tuple[Middleware, ...]:
         """
         모든 활성화된 미들웨어를 순서대로 반환
 
+        결과는 구성이 바뀔 때(version 증가)까지 캐시됩니다.
+
         Returns:
-            미들웨어 리스트
+            미들웨어 튜플
         """
+        if self._cached_version != self.version:
+            self._refresh_cache()
+        return self._cached_active
+
+    def _refresh_cache(self) -> None:
+        """활성 미들웨어 튜플과 역순 튜플 재계산"""
         all_middlewares = []
 
+        disabled = self._disabled_middlewares
         for group in self.groups:
-            if not group.enabled:
+            if not group._enabled:
                 continue
 
-            for middleware in group.middlewares:
+            for middleware in group._middlewares:
                 # 개별적으로 비활성화된 미들웨어는 제외
-                if type(middleware) not in self.disabled_middlewares:
+                if type(middleware) not in disabled:
                     all_middlewares.append(middleware)
 
-        return all_middlewares
+        self._cached_active = tuple(all_middlewares)
+        self._cached_reversed = self._cached_active[::-1]
+        self._cached_request_fns = tuple(
+            m.process_request for m in self._cached_active
+        )
+        self._cached_response_fns = tuple(
+            m.process_response for m in self._cached_reversed
+        )
+        self._cached_version = self.version
 
     def execute_request(self, request: HttpRequest) -> Optional[Any]:
         """
@@ -219,8 +359,10 @@ class MiddlewareChain:
             None: 정상 진행
             Any: early return 값
         """
-        for middleware in self.get_all_middlewares():
-            result = middleware.process_request(request)
+        if self._cached_version != self.version:
+            self._refresh_cache()
+        for process_request in self._cached_request_fns:
+            result = process_request(request)
             if result is not None:
                 # Early return
                 return result
@@ -239,12 +381,100 @@ class MiddlewareChain:
         Returns:
             처리된 응답
         """
+        if self._cached_version != self.version:
+            self._refresh_cache()
         # 역순으로 실행
-        for middleware in reversed(self.get_all_middlewares()):
-            response = middleware.process_response(request, response)
+        for process_response in self._cached_response_fns:
+            response = process_response(request, response)
 
         return response
 
+    def build_composed(
+        self, handler: Callable[[HttpRequest], Awaitable[Any]]
+    ) -> Callable[[HttpRequest], Awaitable[Any]]:
+        """
+        현재 활성 미들웨어와 핸들러를 하나의 async 호출로 합성
+
+        활성 미들웨어 목록과 process_request/process_response 바운드 메서드를
+        한 번만 구해 두므로, 요청마다 그룹 순회와 속성 조회를 반복하지 않습니다.
+        구성이 바뀌면 version이 올라가므로 호출 측에서 다시 합성해야 합니다.
+
+        모든 미들웨어가 동기 함수이면 await 없이 바로 호출하고,
+        async 훅이 하나라도 있으면 해당 훅만 await 하는 dispatch를 만듭니다.
+        활성 미들웨어가 없으면 handler를 그대로 반환합니다.
+
+        Args:
+            handler: 미들웨어를 통과한 요청을 처리할 async 함수
+
+        Returns:
+            dispatch(request) -> 응답 (execute_request/execute_response와 동일한 순서)
+            응답 미들웨어 결과가 HttpResponse가 아니면 원래 응답을 반환하며,
+            원래 응답(early return 값)도 HttpResponse가 아니면 RuntimeError를 냅니다.
+        """
+        middlewares = self.get_all_middlewares()
+        if not middlewares:
+            # 활성 미들웨어가 없으면 핸들러를 그대로 사용
+            return handler
+        request_hooks = self._cached_request_fns
+        response_hooks = self._cached_response_fns
+
+        if any(map(is_async_callable, request_hooks + response_hooks)):
+            return self._build_mixed_dispatch(handler, request_hooks, response_hooks)
+
+        async def dispatch(request: HttpRequest) -> Any:
+            response = None
+            for process_request in request_hooks:
+                response = process_request(request)
+                if response is not None:
+                    break
+            # 참으로 평가되는 값만 early return ({}, "", 0 등은 핸들러로 진행)
+            if not response:
+                response = await handler(request)
+
+            processed = response
+            for process_response in response_hooks:
+                processed = process_response(request, processed)
+            # 응답 미들웨어가 HttpResponse를 반환하지 않으면 원래 응답 유지
+            if isinstance(processed, HttpResponse):
+                return processed
+            return _ensure_response(response)
+
+        return dispatch
+
+    @staticmethod
+    def _build_mixed_dispatch(
+        handler: Callable[[HttpRequest], Awaitable[Any]],
+        request_hooks: Tuple[Callable, ...],
+        response_hooks: Tuple[Callable, ...],
+    ) -> Callable[[HttpRequest], Awaitable[Any]]:
+        """async 미들웨어 훅이 섞여 있을 때의 dispatch 생성"""
+        request_plan = tuple((h, is_async_callable(h)) for h in request_hooks)
+        response_plan = tuple((h, is_async_callable(h)) for h in response_hooks)
+
+        async def dispatch(request: HttpRequest) -> Any:
+            response = None
+            for process_request, is_async in request_plan:
+                response = process_request(request)
+                if is_async:
+                    response = await response
+                if response is not None:
+                    break
+            # 참으로 평가되는 값만 early return ({}, "", 0 등은 핸들러로 진행)
+            if not response:
+                response = await handler(request)
+
+            processed = response
+            for process_response, is_async in response_plan:
+                processed = process_response(request, processed)
+                if is_async:
+                    processed = await processed
+            # 응답 미들웨어가 HttpResponse를 반환하지 않으면 원래 응답 유지
+            if isinstance(processed, HttpResponse):
+                return processed
+            return _ensure_response(response)
+
+        return dispatch
+
     def __repr__(self) -> str:
         active_count = len(self.get_all_middlewares())
         return f"MiddlewareChain(groups={len(self.groups)}, active_middlewares={active_count})"
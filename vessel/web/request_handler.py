@@ -4,10 +4,9 @@ RequestHandler - HTTP 요청 처리 로직 분리
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Optional, Callable, Dict
+from typing import TYPE_CHECKING, Optional, Callable, Dict, Tuple
 from vessel.web.http.request import HttpRequest, HttpResponse
 from vessel.web.router.parameter_injection import ValidationError
-from vessel.utils.async_support import run_sync_or_async
 
 if TYPE_CHECKING:
     from vessel.web.middleware.chain import MiddlewareChain
@@ -40,70 +39,99 @@ class RequestHandler:
             middleware_chain = MiddlewareChain()
         self.middleware_chain = middleware_chain
         self.debug = debug
-        self.error_handlers: Dict[type, Callable] = {}
+        # ValidationError도 같은 테이블로 처리 (사용자가 다시 등록하면 덮어씀)
+        self.error_handlers: Dict[type, Callable] = {
+            ValidationError: self._handle_validation_error
+        }
+        # 실제 예외 클래스 -> (등록된 예외 타입, 핸들러) 또는 None
+        self._error_handler_cache: Dict[type, Optional[Tuple[type, Callable]]] = {}
+        # 미들웨어 체인 + 라우트 핸들러 합성 결과 (체인 version 기준으로 재사용)
+        self._dispatch: Optional[Callable] = None
+        self._dispatch_version = -1
 
     def add_error_handler(
         self, exception_type: type, handler: Callable[[Exception], HttpResponse]
     ):
         """에러 핸들러 등록"""
         self.error_handlers[exception_type] = handler
-        logger.debug(f"Error handler registered for {exception_type.__name__}")
+        self._error_handler_cache.clear()
+        logger.debug("Error handler registered for %s", exception_type.__name__)
+
+    def _get_dispatch(self) -> Callable:
+        """
+        미들웨어 체인과 라우트 핸들러를 합성한 dispatch 반환
+
+        체인 구성이 바뀐 경우(version 변경)에만 다시 합성합니다.
+        """
+        chain = self.middleware_chain
+        if self._dispatch is None or self._dispatch_version != chain.version:
+            self._dispatch = chain.build_composed(
+                self.route_handler._handle_request_async
+            )
+            self._dispatch_version = chain.version
+        return self._dispatch
 
     async def handle_request(self, request: HttpRequest) -> HttpResponse:
         """
         내부 async 핸들러 (실제 요청 처리)
         """
         try:
-
-            if early_response := await run_sync_or_async(
-                self.middleware_chain.execute_request
-            )(request):
-                # 미들웨어에서 early return한 경우
-                response = early_response
-            else:
-                # 라우트 핸들러 실행
-                response = await run_sync_or_async(self.route_handler.handle_request)(
-                    request
-                )
-
-            # 응답 미들웨어 실행
-            processed_response = await run_sync_or_async(
-                self.middleware_chain.execute_response
-            )(request, response)
-            if isinstance(processed_response, HttpResponse):
-                response = processed_response
-
-            if not isinstance(response, HttpResponse):
-                raise RuntimeError(
-                    f"Handler must return HttpResponse, got {type(response)}"
-                )
-
-            return response
-
+            # 라우트 핸들러는 항상 HttpResponse를 반환하고,
+            # 미들웨어 early return 값은 합성된 dispatch에서 검사함
+            return await self._get_dispatch()(request)
         except Exception as e:
             return self._handle_error(e, request)
 
+    def _find_error_handler(
+        self, error_class: type
+    ) -> Optional[Tuple[type, Callable]]:
+        """
+        예외 클래스에 맞는 에러 핸들러 찾기
+
+        MRO를 따라 가장 가까운 상위 클래스에 등록된 핸들러를 선택하고,
+        결과(없음 포함)를 예외 클래스별로 캐시합니다.
+        """
+        try:
+            return self._error_handler_cache[error_class]
+        except KeyError:
+            pass
+
+        registered = None
+        for klass in error_class.__mro__:
+            handler = self.error_handlers.get(klass)
+            if handler is not None:
+                registered = (klass, handler)
+                break
+        self._error_handler_cache[error_class] = registered
+        return registered
+
+    @staticmethod
+    def _handle_validation_error(error: ValidationError) -> HttpResponse:
+        """기본 ValidationError 핸들러 (400 응답)"""
+        logger.info("Validation failed: %s", error.errors)
+        return HttpResponse(
+            status_code=400,
+            body=error.to_dict(),
+        )
+
     def _handle_error(self, error: Exception, request: HttpRequest) -> HttpResponse:
         """에러 처리"""
-        # ValidationError 먼저 처리
-        if isinstance(error, ValidationError):
-            logger.info(f"Validation failed: {error.errors}")
-            return HttpResponse(
-                status_code=400,
-                body=error.to_dict(),
-            )
-
-        # 등록된 에러 핸들러 확인
-        for error_type, handler in self.error_handlers.items():
-            if isinstance(error, error_type):
+        # 등록된 에러 핸들러 확인 (기본 ValidationError 핸들러 포함)
+        registered = self._find_error_handler(type(error))
+        if registered is not None:
+            error_type, handler = registered
+            if error_type is not ValidationError:
                 logger.info(
-                    f"Handling error with registered handler: {error_type.__name__}"
+                    "Handling error with registered handler: %s", error_type.__name__
                 )
-                return handler(error)
+            return handler(error)
 
         # 기본 에러 처리
         logger.error(
-            f"Unhandled error: {type(error).__name__}: {error}", exc_info=self.debug
+            "Unhandled error: %s: %s",
+            type(error).__name__,
+            error,
+            exc_info=self.debug,
         )
 
         status_code = 500
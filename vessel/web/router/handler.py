@@ -2,9 +2,22 @@
 RouteHandler - HTTP 요청을 처리하고 핸들러 메서드를 실행
 """
 
-from typing import Any, Dict, List, Callable, Optional, Type, get_origin, get_args
+from typing import (
+    Any,
+    Dict,
+    List,
+    Callable,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_origin,
+    get_args,
+)
 import inspect
-from typing import get_type_hints
+import sys
+import types
+from collections import OrderedDict
 
 from vessel.web.http.request import HttpRequest, HttpResponse
 from vessel.di.core.container_manager import ContainerManager
@@ -20,12 +33,39 @@ from vessel.web.router.parameter_injection import (
     ValidationError,
     AuthenticationInjector,
 )
+from vessel.web.router.parameter_injection.registry import ParamSpec
+from vessel.web.router.parameter_injection.type_decoder import resolve_type_hints
 from vessel.web.auth import AuthenticationException
 
 
+# Optional[X] / X | None 의 origin
+_UNION_ORIGINS = (Union, types.UnionType)
+
+
+def _is_param_segment(segment: str) -> bool:
+    """{name} 형태의 path parameter 세그먼트인지 확인"""
+    return segment.startswith("{") and segment.endswith("}")
+
+
 class Route:
     """라우트 정보를 저장하는 클래스"""
 
+    __slots__ = (
+        "path",
+        "method",
+        "handler",
+        "controller_instance",
+        "controller_class",
+        "type_hints",
+        "param_plan",
+        "async_handler",
+        "compiled_injector",
+        "params_cache",
+        "needs_request_data",
+        "segments",
+        "param_names",
+    )
+
     def __init__(
         self,
         path: str,
@@ -33,12 +73,110 @@ class Route:
         handler: Callable,
         controller_instance: Any,
         controller_class: Type,
+        type_hints: Optional[Dict[str, Any]] = None,
+        param_plan: Optional[Tuple[ParamSpec, ...]] = None,
     ):
         self.path = path
         self.method = method
         self.handler = handler
         self.controller_instance = controller_instance
         self.controller_class = controller_class
+        # 핸들러 타입 힌트와 파라미터 주입 계획 (라우트 등록 시 한 번 계산)
+        self.type_hints = type_hints if type_hints is not None else {}
+        self.param_plan = param_plan
+        # async로 감싼 핸들러 (sync 핸들러는 sync_to_async 래퍼를 한 번만 생성)
+        self.async_handler = run_sync_or_async(handler)
+        # param_plan을 펼친 전용 주입 함수 (registry.compile_plan)
+        self.compiled_injector: Optional[Callable[..., Dict[str, Any]]] = None
+        # @CacheableParams 라우트의 파라미터 파싱 결과 캐시
+        self.params_cache: Optional[_ParamsCache] = None
+        # 주입 계획에 request_data를 읽는 injector가 있는지 (_prepare_route에서 계산)
+        self.needs_request_data = True
+        # "/" 단위로 한 번만 분리한 경로 세그먼트 (트라이 등록/매칭에 사용)
+        # 라우트 간에 반복되는 세그먼트("api", "users" 등)는 intern하여 공유
+        self.segments: Tuple[str, ...] = tuple(
+            sys.intern(segment) for segment in path.split("/")
+        )
+        # 경로에 등장하는 순서대로의 path parameter 이름
+        self.param_names: Tuple[str, ...] = tuple(
+            segment[1:-1] for segment in self.segments if _is_param_segment(segment)
+        )
+
+
+# 요청 간에 공유해도 안전한 (불변) 파라미터 타입
+_IMMUTABLE_PARAM_TYPES = (int, float, str, bool, type(None))
+
+
+def _is_immutable_param_type(param_type: Any) -> bool:
+    """int/float/str/bool 또는 이들의 Optional/Union인지 확인"""
+    if param_type in _IMMUTABLE_PARAM_TYPES:
+        return True
+    args = get_args(param_type)
+    return (
+        get_origin(param_type) in _UNION_ORIGINS
+        and bool(args)
+        and all(arg in _IMMUTABLE_PARAM_TYPES for arg in args)
+    )
+
+
+class _ParamsCache:
+    """
+    라우트별 파라미터 파싱 결과 LRU 캐시
+
+    키는 (query 항목, path parameter 값)이며 최대 maxsize개까지 보관합니다.
+    """
+
+    __slots__ = ("_entries", "maxsize")
+
+    def __init__(self, maxsize: int = 1024):
+        self._entries: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+        self.maxsize = maxsize
+
+    @staticmethod
+    def make_key(request: HttpRequest) -> Optional[Tuple[Any, ...]]:
+        """요청에서 캐시 키 생성 (body가 있거나 hashable하지 않으면 None)"""
+        if request.body:
+            return None
+        key = (
+            tuple(sorted(request.query_params.items())),
+            tuple(request.path_params.items()),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (적중 시 최근 사용으로 갱신)"""
+        kwargs = self._entries.get(key)
+        if kwargs is not None:
+            self._entries.move_to_end(key)
+        return kwargs
+
+    def put(self, key: Any, kwargs: Dict[str, Any]) -> None:
+        """캐시 저장 (maxsize 초과 시 가장 오래된 항목 제거)"""
+        self._entries[key] = kwargs
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class _RouteNode:
+    """
+    라우트 트라이 노드
+
+    경로를 "/" 단위 세그먼트로 나눈 트리의 한 노드입니다.
+    - children: 고정 세그먼트 -> 자식 노드
+    - param_child: {param} 세그먼트 자식 노드 (이름은 Route가 보관)
+    - route: 이 노드에서 끝나는 Route (트라이는 HTTP 메서드별로 분리)
+    """
+
+    __slots__ = ("children", "param_child", "route")
+
+    def __init__(self):
+        self.children: Dict[str, "_RouteNode"] = {}
+        self.param_child: Optional["_RouteNode"] = None
+        self.route: Optional[Route] = None
 
 
 class RouteHandler:
@@ -49,6 +187,15 @@ class RouteHandler:
     def __init__(self, container_manager: ContainerManager):
         self.container_manager = container_manager
         self.routes: List[Route] = []
+        # HTTP 메서드별 정적 라우트 path -> Route: dict 조회 한 번으로 매칭
+        self._static_routes: Dict[str, Dict[str, Route]] = {}
+        # HTTP 메서드별 path parameter 라우트 세그먼트 트라이
+        self._route_tries: Dict[str, _RouteNode] = {}
+        # HTTP 메서드별 트라이를 펼친 매칭 함수 (_compile_trie, 처음 조회 시 생성)
+        self._trie_matchers: Dict[str, Callable[[str], Any]] = {}
+        # (method, path) -> (Route, path parameter 값) 트라이 매칭 결과 LRU 캐시
+        self._match_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._match_cache_size = 1024
         self._setup_injector_registry()
         self._register_routes()
 
@@ -61,16 +208,23 @@ class RouteHandler:
             PydanticInjector,
         )
 
+        # RequestBody[...]와 직접 주입이 같은 타입별 디코더/검증 함수 캐시를 공유
+        dataclass_injector = DataclassInjector()
+        pydantic_injector = PydanticInjector()
+
         self.injector_registry = ParameterInjectorRegistry()
         self.injector_registry.register(HttpRequestInjector())  # Priority: 0
         self.injector_registry.register(HttpHeaderInjector())  # Priority: 100
         self.injector_registry.register(HttpCookieInjector())  # Priority: 110
-        self.injector_registry.register(RequestBodyInjector())  # Priority: 150
+        self.injector_registry.register(
+            RequestBodyInjector(dataclass_injector, pydantic_injector)
+        )  # Priority: 150
         self.injector_registry.register(AuthenticationInjector())  # Priority: 180
         self.injector_registry.register(FileInjector())  # Priority: 200
-        self.injector_registry.register(DataclassInjector())  # Priority: 300 (new)
-        self.injector_registry.register(PydanticInjector())  # Priority: 310 (new)
+        self.injector_registry.register(dataclass_injector)  # Priority: 300 (new)
+        self.injector_registry.register(pydantic_injector)  # Priority: 310 (new)
         self.injector_registry.register(DefaultValueInjector())  # Priority: 999
+        self.injector_registry.freeze()
 
     def _register_routes(self):
         """컨트롤러들에서 라우트 정보 수집"""
@@ -84,42 +238,138 @@ class RouteHandler:
             elif hasattr(controller_class, "__pydi_request_mapping__"):
                 base_path = controller_class.__pydi_request_mapping__
 
-            # 컨트롤러의 메서드들 검사
-            for attr_name in dir(controller_instance):
-                attr = getattr(controller_instance, attr_name)
+            # 컨트롤러의 핸들러 메서드들 검사
+            for attr in self._iter_handler_methods(controller_instance):
+                method = getattr(attr, "__pydi_http_method__", "GET")
+                path = getattr(attr, "__pydi_path__", "")
 
-                # 핸들러 메서드인지 확인
-                if callable(attr) and hasattr(attr, "__pydi_handler__"):
-                    method = getattr(attr, "__pydi_http_method__", "GET")
-                    path = getattr(attr, "__pydi_path__", "")
-
-                    # 전체 경로 구성
-                    full_path = self._combine_paths(base_path, path)
-
-                    # 핸들러 컨테이너가 있으면 인터셉터 적용
-                    handler_to_use = attr
-                    if hasattr(attr, "__pydi_container__"):
-                        from vessel.decorators.web.mapping import (
-                            HttpMethodMappingHandler,
-                        )
-
-                        container = attr.__pydi_container__
-                        if (
-                            isinstance(container, HttpMethodMappingHandler)
-                            and container.interceptors
-                        ):
-                            # 인터셉터로 감싼 핸들러 사용
-                            handler_to_use = container.wrap_handler(attr)
-
-                    # 라우트 등록
-                    route = Route(
-                        path=full_path,
-                        method=method,
-                        handler=handler_to_use,
-                        controller_instance=controller_instance,
-                        controller_class=controller_class,
+                # 전체 경로 구성
+                full_path = self._combine_paths(base_path, path)
+
+                # 핸들러 컨테이너가 있으면 인터셉터 적용
+                handler_to_use = attr
+                if hasattr(attr, "__pydi_container__"):
+                    from vessel.decorators.web.mapping import (
+                        HttpMethodMappingHandler,
                     )
-                    self.routes.append(route)
+
+                    container = attr.__pydi_container__
+                    if (
+                        isinstance(container, HttpMethodMappingHandler)
+                        and container.interceptors
+                    ):
+                        # 인터셉터로 감싼 핸들러 사용
+                        handler_to_use = container.wrap_handler(attr)
+
+                # 라우트 등록
+                route = Route(
+                    path=full_path,
+                    method=method,
+                    handler=handler_to_use,
+                    controller_instance=controller_instance,
+                    controller_class=controller_class,
+                )
+                self._prepare_route(route)
+                self._add_route(route)
+
+    def _iter_handler_methods(self, controller_instance: Any):
+        """
+        컨트롤러의 핸들러 메서드(바운드)들을 반환
+
+        dir()로 인스턴스의 모든 속성(상속된 dunder 포함)을 정렬/조회하는 대신
+        MRO의 클래스 __dict__만 순회합니다. 하위 클래스에서 재정의한 메서드가
+        상위 클래스 메서드보다 우선합니다.
+        """
+        seen = set()
+        for klass in type(controller_instance).__mro__:
+            for attr_name, attr in vars(klass).items():
+                if attr_name in seen:
+                    continue
+                seen.add(attr_name)
+                if callable(attr) and hasattr(attr, "__pydi_handler__"):
+                    yield getattr(controller_instance, attr_name)
+
+    def _prepare_route(self, route: Route) -> None:
+        """
+        핸들러의 타입 힌트와 파라미터 주입 계획을 미리 계산하여 Route에 저장
+
+        get_type_hints / inspect.signature / can_inject 판정은 핸들러 정의 시점에
+        고정되므로 요청마다 반복하지 않습니다.
+        """
+        # 타입 힌트 가져오기 (Annotated 타입 포함, 전방 참조가 있을 때만 평가)
+        try:
+            route.type_hints = resolve_type_hints(route.handler)
+        except (NameError, TypeError, SyntaxError):
+            # 평가할 수 없는 전방 참조 등: 타입 힌트 없이 처리
+            route.type_hints = {}
+
+        try:
+            route.param_plan = self.injector_registry.build_plan(
+                route.handler, route.type_hints
+            )
+        except (TypeError, ValueError):
+            # 시그니처를 해석할 수 없는 핸들러는 요청 시점에 판정
+            route.param_plan = None
+
+        if route.param_plan is not None:
+            # HttpRequest/헤더/쿠키/인증만 주입하는 핸들러는 요청 데이터 병합 생략
+            route.needs_request_data = any(
+                spec.injector is not None and spec.injector.reads_request_data
+                for spec in route.param_plan
+            )
+            try:
+                route.compiled_injector = self.injector_registry.compile_plan(
+                    route.param_plan, route.type_hints, route.handler
+                )
+            except (SyntaxError, TypeError, ValueError):
+                # 코드 생성 실패 시 inject_planned 경로 사용
+                route.compiled_injector = None
+
+        # @CacheableParams: query / path 값만으로 결정되는 GET 핸들러만 캐시
+        # 캐시된 값은 요청 간에 공유되므로 list 등 가변 타입 파라미터가 있으면 제외
+        if (
+            getattr(route.handler, "__pydi_cacheable_params__", False)
+            and route.method == "GET"
+            and route.param_plan is not None
+            and all(
+                isinstance(spec.injector, DefaultValueInjector)
+                and _is_immutable_param_type(spec.param_type)
+                for spec in route.param_plan
+            )
+        ):
+            route.params_cache = _ParamsCache()
+
+    def _add_route(self, route: Route) -> None:
+        """
+        라우트를 목록, 정적 라우트 dict, 트라이에 등록
+
+        같은 메서드/경로가 중복 등록되면 먼저 등록된 라우트가 우선합니다.
+        """
+        self.routes.append(route)
+
+        if not route.param_names:
+            static_routes = self._static_routes.setdefault(route.method, {})
+            static_routes.setdefault(route.path, route)
+            return
+
+        # 트라이가 바뀌므로 생성된 매칭 함수와 캐시된 매칭 결과는 다시 만들어야 함
+        self._trie_matchers.pop(route.method, None)
+        self._match_cache.clear()
+        node = self._route_tries.get(route.method)
+        if node is None:
+            node = self._route_tries[route.method] = _RouteNode()
+        for segment in route.segments:
+            if _is_param_segment(segment):
+                if node.param_child is None:
+                    node.param_child = _RouteNode()
+                node = node.param_child
+            else:
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _RouteNode()
+                node = child
+        if node.route is None:
+            node.route = route
 
     def _combine_paths(self, base: str, path: str) -> str:
         """베이스 경로와 경로를 결합"""
@@ -136,47 +386,168 @@ class RouteHandler:
 
     def find_route(self, method: str, path: str) -> Optional[Route]:
         """메서드와 경로에 맞는 라우트 찾기 (path parameter 지원)"""
-        for route in self.routes:
-            if route.method == method:
-                # 정확한 매칭 먼저 시도
-                if route.path == path:
-                    return route
-
-                # path parameter 패턴 매칭
-                if self._match_path_pattern(route.path, path):
-                    return route
-        return None
+        match = self._match_route(method, path)
+        return match[0] if match is not None else None
+
+    def _match_route(
+        self, method: str, path: str
+    ) -> Optional[Tuple[Route, Dict[str, str]]]:
+        """
+        메서드와 경로에 맞는 라우트와 path parameter 찾기
+
+        정적 라우트는 dict 조회 한 번으로 찾고, 그 외에는 경로 깊이만큼만
+        트라이를 탐색하므로 등록된 라우트 수와 무관하게 동작합니다.
+        정적 dict와 트라이 모두 HTTP 메서드별로 분리되어 있어 다른 메서드의
+        라우트는 비교하지 않습니다.
+        path parameter 값은 탐색 중에 함께 수집하므로 경로를 한 번만 훑습니다.
+        트라이 매칭 결과는 (method, path) 단위 LRU에 보관하여 같은 경로가
+        반복되면 트라이를 다시 탐색하지 않습니다.
+
+        Returns:
+            (Route, path_params) 또는 매칭 실패 시 None
+        """
+        static_routes = self._static_routes.get(method)
+        if static_routes is not None:
+            route = static_routes.get(path)
+            if route is not None:
+                return route, {}
+
+        match_cache = self._match_cache
+        cache_key = (method, path)
+        cached = match_cache.get(cache_key)
+        if cached is not None:
+            match_cache.move_to_end(cache_key)
+            route, values = cached
+            return route, dict(zip(route.param_names, values))
+
+        matcher = self._trie_matchers.get(method)
+        if matcher is None:
+            root = self._route_tries.get(method)
+            if root is None:
+                return None
+            matcher = self._trie_matchers[method] = self._compile_trie(root)
+
+        matched = matcher(path)
+        if matched is None:
+            # 매칭 실패는 캐시하지 않음 (임의 경로로 캐시가 밀려나지 않도록)
+            return None
+
+        match_cache[cache_key] = matched
+        if len(match_cache) > self._match_cache_size:
+            match_cache.popitem(last=False)
+        route, values = matched
+        return route, dict(zip(route.param_names, values))
+
+    def _compile_trie(
+        self, root: _RouteNode
+    ) -> Callable[[str], Optional[Tuple[Route, Tuple[str, ...]]]]:
+        """
+        트라이를 세그먼트 비교 if/elif 코드로 펼친 매칭 함수 생성
 
-    def _match_path_pattern(self, pattern: str, path: str) -> bool:
-        """path parameter 패턴 매칭 (예: /users/{id} 와 /users/123 매칭)"""
-        pattern_parts = pattern.split("/")
-        path_parts = path.split("/")
+        _walk_trie와 같은 순서(고정 세그먼트 우선, 실패 시 {param}으로
+        되돌아감)로 비교하지만, 노드 dict 조회와 재귀 호출 없이 생성된
+        바이트코드로 실행됩니다. path parameter 위치는 트라이 경로에서
+        정해지므로 값은 parts 인덱스로 바로 꺼냅니다.
 
-        if len(pattern_parts) != len(path_parts):
-            return False
+        생성에 실패하면(지나치게 깊은 트라이 등) _walk_trie를 사용합니다.
 
-        for pattern_part, path_part in zip(pattern_parts, path_parts):
-            # {} 로 감싸진 부분은 path parameter로 간주
-            if pattern_part.startswith("{") and pattern_part.endswith("}"):
-                continue
-            # 일반 부분은 정확히 일치해야 함
-            elif pattern_part != path_part:
-                return False
+        Returns:
+            path -> (Route, path parameter 값 튜플) 또는 None
+        """
+        namespace: Dict[str, Any] = {}
+        lines = [
+            "def _match(path):",
+            "    parts = path.split('/')",
+            "    n = len(parts)",
+        ]
 
-        return True
+        def emit(node: _RouteNode, depth: int, params: Tuple[int, ...], indent: str):
+            if node.route is not None:
+                name = f"route_{len(namespace)}"
+                namespace[name] = node.route
+                values = "".join(f"parts[{i}], " for i in params)
+                lines.append(f"{indent}if n == {depth}:")
+                lines.append(f"{indent}    return {name}, ({values})")
+            if not node.children and node.param_child is None:
+                return
+            lines.append(f"{indent}if n > {depth}:")
+            inner = indent + "    "
+            if node.children:
+                lines.append(f"{inner}s{depth} = parts[{depth}]")
+                keyword = "if"
+                for segment, child in node.children.items():
+                    lines.append(f"{inner}{keyword} s{depth} == {segment!r}:")
+                    emit(child, depth + 1, params, inner + "    ")
+                    keyword = "elif"
+            if node.param_child is not None:
+                emit(node.param_child, depth + 1, params + (depth,), inner)
+
+        emit(root, 0, (), "    ")
+        lines.append("    return None")
 
-    def _extract_path_params(self, pattern: str, path: str) -> Dict[str, str]:
-        """path에서 parameter 값 추출"""
-        pattern_parts = pattern.split("/")
-        path_parts = path.split("/")
-        params = {}
+        try:
+            source = "\n".join(lines)
+            exec(compile(source, "<vessel-router>", "exec"), namespace)
+        except (SyntaxError, RecursionError, MemoryError):
+            return self._trie_walker(root)
+        return namespace["_match"]
+
+    def _trie_walker(
+        self, root: _RouteNode
+    ) -> Callable[[str], Optional[Tuple[Route, Tuple[str, ...]]]]:
+        """_walk_trie를 _compile_trie 결과와 같은 형태로 감싼 매칭 함수"""
+
+        def match(path: str) -> Optional[Tuple[Route, Tuple[str, ...]]]:
+            values: List[str] = []
+            route = self._walk_trie(root, path, 0, values)
+            if route is None:
+                return None
+            return route, tuple(values)
+
+        return match
+
+    def _walk_trie(
+        self,
+        node: _RouteNode,
+        path: str,
+        start: int,
+        values: List[str],
+    ) -> Optional[Route]:
+        """
+        고정 세그먼트를 먼저 시도하고, 실패하면 {param} 자식으로 되돌아가 탐색
 
-        for pattern_part, path_part in zip(pattern_parts, path_parts):
-            if pattern_part.startswith("{") and pattern_part.endswith("}"):
-                param_name = pattern_part[1:-1]  # {} 제거
-                params[param_name] = path_part
+        path.split("/")로 리스트를 만들지 않고 str.find로 세그먼트를 하나씩
+        잘라내므로, 트라이에서 일치하지 않으면 나머지 경로는 분리하지 않습니다.
+        start가 -1이면 모든 세그먼트를 소비한 상태입니다.
 
-        return params
+        {param} 자식으로 내려갈 때마다 해당 세그먼트 값을 values에 쌓고,
+        되돌아올 때 제거합니다.
+        """
+        if start < 0:
+            return node.route
+
+        end = path.find("/", start)
+        if end < 0:
+            segment = path[start:]
+            next_start = -1
+        else:
+            segment = path[start:end]
+            next_start = end + 1
+
+        child = node.children.get(segment)
+        if child is not None:
+            route = self._walk_trie(child, path, next_start, values)
+            if route is not None:
+                return route
+
+        param_child = node.param_child
+        if param_child is not None:
+            values.append(segment)
+            route = self._walk_trie(param_child, path, next_start, values)
+            if route is not None:
+                return route
+            values.pop()
+        return None
 
     def handle_request(self, request: HttpRequest) -> HttpResponse:
         """
@@ -206,13 +577,13 @@ class RouteHandler:
         """
         내부 async 핸들러 (실제 요청 처리)
         """
-        route = self.find_route(request.method, request.path)
+        match = self._match_route(request.method, request.path)
 
-        if route is None:
+        if match is None:
             return HttpResponse(body={"error": "Route not found"}, status_code=404)
 
-        # path parameter 추출하여 request에 저장
-        path_params = self._extract_path_params(route.path, request.path)
+        # 매칭 중 추출한 path parameter를 request에 저장
+        route, path_params = match
         if path_params:
             request.path_params = path_params
 
@@ -243,22 +614,44 @@ class RouteHandler:
         """
         handler = route.handler
 
-        # 요청 데이터 수집 (query, path, body)
-        request_data = self._collect_request_data(request)
-
-        # 타입 힌트 가져오기 (Annotated 타입 포함)
-        try:
-            hints = get_type_hints(handler, include_extras=True)
-        except:
-            hints = {}
+        # 캐시된 파라미터 파싱 결과가 있으면 주입 과정 생략
+        params_cache = route.params_cache
+        cache_key = None
+        if params_cache is not None:
+            cache_key = params_cache.make_key(request)
+            if cache_key is not None:
+                cached_kwargs = params_cache.get(cache_key)
+                if cached_kwargs is not None:
+                    return await route.async_handler(**cached_kwargs)
+
+        # 요청 데이터 수집 (query, path, body) - 읽는 injector가 없으면 생략
+        if route.needs_request_data:
+            request_data = self._collect_request_data(request)
+        else:
+            request_data = {}
+
+        # 등록 시 계산한 타입 힌트와 주입 계획 사용
+        hints = route.type_hints
+        plan = route.param_plan
 
         # 레지스트리를 통한 모든 파라미터 주입 (DefaultValueInjector가 validation 처리)
-        kwargs = self.injector_registry.inject_parameters(
-            handler, request, request_data, hints
-        )
-
-        # 핸들러 실행 (sync/async 자동 처리)
-        return await run_sync_or_async(handler)(**kwargs)
+        compiled_injector = route.compiled_injector
+        if compiled_injector is not None:
+            kwargs = compiled_injector(request, request_data, hints)
+        elif plan is not None:
+            kwargs = self.injector_registry.inject_planned(
+                plan, request, request_data, hints
+            )
+        else:
+            kwargs = self.injector_registry.inject_parameters(
+                handler, request, request_data, hints
+            )
+
+        if cache_key is not None:
+            params_cache.put(cache_key, kwargs)
+
+        # 핸들러 실행 (등록 시 async로 감싼 핸들러 사용)
+        return await route.async_handler(**kwargs)
 
     def _collect_request_data(self, request: HttpRequest) -> Dict[str, Any]:
         """요청 데이터 수집 (query, path, body)"""
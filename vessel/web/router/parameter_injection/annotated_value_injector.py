@@ -3,13 +3,18 @@ Abstract base class for injectors that handle Annotated type hints with value ob
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Tuple, get_origin, get_args, Union, Annotated
+from typing import Any, Optional, Tuple
 
 from vessel.web.router.parameter_injection.base import (
     ParameterInjector,
     InjectionContext,
 )
 from vessel.web.router.parameter_injection.default_value_injector import ValidationError
+from vessel.web.router.parameter_injection.type_decoder import (
+    LIST,
+    OPTIONAL,
+    decode_annotation,
+)
 
 
 class AnnotatedValueInjector(ParameterInjector, ABC):
@@ -137,48 +142,10 @@ class AnnotatedValueInjector(ParameterInjector, ABC):
         - list[MarkerType] (if supports_list() returns True)
         - list[Annotated[MarkerType, "name"]] (if supports_list() returns True)
         """
-        param_type = context.param_type
-        marker_type = self.get_marker_type()
-        origin = get_origin(param_type)
-
-        # Annotated[MarkerType, "name"] 체크
-        if origin is Annotated:
-            args = get_args(param_type)
-            if args and args[0] == marker_type:
-                return True
-
-        # MarkerType 직접 체크
-        if param_type == marker_type:
-            return True
-
-        # Optional[MarkerType] 또는 Optional[Annotated[MarkerType, "name"]] 체크
-        if origin is Union:
-            args = get_args(param_type)
-            # Union 안에 MarkerType이 있거나, Annotated[MarkerType, ...]가 있는지 확인
-            for arg in args:
-                if arg == marker_type:
-                    return True
-                arg_origin = get_origin(arg)
-                if arg_origin is Annotated:
-                    arg_args = get_args(arg)
-                    if arg_args and arg_args[0] == marker_type:
-                        return True
-
-        # list[MarkerType] 또는 list[Annotated[MarkerType, "name"]] 체크
-        if self.supports_list() and origin is list:
-            args = get_args(param_type)
-            if args:
-                list_item_type = args[0]
-                if list_item_type == marker_type:
-                    return True
-                # list[Annotated[MarkerType, "name"]] 체크
-                list_item_origin = get_origin(list_item_type)
-                if list_item_origin is Annotated:
-                    list_item_args = get_args(list_item_type)
-                    if list_item_args and list_item_args[0] == marker_type:
-                        return True
-
-        return False
+        info = decode_annotation(context.param_type)
+        if info.base_type is not self.get_marker_type():
+            return False
+        return not (info.flags & LIST) or self.supports_list()
 
     def inject(self, context: InjectionContext) -> Tuple[Optional[Any], bool]:
         """
@@ -191,26 +158,17 @@ class AnnotatedValueInjector(ParameterInjector, ABC):
         4. Return None for Optional if missing, or raise ValidationError
         5. Create and return value object (or list of value objects)
         """
-        param_type = context.param_type
         param_name = context.param_name
+        info = decode_annotation(context.param_type)
 
-        # 명시적 이름 추출 (Annotated에서만)
-        explicit_name = self._extract_explicit_name(param_type)
-
-        # Optional 여부 확인
-        is_optional = self._is_optional(param_type)
-
-        # list 여부 확인
-        is_list = self._is_list(param_type)
-
-        # 이름 결정
-        name = explicit_name if explicit_name else self.get_default_name(param_name)
+        # 이름 결정 (Annotated에서 명시한 이름 우선)
+        name = info.key if info.key else self.get_default_name(param_name)
 
         # 값 가져오기
         value = self.extract_value_from_request(context, name)
 
         if value is None:
-            if is_optional:
+            if info.flags & OPTIONAL:
                 return None, False
             else:
                 raise ValidationError(
@@ -223,7 +181,7 @@ class AnnotatedValueInjector(ParameterInjector, ABC):
                 )
 
         # list[MarkerType] 처리
-        if is_list:
+        if info.flags & LIST:
             if not isinstance(value, list):
                 value = [value]
             value_objects = self.create_value_list(name, value)
@@ -232,109 +190,3 @@ class AnnotatedValueInjector(ParameterInjector, ABC):
         # 단일 값 객체 생성
         value_object = self.create_value_object(name, value)
         return value_object, False
-
-    def _extract_explicit_name(self, param_type: Any) -> Optional[str]:
-        """
-        Extract explicitly specified name from Annotated type.
-
-        Handles:
-        - Annotated[MarkerType, "name"]
-        - Optional[Annotated[MarkerType, "name"]]
-        - list[Annotated[MarkerType, "name"]]
-        """
-        marker_type = self.get_marker_type()
-        origin = get_origin(param_type)
-
-        # Annotated[MarkerType, "name"]에서 추출
-        if origin is Annotated:
-            args = get_args(param_type)
-            if args and args[0] == marker_type and len(args) > 1:
-                return args[1]
-
-        # Optional[Annotated[MarkerType, "name"]]에서 추출
-        if origin is Union:
-            for arg in get_args(param_type):
-                arg_origin = get_origin(arg)
-                if arg_origin is Annotated:
-                    arg_args = get_args(arg)
-                    if arg_args and arg_args[0] == marker_type and len(arg_args) > 1:
-                        return arg_args[1]
-
-        # list[Annotated[MarkerType, "name"]]에서 추출
-        if origin is list:
-            args = get_args(param_type)
-            if args:
-                list_item_type = args[0]
-                list_item_origin = get_origin(list_item_type)
-                if list_item_origin is Annotated:
-                    list_item_args = get_args(list_item_type)
-                    if (
-                        list_item_args
-                        and list_item_args[0] == marker_type
-                        and len(list_item_args) > 1
-                    ):
-                        return list_item_args[1]
-
-        return None
-
-    def _is_optional(self, param_type: Any) -> bool:
-        """
-        Check if the parameter type is Optional.
-
-        Returns True for:
-        - Optional[MarkerType]
-        - Optional[Annotated[MarkerType, "name"]]
-        """
-        marker_type = self.get_marker_type()
-        origin = get_origin(param_type)
-
-        if origin is Union:
-            args = get_args(param_type)
-            # Union 안에 MarkerType나 Annotated[MarkerType, ...]와 None이 있는지 확인
-            has_none = type(None) in args
-            has_marker = False
-
-            for arg in args:
-                if arg == marker_type:
-                    has_marker = True
-                    break
-                arg_origin = get_origin(arg)
-                if arg_origin is Annotated:
-                    arg_args = get_args(arg)
-                    if arg_args and arg_args[0] == marker_type:
-                        has_marker = True
-                        break
-
-            return has_none and has_marker
-
-        return False
-
-    def _is_list(self, param_type: Any) -> bool:
-        """
-        Check if the parameter type is list[MarkerType].
-
-        Returns True for:
-        - list[MarkerType]
-        - list[Annotated[MarkerType, "name"]]
-        """
-        if not self.supports_list():
-            return False
-
-        marker_type = self.get_marker_type()
-        origin = get_origin(param_type)
-
-        if origin is list:
-            args = get_args(param_type)
-            if args:
-                list_item_type = args[0]
-                # list[MarkerType]
-                if list_item_type == marker_type:
-                    return True
-                # list[Annotated[MarkerType, "name"]]
-                list_item_origin = get_origin(list_item_type)
-                if list_item_origin is Annotated:
-                    list_item_args = get_args(list_item_type)
-                    if list_item_args and list_item_args[0] == marker_type:
-                        return True
-
-        return False
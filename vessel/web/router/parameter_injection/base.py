@@ -3,16 +3,21 @@ Base interface for parameter injection system
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 from dataclasses import dataclass
 import inspect
 
 from vessel.web.http.request import HttpRequest
 
 
-@dataclass
+@dataclass(slots=True)
 class InjectionContext:
-    """파라미터 주입에 필요한 컨텍스트 정보"""
+    """
+    파라미터 주입에 필요한 컨텍스트 정보
+
+    요청마다 파라미터 수만큼 생성되므로 __slots__로 선언하여
+    인스턴스 __dict__ 할당을 피합니다.
+    """
 
     request: HttpRequest
     param_name: str
@@ -22,12 +27,20 @@ class InjectionContext:
     request_data: Dict[str, Any]
 
 
+# 파라미터별로 미리 준비한 주입 함수: (request, request_data) -> (값, 제거 여부)
+BoundInjector = Callable[[HttpRequest, Dict[str, Any]], Tuple[Optional[Any], bool]]
+
+
 class ParameterInjector(ABC):
     """
     파라미터 주입을 담당하는 추상 클래스
     각 타입별로 구현하여 Registry에 등록
     """
 
+    # inject()에서 context.request_data(query/path/body 병합 dict)를 읽는지 여부
+    # False인 injector만 사용하는 핸들러는 요청 데이터 병합을 생략함
+    reads_request_data: bool = True
+
     @abstractmethod
     def can_inject(self, context: InjectionContext) -> bool:
         """
@@ -54,6 +67,25 @@ class ParameterInjector(ABC):
         """
         pass
 
+    def bind(
+        self,
+        param_name: str,
+        param: inspect.Parameter,
+        hints: Dict[str, Any],
+        handler: Any = None,
+    ) -> Optional[BoundInjector]:
+        """
+        파라미터 하나에 대한 전용 주입 함수 생성 (라우트 등록 시 한 번 호출)
+
+        파라미터마다 고정된 값(타입, 기본값 등)을 미리 계산해 둘 수 있는
+        injector가 재정의합니다. None을 반환하면 요청마다 inject()를 사용합니다.
+        handler는 데코레이터 옵션(@TrustedBody 등) 확인용 핸들러 함수입니다.
+
+        Returns:
+            inject()와 같은 결과를 내는 함수 또는 None
+        """
+        return None
+
     @property
     @abstractmethod
     def priority(self) -> int:
@@ -14,6 +14,8 @@ from vessel.web.http.injection_types import HttpCookie
 class HttpCookieInjector(AnnotatedValueInjector):
     """HTTP 쿠키 파라미터 주입"""
 
+    reads_request_data = False
+
     def get_marker_type(self) -> type:
         """HttpCookie 타입 반환"""
         return HttpCookie
@@ -2,14 +2,82 @@
 DataclassInjector - Handles dataclass conversion from request body
 """
 
-from typing import Any, Tuple, get_origin
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+    Tuple,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 from dataclasses import fields, is_dataclass, MISSING
+from weakref import WeakKeyDictionary
 
 from vessel.web.router.parameter_injection.base import (
     ParameterInjector,
     InjectionContext,
 )
-from vessel.web.router.parameter_injection.default_value_injector import ValidationError
+from vessel.web.router.parameter_injection.default_value_injector import (
+    Converter,
+    ValidationError,
+    _BOOL_FALSE,
+    _BOOL_TRUE,
+)
+
+
+# _FieldSpec.kind 값
+_REQUIRED = 0  # 기본값 없음
+_DEFAULT = 1  # default 값 사용
+_FACTORY = 2  # default_factory 호출
+
+# request_data에 키가 없음을 나타내는 sentinel (get 한 번으로 존재 확인)
+_MISSING_VALUE = object()
+
+
+class _FieldSpec(NamedTuple):
+    """dataclass 필드 하나의 사전 계산된 정보"""
+
+    name: str
+    type: Any
+    kind: int  # _REQUIRED / _DEFAULT / _FACTORY
+    default: Any  # kind에 따라 default 값 또는 default_factory
+
+
+# dataclass 타입 -> 필드 정보 튜플 (타입이 사라지면 함께 제거)
+_FIELD_SPECS: "WeakKeyDictionary[type, Tuple[_FieldSpec, ...]]" = WeakKeyDictionary()
+
+
+def _get_field_specs(model_type: type) -> Tuple[_FieldSpec, ...]:
+    """
+    dataclass 필드 정보 반환 (타입당 한 번 계산)
+
+    fields() 호출과 MISSING 비교를 요청마다 반복하지 않도록
+    default / default_factory 여부를 kind로 미리 정리해 둡니다.
+    `from __future__ import annotations` 등으로 문자열이 된 필드 타입도
+    여기서 한 번 실제 타입으로 평가합니다.
+    """
+    specs = _FIELD_SPECS.get(model_type)
+    if specs is None:
+        try:
+            hints = get_type_hints(model_type)
+        except Exception:
+            # 평가할 수 없는 전방 참조는 기존처럼 field.type 그대로 사용
+            hints = {}
+        built = []
+        for field_info in fields(model_type):
+            field_type = hints.get(field_info.name, field_info.type)
+            if field_info.default is not MISSING:
+                kind, default = _DEFAULT, field_info.default
+            elif field_info.default_factory is not MISSING:
+                kind, default = _FACTORY, field_info.default_factory
+            else:
+                kind, default = _REQUIRED, None
+            built.append(_FieldSpec(field_info.name, field_type, kind, default))
+        specs = _FIELD_SPECS[model_type] = tuple(built)
+    return specs
 
 
 class DataclassInjector(ParameterInjector):
@@ -26,6 +94,14 @@ class DataclassInjector(ParameterInjector):
     Priority: Not used directly in registry (helper class for RequestBodyInjector)
     """
 
+    def __init__(self):
+        # dataclass 타입 -> 전용 디코더 (dict, param_name) -> instance
+        self._decoders: Dict[type, Callable[[dict, str], Any]] = {}
+        # 중첩 dataclass용 디코더 (생성 실패를 ValueError로 알림)
+        self._nested_decoders: Dict[type, Callable[[dict, str], Any]] = {}
+        # 필드 타입 -> 변환 함수 (value, field_name) -> 변환된 값
+        self._converters: Dict[Any, Converter] = {}
+
     @property
     def priority(self) -> int:
         """
@@ -78,7 +154,9 @@ class DataclassInjector(ParameterInjector):
         param_name = context.param_name
 
         # Check if param_name exists in request_data as nested object
-        if param_name not in request_data:
+        # (pop 한 번으로 조회와 제거를 함께 처리)
+        param_value = request_data.pop(param_name, _MISSING_VALUE)
+        if param_value is _MISSING_VALUE:
             raise ValidationError(
                 [
                     {
@@ -89,7 +167,6 @@ class DataclassInjector(ParameterInjector):
                 ]
             )
 
-        param_value = request_data[param_name]
         if not isinstance(param_value, dict):
             raise ValidationError(
                 [
@@ -102,8 +179,6 @@ class DataclassInjector(ParameterInjector):
 
         # Nested mode: use the nested dict
         instance = self.inject_dataclass(model_type, param_value, param_name)
-        # Remove the nested object from request_data
-        request_data.pop(param_name, None)
         return instance, False
 
     def inject_dataclass(
@@ -133,149 +208,263 @@ class DataclassInjector(ParameterInjector):
                 ]
             )
 
-        body_data = {}
-        dataclass_fields = {f.name: f for f in fields(model_type)}
-        errors = []
+        return self.get_decoder(model_type)(request_data, param_name)
 
-        for field_name, field_info in dataclass_fields.items():
-            if field_name in request_data:
-                value = request_data[field_name]
-                # Type conversion
-                try:
-                    converted_value = self._convert_type(
-                        value, field_info.type, field_name
-                    )
-                    body_data[field_name] = converted_value
-                except ValueError as e:
-                    errors.append(
-                        {"field": f"{param_name}.{field_name}", "message": str(e)}
-                    )
+    def get_decoder(self, model_type: type) -> Callable[[dict, str], Any]:
+        """
+        dataclass 타입별 전용 디코더 반환 (타입당 한 번 생성)
+
+        Args:
+            model_type: Dataclass type
+
+        Returns:
+            (request_data, param_name) -> dataclass instance 함수
+        """
+        decoder = self._decoders.get(model_type)
+        if decoder is None:
+            decoder = self._decoders[model_type] = self._compile_decoder(model_type)
+        return decoder
+
+    def _compile_decoder(
+        self, model_type: type, nested: bool = False
+    ) -> Callable[[dict, str], Any]:
+        """
+        dataclass 필드를 직선 코드로 펼친 디코더 생성
+
+        필드 목록 조회, default 확인, 타입 분기를 요청마다 반복하지 않도록
+        필드별 코드와 변환 함수를 미리 준비합니다. 값이 이미 필드 타입과 정확히 일치하면
+        변환 함수를 호출하지 않고, 에러 목록은 첫 에러가 생길 때만 만듭니다.
+        동작은 필드 순회 방식과 동일합니다.
+
+        nested=True이면 중첩 필드용으로, 인스턴스 생성 실패를 ValueError로
+        발생시켜 상위 필드의 에러로 기록되게 합니다.
+        """
+        namespace: Dict[str, Any] = {
+            "model_type": model_type,
+            "ValidationError": ValidationError,
+            "_MISSING_VALUE": _MISSING_VALUE,
+        }
+        lines = [
+            "def _decode(data, param_name):",
+            "    kwargs = {}",
+            "    errors = None",
+        ]
+        for index, spec in enumerate(_get_field_specs(model_type)):
+            name = repr(spec.name)
+            field_type = spec.type
+            namespace[f"type_{index}"] = field_type
+            namespace[f"convert_{index}"] = self._get_converter(field_type)
+
+            # 제네릭/dataclass가 아닌 일반 클래스는 타입이 정확히 같으면 그대로 사용
+            if (
+                isinstance(field_type, type)
+                and get_origin(field_type) is None
+                and not is_dataclass(field_type)
+            ):
+                convert = (
+                    f"value if type(value) is type_{index} "
+                    f"else convert_{index}(value, {name})"
+                )
             else:
-                # Check if field has default value
-                if field_info.default is not MISSING:
-                    body_data[field_name] = field_info.default
-                elif field_info.default_factory is not MISSING:
-                    body_data[field_name] = field_info.default_factory()
-                else:
-                    # Required field is missing
-                    errors.append(
-                        {
-                            "field": f"{param_name}.{field_name}",
-                            "message": f"Missing required field '{field_name}'",
-                        }
-                    )
-
-        if errors:
-            raise ValidationError(errors)
-
-        # Create dataclass instance
-        try:
-            instance = model_type(**body_data)
-        except Exception as e:
-            raise ValidationError(
+                convert = f"convert_{index}(value, {name})"
+
+            lines.extend(
                 [
-                    {
-                        "field": param_name,
-                        "message": f"Failed to create {model_type.__name__}: {str(e)}",
-                    }
+                    f"    value = data.get({name}, _MISSING_VALUE)",
+                    "    if value is not _MISSING_VALUE:",
+                    "        try:",
+                    f"            kwargs[{name}] = {convert}",
+                    "        except ValueError as e:",
+                    "            if errors is None:",
+                    "                errors = []",
+                    "            errors.append(",
+                    f"                {{'field': param_name + '.' + {name}, "
+                    "'message': str(e)}",
+                    "            )",
+                    "    else:",
                 ]
             )
+            if spec.kind == _DEFAULT:
+                namespace[f"default_{index}"] = spec.default
+                lines.append(f"        kwargs[{name}] = default_{index}")
+            elif spec.kind == _FACTORY:
+                namespace[f"factory_{index}"] = spec.default
+                lines.append(f"        kwargs[{name}] = factory_{index}()")
+            else:
+                message = repr(f"Missing required field '{spec.name}'")
+                lines.extend(
+                    [
+                        "        if errors is None:",
+                        "            errors = []",
+                        "        errors.append(",
+                        f"            {{'field': param_name + '.' + {name}, "
+                        f"'message': {message}}}",
+                        "        )",
+                    ]
+                )
 
-        return instance
+        lines.extend(
+            [
+                "    if errors:",
+                "        raise ValidationError(errors)",
+                "    try:",
+                "        return model_type(**kwargs)",
+                "    except Exception as e:",
+            ]
+        )
+        if nested:
+            failed = repr(f"Failed to create nested {model_type.__name__}: ")
+            lines.append(f"        raise ValueError({failed} + str(e))")
+        else:
+            failed = repr(f"Failed to create {model_type.__name__}: ")
+            lines.extend(
+                [
+                    "        raise ValidationError(",
+                    "            [{'field': param_name, "
+                    f"'message': {failed} + str(e)}}]",
+                    "        )",
+                ]
+            )
+
+        source = "\n".join(lines)
+        filename = f"<vessel-decode-{model_type.__name__}>"
+        exec(compile(source, filename, "exec"), namespace)
+        return namespace["_decode"]
 
     def _convert_type(self, value: Any, target_type: type, field_name: str) -> Any:
         """Convert value to target type"""
-        from typing import get_origin, get_args
+        return self._get_converter(target_type)(value, field_name)
+
+    def _get_converter(self, target_type: Any) -> Converter:
+        """필드 타입별 변환 함수 반환 (캐시 사용)"""
+        try:
+            converter = self._converters.get(target_type)
+        except TypeError:
+            # hashable하지 않은 타입은 캐시 없이 생성
+            return self._build_converter(target_type)
+        if converter is None:
+            converter = self._converters[target_type] = self._build_converter(
+                target_type
+            )
+        return converter
 
+    def _build_converter(self, target_type: Any) -> Converter:
+        """
+        필드 타입에 맞는 변환 함수 생성
+
+        origin / dataclass / 기본 타입 분기를 타입별 클로저로 미리 결정하고,
+        list[X]의 요소 변환 함수도 함께 만들어 둡니다.
+        """
         # Handle generic types (List, Dict, etc.) first
         origin = get_origin(target_type)
         if origin is not None:
             if origin is list:
-                return self._convert_to_list(value, target_type, field_name)
+                args = get_args(target_type)
+                element = self._get_converter(args[0]) if args else None
+                # 쉼표로 분리한 문자열 요소를 map()으로 한 번에 변환할 타입
+                bulk = args[0] if args and args[0] in (int, float) else None
+                return lambda value, name: self._convert_to_list(
+                    value, element, name, bulk
+                )
             elif origin is dict:
-                return self._convert_to_dict(value, target_type, field_name)
+                return lambda value, name: self._convert_to_dict(
+                    value, target_type, name
+                )
             # For other generic types, return as-is
-            return value
+            return lambda value, name: value
 
         # Handle nested dataclasses
         if is_dataclass(target_type):
-            if isinstance(value, dict):
-                # Recursively convert nested dataclass
-                return self._convert_to_dataclass(value, target_type, field_name)
-            else:
+
+            def convert_dataclass(value: Any, name: str) -> Any:
+                if isinstance(value, dict):
+                    # Recursively convert nested dataclass
+                    return self._convert_to_dataclass(value, target_type, name)
                 raise ValueError(
-                    f"Field '{field_name}' expects a dict for dataclass {target_type.__name__}, "
-                    f"got {type(value).__name__}"
+                    f"Field '{name}' expects a dict for dataclass "
+                    f"{target_type.__name__}, got {type(value).__name__}"
                 )
 
-        # Already correct type (check after generic/dataclass handling)
-        try:
-            if isinstance(value, target_type):
-                return value
-        except TypeError:
-            # isinstance may fail for some types, continue with conversion
-            pass
+            return convert_dataclass
 
         # Basic type conversion
-        try:
-            if target_type == bool:
-                return self._convert_to_bool(value)
-            elif target_type == int:
-                return int(value)
-            elif target_type == float:
-                return float(value)
-            elif target_type == str:
-                return str(value)
-            else:
-                # Can't convert, return as-is
+        cast: Optional[Callable[[Any], Any]]
+        if target_type is bool:
+            cast = self._convert_to_bool
+        elif target_type is int or target_type is float or target_type is str:
+            cast = target_type
+        else:
+            # Can't convert, return as-is
+            cast = None
+
+        def convert(value: Any, name: str) -> Any:
+            # 타입이 정확히 같으면 MRO 탐색 없이 그대로 사용
+            if type(value) is target_type:
                 return value
-        except (ValueError, TypeError) as e:
-            raise ValueError(
-                f"Cannot convert field '{field_name}' to {target_type.__name__}: {str(e)}"
-            )
+            # Already correct type (check after generic/dataclass handling)
+            try:
+                if isinstance(value, target_type):
+                    return value
+            except TypeError:
+                # isinstance may fail for some types, continue with conversion
+                pass
+            if cast is None:
+                return value
+            try:
+                return cast(value)
+            except (ValueError, TypeError) as e:
+                raise ValueError(
+                    f"Cannot convert field '{name}' to {target_type.__name__}: {str(e)}"
+                )
+
+        return convert
 
     def _convert_to_bool(self, value: Any) -> bool:
         """Convert value to boolean"""
         if isinstance(value, bool):
             return value
         if isinstance(value, str):
+            if value in _BOOL_TRUE:
+                return True
+            if value in _BOOL_FALSE:
+                return False
             lower_value = value.lower()
-            if lower_value in ("true", "1", "yes", "on"):
+            if lower_value in _BOOL_TRUE:
                 return True
-            elif lower_value in ("false", "0", "no", "off"):
+            elif lower_value in _BOOL_FALSE:
                 return False
             else:
                 raise ValueError(f"Cannot convert '{value}' to boolean")
         return bool(value)
 
-    def _convert_to_list(self, value: Any, target_type: type, field_name: str) -> list:
-        """Convert value to list"""
-        from typing import get_args
-
+    def _convert_to_list(
+        self,
+        value: Any,
+        element: Optional[Converter],
+        field_name: str,
+        bulk: Optional[Callable[[str], Any]] = None,
+    ) -> list:
+        """Convert value to list (element: 요소 변환 함수, 타입 인자가 없으면 None)"""
         if isinstance(value, list):
-            args = get_args(target_type)
-            if args:
-                element_type = args[0]
-                return [
-                    self._convert_type(item, element_type, f"{field_name}[{i}]")
-                    for i, item in enumerate(value)
-                ]
-            return value
+            items = value
         elif isinstance(value, str):
             # Split string by comma
             items = [item.strip() for item in value.split(",")]
-            args = get_args(target_type)
-            if args:
-                element_type = args[0]
-                return [
-                    self._convert_type(item, element_type, f"{field_name}[{i}]")
-                    for i, item in enumerate(items)
-                ]
-            return items
+            if bulk is not None:
+                # 모든 요소가 str이므로 요소별 변환과 결과가 같음
+                try:
+                    return list(map(bulk, items))
+                except ValueError:
+                    # 실패한 요소의 에러 메시지는 요소별 변환에서 생성
+                    pass
         else:
             # Wrap single value in list
             return [value]
 
+        if element is None:
+            return items
+        return [element(item, f"{field_name}[{i}]") for i, item in enumerate(items)]
+
     def _convert_to_dict(self, value: Any, target_type: type, field_name: str) -> dict:
         """Convert value to dict"""
         if isinstance(value, dict):
@@ -289,47 +478,9 @@ class DataclassInjector(ParameterInjector):
         self, value: dict, dataclass_type: type, field_name: str
     ) -> Any:
         """Convert dict to nested dataclass"""
-        dataclass_fields = {f.name: f for f in fields(dataclass_type)}
-        nested_data = {}
-        errors = []
-
-        for nested_field_name, nested_field_info in dataclass_fields.items():
-            if nested_field_name in value:
-                nested_value = value[nested_field_name]
-                try:
-                    converted = self._convert_type(
-                        nested_value,
-                        nested_field_info.type,
-                        f"{field_name}.{nested_field_name}",
-                    )
-                    nested_data[nested_field_name] = converted
-                except ValueError as e:
-                    errors.append(
-                        {
-                            "field": f"{field_name}.{nested_field_name}",
-                            "message": str(e),
-                        }
-                    )
-            else:
-                # Check for default
-                if nested_field_info.default is not MISSING:
-                    nested_data[nested_field_name] = nested_field_info.default
-                elif nested_field_info.default_factory is not MISSING:
-                    nested_data[nested_field_name] = nested_field_info.default_factory()
-                else:
-                    errors.append(
-                        {
-                            "field": f"{field_name}.{nested_field_name}",
-                            "message": f"Missing required field '{nested_field_name}'",
-                        }
-                    )
-
-        if errors:
-            raise ValidationError(errors)
-
-        try:
-            return dataclass_type(**nested_data)
-        except Exception as e:
-            raise ValueError(
-                f"Failed to create nested {dataclass_type.__name__}: {str(e)}"
+        decoder = self._nested_decoders.get(dataclass_type)
+        if decoder is None:
+            decoder = self._nested_decoders[dataclass_type] = self._compile_decoder(
+                dataclass_type, nested=True
             )
+        return decoder(value, field_name)
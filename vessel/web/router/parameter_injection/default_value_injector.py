@@ -3,9 +3,36 @@ DefaultValueInjector - 기본 파라미터 타입 변환 및 검증을 처리하
 """
 
 import inspect
-from typing import Any, Dict, List, Tuple, get_type_hints, get_origin, get_args
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    get_type_hints,
+    get_origin,
+    get_args,
+)
 
-from vessel.web.router.parameter_injection.base import ParameterInjector, InjectionContext
+from vessel.web.http.request import HttpRequest
+from vessel.web.router.parameter_injection.base import (
+    BoundInjector,
+    InjectionContext,
+    ParameterInjector,
+)
+
+# bool 변환 테이블 (set 조회)
+# 흔한 대소문자 표기를 미리 포함하여 대부분의 입력은 .lower() 없이 판정
+_BOOL_TRUE = frozenset(
+    {"true", "True", "TRUE", "1", "yes", "Yes", "YES", "on", "On", "ON"}
+)
+_BOOL_FALSE = frozenset(
+    {"false", "False", "FALSE", "0", "no", "No", "NO", "off", "Off", "OFF"}
+)
+
+# (값, 파라미터 이름) -> 변환된 값
+Converter = Callable[[Any, str], Any]
 
 
 class ValidationError(Exception):
@@ -34,6 +61,10 @@ class DefaultValueInjector(ParameterInjector):
     4. 기본값 처리
     """
 
+    def __init__(self):
+        # 타입별 변환 함수 캐시 (타입 분기는 타입마다 한 번만 수행)
+        self._converters: Dict[Any, Converter] = {}
+
     @property
     def priority(self) -> int:
         """가장 낮은 우선순위 (fallback injector) - 가장 마지막에 실행"""
@@ -123,49 +154,132 @@ class DefaultValueInjector(ParameterInjector):
                 ]
             )
 
+    def bind(
+        self,
+        param_name: str,
+        param: inspect.Parameter,
+        hints: Dict[str, Any],
+        handler: Any = None,
+    ) -> Optional[BoundInjector]:
+        """
+        파라미터 전용 주입 함수 생성
+
+        타입 힌트 조회, 기본값 판정, 변환 함수 선택을 등록 시 한 번만 수행합니다.
+        동작은 inject()와 동일합니다.
+        """
+        converter = self._get_converter(hints.get(param_name, str))
+        has_default = param.default != inspect.Parameter.empty
+        default_value = param.default if has_default else None
+        missing_message = f"Missing required parameter '{param_name}'"
+
+        def inject_bound(
+            request: HttpRequest, request_data: Dict[str, Any]
+        ) -> Tuple[Any, bool]:
+            value = request_data.get(param_name)
+            if value is None:
+                if has_default:
+                    return (default_value, True)
+                raise ValidationError(
+                    [{"field": param_name, "message": missing_message}]
+                )
+            try:
+                return (converter(value, param_name), True)
+            except ValueError as e:
+                raise ValidationError([{"field": param_name, "message": str(e)}])
+
+        return inject_bound
+
     def _convert_type(self, value: Any, param_type: type, param_name: str) -> Any:
         """타입 변환 수행"""
-        # 이미 올바른 타입이면 그대로 반환
-        if isinstance(value, param_type):
-            return value
+        return self._get_converter(param_type)(value, param_name)
+
+    def _get_converter(self, param_type: Any) -> Converter:
+        """타입별 변환 함수 반환 (캐시 사용)"""
+        try:
+            converter = self._converters.get(param_type)
+        except TypeError:
+            # hashable하지 않은 타입은 캐시 없이 생성
+            return self._build_converter(param_type)
+        if converter is None:
+            converter = self._build_converter(param_type)
+            self._converters[param_type] = converter
+        return converter
+
+    def _build_converter(self, param_type: Any) -> Converter:
+        """
+        타입에 맞는 변환 함수 생성
 
+        요청마다 반복하던 origin / bool / int / float / str 분기를
+        타입별 클로저로 미리 결정합니다.
+        """
         # Generic 타입 처리 (List, Dict 등)
         origin = get_origin(param_type)
         if origin is not None:
             if origin is list:
-                return self._convert_to_list(value, param_type, param_name)
+                return lambda value, name: self._convert_to_list(
+                    value, param_type, name
+                )
             elif origin is dict:
-                return self._convert_to_dict(value, param_type, param_name)
+                return lambda value, name: self._convert_to_dict(
+                    value, param_type, name
+                )
             # 다른 Generic 타입은 그대로 반환
-            return value
+            return lambda value, name: value
 
-        # 기본 타입 변환
-        try:
-            if param_type == bool:
-                return self._convert_to_bool(value)
-            elif param_type == int:
-                return int(value)
-            elif param_type == float:
-                return float(value)
-            elif param_type == str:
-                return str(value)
-            else:
-                # 커스텀 타입이거나 변환 불가능한 경우 그대로 반환
+        if param_type is bool:
+            cast = self._convert_to_bool
+        elif param_type is int or param_type is float or param_type is str:
+            cast = param_type
+        else:
+            # 커스텀 타입이거나 변환 불가능한 경우 그대로 반환
+            return lambda value, name: value
+
+        type_name = param_type.__name__
+
+        if param_type is int:
+
+            def convert_int(value: Any, name: str) -> Any:
+                # 부호 없는 10진수 문자열(가장 흔한 path/query 값)은 바로 변환
+                if type(value) is str and value.isdecimal():
+                    return int(value)
+                if isinstance(value, int):
+                    return value
+                try:
+                    return int(value)
+                except (ValueError, TypeError) as e:
+                    raise ValueError(
+                        f"Cannot convert parameter '{name}' to int: {str(e)}"
+                    )
+
+            return convert_int
+
+        def convert(value: Any, name: str) -> Any:
+            # 이미 올바른 타입이면 그대로 반환
+            if isinstance(value, param_type):
                 return value
-        except (ValueError, TypeError) as e:
-            raise ValueError(
-                f"Cannot convert parameter '{param_name}' to {param_type.__name__}: {str(e)}"
-            )
+            try:
+                return cast(value)
+            except (ValueError, TypeError) as e:
+                raise ValueError(
+                    f"Cannot convert parameter '{name}' to {type_name}: {str(e)}"
+                )
+
+        return convert
 
     def _convert_to_bool(self, value: Any) -> bool:
         """문자열을 boolean으로 변환"""
         if isinstance(value, bool):
             return value
         if isinstance(value, str):
+            if value in _BOOL_TRUE:
+                return True
+            if value in _BOOL_FALSE:
+                return False
+            # 그 밖의 대소문자 조합만 소문자로 변환하여 재확인
             lower_value = value.lower()
-            if lower_value in ("true", "1", "yes", "on"):
+            if lower_value in _BOOL_TRUE:
                 return True
-            elif lower_value in ("false", "0", "no", "off"):
+            elif lower_value in _BOOL_FALSE:
                 return False
             else:
                 raise ValueError(f"Cannot convert '{value}' to boolean")
@@ -189,6 +303,13 @@ class DefaultValueInjector(ParameterInjector):
             args = get_args(param_type)
             if args:
                 element_type = args[0]
+                if element_type is int or element_type is float:
+                    # 모든 요소가 str이므로 요소별 변환과 결과가 같음
+                    try:
+                        return list(map(element_type, items))
+                    except ValueError:
+                        # 실패한 요소의 에러 메시지는 요소별 변환에서 생성
+                        pass
                 return [
                     self._convert_type(item, element_type, f"{param_name}[{i}]")
                     for i, item in enumerate(items)
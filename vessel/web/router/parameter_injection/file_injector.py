@@ -14,6 +14,9 @@ from vessel.web.http.uploaded_file import (
     parse_files_from_list,
 )
 
+# 파일 데이터 dict가 반드시 가지는 키
+_FILE_KEYS = frozenset(("filename", "content"))
+
 
 class FileInjector(AnnotatedValueInjector):
     """파일 업로드 파라미터 주입 (Annotated 구문 지원, 리스트 지원)"""
@@ -72,7 +75,7 @@ class FileInjector(AnnotatedValueInjector):
     def _is_file_data(self, value: Any) -> bool:
         """파일 데이터인지 확인"""
         # 딕셔너리이고 filename과 content 키가 있으면 파일 데이터
-        if isinstance(value, dict) and "filename" in value and "content" in value:
+        if isinstance(value, dict) and _FILE_KEYS <= value.keys():
             return True
         # 리스트이고 각 항목이 파일 데이터면 파일 리스트
         if isinstance(value, list) and value and isinstance(value[0], dict):
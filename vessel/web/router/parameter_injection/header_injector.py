@@ -2,7 +2,7 @@
 HTTP Header parameter injector
 """
 
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from vessel.web.router.parameter_injection.annotated_value_injector import (
     AnnotatedValueInjector,
@@ -14,6 +14,14 @@ from vessel.web.http.injection_types import HttpHeader
 class HttpHeaderInjector(AnnotatedValueInjector):
     """HTTP 헤더 파라미터 주입"""
 
+    reads_request_data = False
+
+    def __init__(self):
+        # 파라미터 이름 -> 헤더 이름 캐시 (핸들러 파라미터 이름은 유한하므로 무제한)
+        self._header_name_map: Dict[str, str] = {}
+        # 헤더 이름 -> 소문자 이름 캐시 (대소문자 무시 조회용)
+        self._lower_name_map: Dict[str, str] = {}
+
     def get_marker_type(self) -> type:
         """HttpHeader 타입 반환"""
         return HttpHeader
@@ -21,12 +29,30 @@ class HttpHeaderInjector(AnnotatedValueInjector):
     def extract_value_from_request(
         self, context: InjectionContext, name: str
     ) -> Optional[str]:
-        """요청에서 헤더 값 추출"""
-        return context.request.headers.get(name)
+        """
+        요청에서 헤더 값 추출
+
+        헤더는 클라이언트가 보낸 대소문자 그대로 저장되므로, 정확히 일치하는
+        키를 먼저 조회하고 없을 때만 요청의 소문자 헤더 맵에서 찾습니다.
+        """
+        headers = context.request.headers
+        value = headers.get(name)
+        if value is not None:
+            return value
+
+        lower_name = self._lower_name_map.get(name)
+        if lower_name is None:
+            lower_name = self._lower_name_map[name] = name.lower()
+        return context.request.get_header_ignore_case(lower_name)
 
     def get_default_name(self, param_name: str) -> str:
         """파라미터 이름을 헤더 이름으로 변환 (snake_case -> Title-Case)"""
-        return self._convert_to_header_name(param_name)
+        header_name = self._header_name_map.get(param_name)
+        if header_name is None:
+            # 이름별로 한 번만 변환하고 이후에는 dict 조회
+            header_name = self._convert_to_header_name(param_name)
+            self._header_name_map[param_name] = header_name
+        return header_name
 
     def create_value_object(self, name: str, value: str) -> HttpHeader:
         """HttpHeader 값 객체 생성"""
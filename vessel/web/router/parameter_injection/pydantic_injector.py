@@ -2,7 +2,7 @@
 PydanticInjector - Handles Pydantic BaseModel conversion from request body
 """
 
-from typing import Any, Tuple, get_origin
+from typing import Any, Callable, Dict, Tuple, get_origin
 
 from pydantic import BaseModel, ValidationError as PydanticValidationError
 
@@ -11,6 +11,7 @@ from vessel.web.router.parameter_injection.base import (
     InjectionContext,
 )
 from vessel.web.router.parameter_injection.default_value_injector import ValidationError
+from vessel.web.router.parameter_injection.dataclass_injector import _MISSING_VALUE
 
 
 class PydanticInjector(ParameterInjector):
@@ -22,6 +23,10 @@ class PydanticInjector(ParameterInjector):
     Priority: Not used directly in registry (helper class for RequestBodyInjector)
     """
 
+    def __init__(self):
+        # 모델 타입 -> 검증 함수 (Pydantic 버전 판별은 타입마다 한 번만 수행)
+        self._validators: Dict[type, Callable[[dict], Any]] = {}
+
     @property
     def priority(self) -> int:
         """
@@ -77,7 +82,9 @@ class PydanticInjector(ParameterInjector):
         param_name = context.param_name
 
         # Check if param_name exists in request_data as nested object
-        if param_name not in request_data:
+        # (pop 한 번으로 조회와 제거를 함께 처리)
+        param_value = request_data.pop(param_name, _MISSING_VALUE)
+        if param_value is _MISSING_VALUE:
             raise ValidationError(
                 [
                     {
@@ -88,7 +95,6 @@ class PydanticInjector(ParameterInjector):
                 ]
             )
 
-        param_value = request_data[param_name]
         if not isinstance(param_value, dict):
             raise ValidationError(
                 [
@@ -101,8 +107,6 @@ class PydanticInjector(ParameterInjector):
 
         # Nested mode: use the nested dict
         instance = self.inject_pydantic(model_type, param_value, param_name)
-        # Remove the nested object from request_data
-        request_data.pop(param_name, None)
         return instance, False
 
     def inject_pydantic(
@@ -122,24 +126,21 @@ class PydanticInjector(ParameterInjector):
         Raises:
             ValidationError: If validation fails
         """
-        if not (isinstance(model_type, type) and issubclass(model_type, BaseModel)):
-            raise ValidationError(
-                [
-                    {
-                        "field": param_name,
-                        "message": f"{model_type.__name__} is not a Pydantic BaseModel",
-                    }
-                ]
-            )
+        validator = self.get_validator(model_type, param_name)
 
         try:
-            instance = model_type(**request_data)
+            instance = validator(request_data)
             return instance
 
         except PydanticValidationError as e:
             errors = []
             for error in e.errors():
-                field_path = ".".join(str(loc) for loc in error["loc"])
+                loc = error["loc"]
+                # 대부분 최상위 필드 하나이므로 join 없이 바로 사용
+                if len(loc) == 1 and type(loc[0]) is str:
+                    field_path = loc[0]
+                else:
+                    field_path = ".".join(map(str, loc))
                 errors.append(
                     {
                         "field": (
@@ -149,3 +150,50 @@ class PydanticInjector(ParameterInjector):
                     }
                 )
             raise ValidationError(errors)
+
+    def get_constructor(self, model_type: type) -> Callable[[dict], Any]:
+        """
+        검증 없이 모델 인스턴스를 만드는 함수 반환 (@TrustedBody 전용)
+
+        - Pydantic v2: model_type.model_construct
+        - Pydantic v1: model_type.construct
+        """
+        construct = getattr(model_type, "model_construct", None)
+        if construct is None:
+            construct = model_type.construct
+        return lambda data: construct(**data)
+
+    def get_validator(
+        self, model_type: type, param_name: str
+    ) -> Callable[[dict], Any]:
+        """
+        모델 타입의 검증 함수 반환 (캐시 사용)
+
+        - Pydantic v2: model_type.model_validate
+        - Pydantic v1: model_type.parse_obj
+
+        Raises:
+            ValidationError: model_type이 BaseModel이 아닌 경우
+        """
+        validator = self._validators.get(model_type)
+        if validator is not None:
+            return validator
+
+        if not (isinstance(model_type, type) and issubclass(model_type, BaseModel)):
+            raise ValidationError(
+                [
+                    {
+                        "field": param_name,
+                        "message": f"{model_type.__name__} is not a Pydantic BaseModel",
+                    }
+                ]
+            )
+
+        validator = getattr(model_type, "model_validate", None)
+        if validator is None:
+            validator = getattr(model_type, "parse_obj", None)
+        if validator is None:
+            validator = lambda data: model_type(**data)
+
+        self._validators[model_type] = validator
+        return validator
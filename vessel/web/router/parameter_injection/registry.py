@@ -2,15 +2,46 @@
 Registry for parameter injectors
 """
 
-from typing import List, Dict, Any, Set
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+import bisect
 import inspect
 
 from vessel.web.router.parameter_injection.base import (
     ParameterInjector,
     InjectionContext,
 )
+from vessel.web.router.parameter_injection.request_injector import (
+    HttpRequestInjector,
+)
+from vessel.web.router.parameter_injection.default_value_injector import (
+    ValidationError,
+)
 from vessel.web.http.request import HttpRequest
 
+_empty = inspect.Parameter.empty
+
+
+class ParamSpec(NamedTuple):
+    """
+    핸들러 파라미터 하나에 대한 사전 계산된 주입 계획
+
+    injector가 None이면 HttpRequest를 컨텍스트 없이 바로 주입합니다.
+    """
+
+    name: str
+    param: inspect.Parameter
+    param_type: Any
+    injector: Optional[ParameterInjector]
+
 
 class ParameterInjectorRegistry:
     """
@@ -18,7 +49,12 @@ class ParameterInjectorRegistry:
     """
 
     def __init__(self):
-        self._injectors: List[ParameterInjector] = []
+        self._injectors: Sequence[ParameterInjector] = []
+        self._frozen = False
+        # HttpRequest 파라미터를 컨텍스트 생성 없이 바로 주입할지 여부
+        self._request_fast_path = False
+        # 핸들러별 (이름, Parameter) 튜플 캐시 ("self" 제외)
+        self._parameters_cache: Dict[Any, Tuple[Tuple[str, inspect.Parameter], ...]] = {}
 
     def register(self, injector: ParameterInjector) -> None:
         """
@@ -26,10 +62,272 @@ class ParameterInjectorRegistry:
 
         Args:
             injector: 등록할 injector
+
+        Raises:
+            RuntimeError: freeze() 이후 등록 시도 시
+        """
+        if self._frozen:
+            raise RuntimeError(
+                "ParameterInjectorRegistry is frozen; register injectors before freeze()"
+            )
+        # 우선순위 순 위치에 삽입 (같은 우선순위는 등록 순서 유지)
+        bisect.insort(self._injectors, injector, key=lambda x: x.priority)
+
+    def freeze(self) -> None:
+        """
+        등록을 마감하고 injector 목록을 tuple로 고정
+
+        애플리케이션 시작 시 모든 injector 등록이 끝난 뒤 한 번 호출합니다.
+        이후 요청 처리 중에는 불변 tuple을 순회합니다.
+        """
+        if not self._frozen:
+            self._injectors = tuple(self._injectors)
+            self._frozen = True
+            # 최우선 injector가 HttpRequestInjector이면 그 판정을 루프 밖에서 직접 수행
+            self._request_fast_path = bool(self._injectors) and isinstance(
+                self._injectors[0], HttpRequestInjector
+            )
+
+    @property
+    def is_frozen(self) -> bool:
+        """freeze() 호출 여부"""
+        return self._frozen
+
+    def _get_parameters(
+        self, handler: Any
+    ) -> Tuple[Tuple[str, inspect.Parameter], ...]:
+        """
+        핸들러의 (이름, Parameter) 튜플 반환 (캐시 사용)
+
+        시그니처는 핸들러 정의 시점에 고정되므로 한 번만 해석하고,
+        요청마다 signature 객체와 items() 뷰를 만들지 않습니다.
+        """
+        try:
+            return self._parameters_cache[handler]
+        except KeyError:
+            pass
+        except TypeError:
+            # hashable하지 않은 핸들러는 캐시 없이 처리
+            return self._build_parameters(handler)
+
+        parameters = self._build_parameters(handler)
+        self._parameters_cache[handler] = parameters
+        return parameters
+
+    @staticmethod
+    def _build_parameters(
+        handler: Any,
+    ) -> Tuple[Tuple[str, inspect.Parameter], ...]:
+        """inspect.signature에서 "self"를 제외한 파라미터 튜플 생성"""
+        return tuple(
+            (name, param)
+            for name, param in inspect.signature(handler).parameters.items()
+            if name != "self"
+        )
+
+    def build_plan(
+        self, handler: Any, hints: Dict[str, Any]
+    ) -> Optional[Tuple[ParamSpec, ...]]:
+        """
+        핸들러의 파라미터별 주입 계획 생성 (라우트 등록 시 한 번 호출)
+
+        can_inject 판정은 파라미터 이름/타입 힌트에만 의존하므로 미리 계산해두고,
+        요청 처리 시에는 inject_planned()로 선택된 injector만 호출합니다.
+
+        Args:
+            handler: 핸들러 함수
+            hints: 타입 힌트
+
+        Returns:
+            ParamSpec 튜플. 계획을 세울 수 없는 경우(주입기 없음, can_inject 에러)
+            None을 반환하며, 이때는 inject_parameters()로 요청마다 판정합니다.
+        """
+        plan = []
+        for param_name, param in self._get_parameters(handler):
+            param_type = hints.get(param_name, param.annotation)
+
+            if self._request_fast_path and self._is_request_param(
+                param_name, param_type
+            ):
+                plan.append(ParamSpec(param_name, param, param_type, None))
+                continue
+
+            context = InjectionContext(
+                request=None,
+                param_name=param_name,
+                param=param,
+                param_type=param_type,
+                hints=hints,
+                request_data={},
+            )
+            try:
+                injector = next(
+                    (i for i in self._injectors if i.can_inject(context)), None
+                )
+            except Exception:
+                # 에러는 요청 처리 시점에 기존과 동일하게 발생하도록 계획 생략
+                return None
+            if injector is None:
+                return None
+            plan.append(ParamSpec(param_name, param, param_type, injector))
+
+        return tuple(plan)
+
+    @staticmethod
+    def _is_request_param(param_name: str, param_type: Any) -> bool:
+        """HttpRequestInjector.can_inject와 동일한 조건"""
+        return param_type is HttpRequest or (
+            param_name == "request" and param_type is _empty
+        )
+
+    def compile_plan(
+        self,
+        plan: Tuple[ParamSpec, ...],
+        hints: Optional[Dict[str, Any]] = None,
+        handler: Any = None,
+    ) -> Callable[[HttpRequest, Dict[str, Any], Dict[str, Any]], Dict[str, Any]]:
+        """
+        주입 계획을 파라미터별 직선 코드로 펼친 주입 함수 생성
+
+        inject_planned()의 파라미터 루프와 튜플 언패킹을 없애기 위해
+        핸들러마다 전용 함수를 한 번 생성합니다. 동작은 inject_planned()와
+        동일합니다.
+
+        hints가 주어지면 injector.bind()로 파라미터 전용 주입 함수를 받아
+        InjectionContext 생성 없이 호출합니다.
+
+        Args:
+            plan: build_plan()이 만든 주입 계획
+            hints: 핸들러 타입 힌트 (라우트 등록 시 고정된 값)
+            handler: 핸들러 함수 (bind()에 전달되는 데코레이터 옵션 확인용)
+
+        Returns:
+            (request, request_data, hints) -> kwargs 함수
         """
-        self._injectors.append(injector)
-        # 우선순위 순으로 정렬
-        self._injectors.sort(key=lambda x: x.priority)
+        namespace: Dict[str, Any] = {
+            "InjectionContext": InjectionContext,
+            "ValidationError": ValidationError,
+        }
+        lines = [
+            "def _inject(request, request_data, hints):",
+            "    kwargs = {}",
+            "    errors = None",
+        ]
+        # 처리된 파라미터는 모든 주입이 끝난 뒤 request_data에서 제거
+        # (body 모델이 같은 이름의 필드를 읽을 수 있으므로 즉시 제거하지 않음)
+        removals: List[str] = []
+        for index, spec in enumerate(plan):
+            name = repr(spec.name)
+            if spec.injector is None:
+                lines.append(f"    kwargs[{name}] = request")
+                removals.append(f"    request_data.pop({name}, None)")
+                continue
+
+            bound = (
+                spec.injector.bind(spec.name, spec.param, hints, handler)
+                if hints is not None
+                else None
+            )
+            if bound is not None:
+                namespace[f"bound_{index}"] = bound
+                call = [
+                    "        value, should_remove = "
+                    f"bound_{index}(request, request_data)"
+                ]
+            else:
+                namespace[f"inject_{index}"] = spec.injector.inject
+                namespace[f"param_{index}"] = spec.param
+                namespace[f"type_{index}"] = spec.param_type
+                call = [
+                    f"        value, should_remove = inject_{index}(InjectionContext(",
+                    f"            request, {name}, param_{index}, type_{index},",
+                    "            hints, request_data))",
+                ]
+            lines.append(f"    remove_{index} = False")
+            lines.append("    try:")
+            lines.extend(call)
+            lines.extend(
+                [
+                    "    except ValidationError as e:",
+                    "        if errors is None:",
+                    "            errors = []",
+                    "        errors.extend(e.errors)",
+                    "    else:",
+                    f"        kwargs[{name}] = value",
+                    f"        remove_{index} = should_remove",
+                ]
+            )
+            removals.append(f"    if remove_{index}:")
+            removals.append(f"        request_data.pop({name}, None)")
+        lines.extend(removals)
+        lines.extend(
+            [
+                "    if errors:",
+                "        raise ValidationError(errors)",
+                "    return kwargs",
+            ]
+        )
+
+        source = "\n".join(lines)
+        exec(compile(source, "<vessel-inject>", "exec"), namespace)
+        return namespace["_inject"]
+
+    def inject_planned(
+        self,
+        plan: Tuple[ParamSpec, ...],
+        request: HttpRequest,
+        request_data: Dict[str, Any],
+        hints: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        build_plan()으로 만든 계획에 따라 파라미터 주입
+
+        injector 순회와 can_inject 판정 없이 파라미터마다 선택된 injector만 실행합니다.
+
+        Raises:
+            ValidationError: 여러 파라미터 검증 실패 시 모든 에러를 모아서 발생
+        """
+        kwargs = {}
+        # 검증 에러 수집 (에러가 없으면 리스트를 만들지 않음)
+        validation_errors: Optional[List[Dict[str, str]]] = None
+        # 처리된 파라미터 이름 (모든 주입이 끝난 뒤 request_data에서 제거)
+        params_to_remove: List[str] = []
+
+        for param_name, param, param_type, injector in plan:
+            if injector is None:
+                kwargs[param_name] = request
+                params_to_remove.append(param_name)
+                continue
+
+            context = InjectionContext(
+                request=request,
+                param_name=param_name,
+                param=param,
+                param_type=param_type,
+                hints=hints,
+                request_data=request_data,
+            )
+            try:
+                value, should_remove = injector.inject(context)
+            except ValidationError as e:
+                if validation_errors is None:
+                    validation_errors = []
+                validation_errors.extend(e.errors)
+                continue
+
+            kwargs[param_name] = value
+            if should_remove:
+                params_to_remove.append(param_name)
+
+        # request_data에서 처리된 파라미터 제거
+        for param_name in params_to_remove:
+            request_data.pop(param_name, None)
+
+        # 검증 에러가 있으면 한 번에 발생
+        if validation_errors:
+            raise ValidationError(validation_errors)
+
+        return kwargs
 
     def inject_parameters(
         self,
@@ -53,20 +351,25 @@ class ParameterInjectorRegistry:
         Raises:
             ValidationError: 여러 파라미터 검증 실패 시 모든 에러를 모아서 발생
         """
-        from vessel.web.router.parameter_injection.default_value_injector import (
-            ValidationError,
-        )
-
-        sig = inspect.signature(handler)
+        parameters = self._get_parameters(handler)
         kwargs = {}
-        params_to_remove_from_request_data: Set[str] = set()
         validation_errors = []  # 검증 에러 수집
+        # 루프 안에서 반복되는 속성/메서드 조회를 지역 변수로 고정
+        request_fast_path = self._request_fast_path
+        injectors = self._injectors
+        hints_get = hints.get
+        # 처리된 파라미터 이름 (모든 주입이 끝난 뒤 request_data에서 제거)
+        params_to_remove: List[str] = []
 
-        for param_name, param in sig.parameters.items():
-            if param_name == "self":
-                continue
+        for param_name, param in parameters:
+            param_type = hints_get(param_name, param.annotation)
 
-            param_type = hints.get(param_name, param.annotation)
+            # HttpRequest 파라미터: 컨텍스트 생성/injector 순회 없이 바로 주입
+            # (HttpRequestInjector.can_inject와 동일한 조건)
+            if request_fast_path and self._is_request_param(param_name, param_type):
+                kwargs[param_name] = request
+                params_to_remove.append(param_name)
+                continue
 
             # 주입 컨텍스트 생성
             context = InjectionContext(
@@ -80,14 +383,14 @@ class ParameterInjectorRegistry:
 
             # 우선순위 순으로 injector 실행
             injected = False
-            for injector in self._injectors:
+            for injector in injectors:
                 if injector.can_inject(context):
                     try:
                         value, should_remove = injector.inject(context)
                         kwargs[param_name] = value
 
-                        if should_remove and param_name in request_data:
-                            params_to_remove_from_request_data.add(param_name)
+                        if should_remove:
+                            params_to_remove.append(param_name)
 
                         injected = True
                         break  # 첫 번째 매칭된 injector만 실행
@@ -107,9 +410,8 @@ class ParameterInjectorRegistry:
                 )
 
         # request_data에서 처리된 파라미터 제거
-        for param_name in params_to_remove_from_request_data:
-            if param_name in request_data:
-                del request_data[param_name]
+        for param_name in params_to_remove:
+            request_data.pop(param_name, None)
 
         # 검증 에러가 있으면 한 번에 발생
         if validation_errors:
@@ -4,16 +4,19 @@ RequestBodyInjector - Handles RequestBody[DataClass | BaseModel] type hints
 Delegates to DataclassInjector or PydanticInjector based on model type.
 """
 
-from typing import Any, Tuple, get_origin, get_args, Annotated
-from dataclasses import is_dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, get_origin, get_args, Annotated
+from dataclasses import fields, is_dataclass
+import inspect
 
 from vessel.web.router.parameter_injection.base import (
+    BoundInjector,
     ParameterInjector,
     InjectionContext,
 )
 from vessel.web.router.parameter_injection.default_value_injector import ValidationError
 from vessel.web.router.parameter_injection.dataclass_injector import DataclassInjector
 from vessel.web.router.parameter_injection.pydantic_injector import PydanticInjector
+from vessel.web.http.request import HttpRequest
 from vessel.web.http.request_body import RequestBody
 from pydantic import BaseModel
 
@@ -29,9 +32,16 @@ class RequestBodyInjector(ParameterInjector):
     Priority: 150 (high priority, before default injector)
     """
 
-    def __init__(self):
-        self.dataclass_injector = DataclassInjector()
-        self.pydantic_injector = PydanticInjector()
+    def __init__(
+        self,
+        dataclass_injector: Optional[DataclassInjector] = None,
+        pydantic_injector: Optional[PydanticInjector] = None,
+    ):
+        # 레지스트리에 등록된 인스턴스를 넘기면 디코더/검증 함수 캐시를 공유
+        self.dataclass_injector = dataclass_injector or DataclassInjector()
+        self.pydantic_injector = pydantic_injector or PydanticInjector()
+        # 모델 타입 -> (Pydantic 여부, 필드 이름들) 캐시
+        self._model_info: Dict[Any, Tuple[bool, Tuple[str, ...]]] = {}
 
     @property
     def priority(self) -> int:
@@ -48,7 +58,7 @@ class RequestBodyInjector(ParameterInjector):
         # Check for Annotated[RequestBody, DataClass | BaseModel]
         if origin is Annotated:
             args = get_args(param_type)
-            if args and args[0] == RequestBody:
+            if args and args[0] is RequestBody:
                 # Has dataclass or BaseModel type in annotation
                 if len(args) > 1:
                     model_type = args[1]
@@ -92,14 +102,7 @@ class RequestBodyInjector(ParameterInjector):
             )
 
         model_type = args[1]
-
-        # Check if it's a Pydantic BaseModel
-        is_pydantic = False
-        try:
-            if isinstance(model_type, type) and issubclass(model_type, BaseModel):
-                is_pydantic = True
-        except TypeError:
-            pass
+        is_pydantic, field_names = self._get_model_info(model_type)
 
         # Delegate to appropriate injector
         if is_pydantic:
@@ -121,24 +124,90 @@ class RequestBodyInjector(ParameterInjector):
             )
 
         # Remove all used fields from request_data
+        for field_name in field_names:
+            request_data.pop(field_name, None)
+
+        return instance, False
+
+    def bind(
+        self,
+        param_name: str,
+        param: inspect.Parameter,
+        hints: Dict[str, Any],
+        handler: Any = None,
+    ) -> Optional[BoundInjector]:
+        """
+        파라미터 전용 주입 함수 생성
+
+        RequestBody[...]에서 모델 타입 추출, Pydantic/dataclass 판별, 필드 이름
+        수집을 등록 시 한 번만 수행합니다. 동작은 inject()와 동일하며,
+        모델 타입을 해석할 수 없으면 None을 반환해 inject()의 에러를 그대로 사용합니다.
+        @TrustedBody 핸들러의 Pydantic 모델은 검증 없이 model_construct()로 생성합니다.
+        """
+        args = get_args(hints.get(param_name, param.annotation))
+        if len(args) < 2:
+            return None
+
+        model_type = args[1]
+        is_pydantic, field_names = self._get_model_info(model_type)
+        decode: Callable[[dict], Any]
+        if is_pydantic and getattr(handler, "__pydi_trusted_body__", False):
+            decode = self.pydantic_injector.get_constructor(model_type)
+        elif is_pydantic:
+            inject_pydantic = self.pydantic_injector.inject_pydantic
+            decode = lambda data: inject_pydantic(model_type, data, param_name)
+        elif is_dataclass(model_type):
+            decoder = self.dataclass_injector.get_decoder(model_type)
+            decode = lambda data: decoder(data, param_name)
+        else:
+            return None
+
+        def inject_bound(
+            request: HttpRequest, request_data: Dict[str, Any]
+        ) -> Tuple[Any, bool]:
+            instance = decode(request_data)
+            # Remove all used fields from request_data
+            for field_name in field_names:
+                request_data.pop(field_name, None)
+            return instance, False
+
+        return inject_bound
+
+    def _get_model_info(self, model_type: Any) -> Tuple[bool, Tuple[str, ...]]:
+        """
+        모델 타입의 (Pydantic 여부, 필드 이름들) 반환 (캐시 사용)
+
+        issubclass / hasattr 기반 Pydantic 버전 판별과 필드 목록 수집을
+        모델 타입마다 한 번만 수행합니다.
+        """
+        info = self._model_info.get(model_type)
+        if info is not None:
+            return info
+
+        # Check if it's a Pydantic BaseModel
+        is_pydantic = False
+        try:
+            if isinstance(model_type, type) and issubclass(model_type, BaseModel):
+                is_pydantic = True
+        except TypeError:
+            pass
+
         # Get model fields based on type
         if is_pydantic:
-            # Pydantic BaseModel
             if hasattr(model_type, "model_fields"):
                 # Pydantic v2
-                field_names = model_type.model_fields.keys()
+                field_names = tuple(model_type.model_fields.keys())
             elif hasattr(model_type, "__fields__"):
                 # Pydantic v1
-                field_names = model_type.__fields__.keys()
+                field_names = tuple(model_type.__fields__.keys())
             else:
-                field_names = []
+                field_names = ()
+        elif is_dataclass(model_type):
+            field_names = tuple(f.name for f in fields(model_type))
         else:
-            # Dataclass
-            from dataclasses import fields
+            # 캐시하지 않음 (inject에서 ValidationError 발생)
+            return False, ()
 
-            field_names = [f.name for f in fields(model_type)]
-
-        for field_name in field_names:
-            request_data.pop(field_name, None)
-
-        return instance, False
+        info = (is_pydantic, field_names)
+        self._model_info[model_type] = info
+        return info
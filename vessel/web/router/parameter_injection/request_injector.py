@@ -15,9 +15,11 @@ from vessel.web.http.request import HttpRequest
 class HttpRequestInjector(ParameterInjector):
     """HttpRequest 타입 파라미터 주입"""
 
+    reads_request_data = False
+
     def can_inject(self, context: InjectionContext) -> bool:
         """HttpRequest 타입이거나 'request' 이름인 경우"""
-        return context.param_type == HttpRequest or (
+        return context.param_type is HttpRequest or (
             context.param_name == "request"
             and context.param_type is inspect.Parameter.empty
         )
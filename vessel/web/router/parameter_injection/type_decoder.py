@@ -0,0 +1,127 @@
+"""
+Type annotation decoder shared by parameter injectors
+
+파라미터 타입 힌트의 Optional / list / Annotated 구조를 한 번만 해석하고
+결과를 캐시합니다. 타입 힌트는 핸들러 정의 시점에 고정되므로 캐시 적중률이
+사실상 100%입니다.
+"""
+
+import types
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    NamedTuple,
+    Optional,
+    Union,
+    Annotated,
+    get_origin,
+    get_args,
+    get_type_hints,
+)
+
+# TypeInfo.flags 비트
+OPTIONAL = 1  # Optional[X] / X | None
+LIST = 2  # list[X]
+ANNOTATED = 4  # Annotated[X, key]
+
+_NoneType = type(None)
+_UNION_ORIGINS = (Union, types.UnionType)
+
+
+class TypeInfo(NamedTuple):
+    """해석된 타입 힌트 정보"""
+
+    base_type: Any  # Optional/list/Annotated를 벗겨낸 실제 타입
+    key: Optional[Any]  # Annotated[X, key]의 key (없으면 None)
+    flags: int  # OPTIONAL | LIST | ANNOTATED 비트 조합
+
+
+def _decode(param_type: Any) -> TypeInfo:
+    """캐시 없이 타입 힌트 해석"""
+    flags = 0
+    origin = get_origin(param_type)
+
+    # Optional[X] -> X
+    if origin in _UNION_ORIGINS:
+        args = get_args(param_type)
+        members = [arg for arg in args if arg is not _NoneType]
+        if len(members) != 1:
+            # Union[A, B] 처럼 단일 타입으로 좁힐 수 없는 경우 그대로 반환
+            return TypeInfo(param_type, None, 0)
+        if len(members) != len(args):
+            flags |= OPTIONAL
+        param_type = members[0]
+        origin = get_origin(param_type)
+
+    # list[X] -> X
+    if origin is list:
+        args = get_args(param_type)
+        if not args:
+            return TypeInfo(param_type, None, flags)
+        flags |= LIST
+        param_type = args[0]
+        origin = get_origin(param_type)
+
+    # Annotated[X, key] -> X
+    key = None
+    if origin is Annotated:
+        args = get_args(param_type)
+        flags |= ANNOTATED
+        param_type = args[0]
+        if len(args) > 1:
+            key = args[1]
+
+    return TypeInfo(param_type, key, flags)
+
+
+_decode_cached = lru_cache(maxsize=4096)(_decode)
+
+
+def decode_annotation(param_type: Any) -> TypeInfo:
+    """
+    타입 힌트를 TypeInfo로 해석 (캐시 사용)
+
+    지원 형태:
+    - X
+    - Annotated[X, key]
+    - Optional[X], Optional[Annotated[X, key]]
+    - list[X], list[Annotated[X, key]], Optional[list[...]]
+
+    Args:
+        param_type: 파라미터 타입 힌트
+
+    Returns:
+        TypeInfo(base_type, key, flags)
+    """
+    try:
+        return _decode_cached(param_type)
+    except TypeError:
+        # Annotated 메타데이터가 hashable하지 않은 경우 캐시 없이 해석
+        return _decode(param_type)
+
+
+def resolve_type_hints(func: Any) -> Dict[str, Any]:
+    """
+    함수의 타입 힌트 반환 (Annotated 포함)
+
+    대부분의 핸들러 어노테이션은 이미 평가된 타입이므로 __annotations__를
+    그대로 사용하고, 문자열(전방 참조)이 섞여 있을 때만 get_type_hints로
+    평가합니다.
+
+    Args:
+        func: 대상 함수 또는 바운드 메서드
+
+    Returns:
+        파라미터 이름 -> 타입 힌트
+
+    Raises:
+        get_type_hints가 전방 참조를 평가하지 못한 경우의 예외
+    """
+    raw = getattr(func, "__annotations__", None)
+    if not isinstance(raw, dict):
+        return get_type_hints(func, include_extras=True)
+    for value in raw.values():
+        if isinstance(value, str):
+            return get_type_hints(func, include_extras=True)
+    return dict(raw)
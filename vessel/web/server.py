@@ -1,13 +1,17 @@
 """
-DevServer - 개발용 HTTP 서버
+DevServer / AsyncDevServer - 개발용 HTTP 서버
 """
 
+import asyncio
 import logging
 import http.server
-import socketserver
+import threading
+from email.utils import formatdate
+from http import HTTPStatus
 import json
-import asyncio
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from urllib.parse import parse_qsl
 from vessel.web.http.request import HttpRequest
 
 if TYPE_CHECKING:
@@ -15,6 +19,105 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 상태 코드 -> 응답 상태 줄의 reason phrase
+_REASON_PHRASES = {status.value: status.phrase.encode("ascii") for status in HTTPStatus}
+
+# 요청 바디를 나눠 읽는 단위
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+# JSON 바이트 디코딩 (orjson이 있으면 사용, 호출마다 분기하지 않도록 바로 바인딩)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj) -> bytes:
+    """JSON 바이트 인코딩 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson이 직렬화하지 못하는 타입은 표준 json으로 처리
+            pass
+    return json.dumps(obj).encode("utf-8")
+
+
+def _decode_body(body_bytes) -> Any:
+    """요청 바디 디코딩 (Content-Type과 무관하게 JSON으로 해석, 빈 바디는 {})"""
+    if not body_bytes:
+        return {}
+    return _json_loads(body_bytes)
+
+
+def _parse_chunk_size(line: bytes) -> int:
+    """
+    chunked 인코딩의 청크 크기 줄 해석 (확장 파라미터는 무시)
+
+    Raises:
+        ValueError: 크기가 16진수가 아니거나 음수인 경우
+    """
+    size = int(line.split(b";", 1)[0].strip(), 16)
+    if size < 0:
+        raise ValueError(f"Invalid chunk size: {line!r}")
+    return size
+
+
+def _is_chunked(transfer_encoding: str) -> bool:
+    """
+    Transfer-Encoding 값이 chunked인지 확인
+
+    Raises:
+        ValueError: chunked 외의 전송 코딩 (지원하지 않으므로 바디 길이를 알 수 없음)
+    """
+    if transfer_encoding.strip().lower() != "chunked":
+        raise ValueError(f"Unsupported Transfer-Encoding: {transfer_encoding!r}")
+    return True
+
+
+class _ThreadPoolHTTPServer(http.server.ThreadingHTTPServer):
+    """
+    요청을 고정 크기 스레드 풀에서 처리하는 HTTP 서버
+
+    ThreadingHTTPServer는 연결마다 새 스레드를 만들기 때문에,
+    동시 연결 수만큼 스레드가 늘어나지 않도록 풀 크기로 제한합니다.
+
+    요청 처리 코루틴은 서버와 수명을 같이하는 이벤트 루프 하나에서 실행하여
+    요청마다 asyncio.run으로 루프를 만들고 닫지 않습니다.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, server_address, handler_class, max_workers: int = 64):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="vessel-dev"
+        )
+        # 바인딩 실패 시에도 server_close()가 루프를 정리할 수 있도록 먼저 생성
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self.loop.run_forever, name="vessel-dev-loop", daemon=True
+        )
+        self._loop_thread.start()
+        super().__init__(server_address, handler_class)
+
+    def run_coroutine(self, coro) -> Any:
+        """서버 이벤트 루프에서 코루틴을 실행하고 결과를 기다림"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def process_request(self, request, client_address):
+        self._executor.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=False)
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._loop_thread.join()
+            self.loop.close()
+
 
 class DevServer:
     """
@@ -23,39 +126,63 @@ class DevServer:
     주의: 프로덕션에서는 Uvicorn, Gunicorn 등을 사용할 것
     """
 
-    def __init__(self, app: "Application", host: str = "0.0.0.0", port: int = 8080):
+    def __init__(
+        self,
+        app: "Application",
+        host: str = "0.0.0.0",
+        port: int = 8080,
+        max_workers: int = 64,
+    ):
         self.app = app
         self.host = host
         self.port = port
+        # 동시에 처리할 최대 요청 수 (요청 처리 스레드 풀 크기)
+        self.max_workers = max_workers
 
     def run(self):
         """서버 실행"""
         logger.info("=" * 60)
-        logger.info(f"🚢 Vessel Application Starting...")
-        logger.info(f"   Host: {self.host}")
-        logger.info(f"   Port: {self.port}")
-        logger.info(f"   Debug: {self.app.debug}")
+        logger.info("🚢 Vessel Application Starting...")
+        logger.info("   Host: %s", self.host)
+        logger.info("   Port: %s", self.port)
+        logger.info("   Debug: %s", self.app.debug)
         logger.info("=" * 60)
         logger.info("Starting development server...")
         logger.info("(Use an ASGI/WSGI server like Uvicorn for production)")
 
         try:
-            handler_class = self._create_handler_class()
-            with socketserver.TCPServer((self.host, self.port), handler_class) as httpd:
-                logger.info(f"✓ Server running at http://{self.host}:{self.port}")
+            with self._create_server((self.host, self.port)) as httpd:
+                logger.info("✓ Server running at http://%s:%s", self.host, self.port)
                 logger.info("Press CTRL+C to stop")
                 httpd.serve_forever()
 
         except KeyboardInterrupt:
             logger.info("\n🛑 Shutting down server...")
         except Exception as e:
-            logger.error(f"Failed to start server: {e}", exc_info=True)
+            logger.error("Failed to start server: %s", e, exc_info=True)
+
+    def _create_server(self, server_address) -> http.server.ThreadingHTTPServer:
+        """요청을 스레드 풀에서 동시에 처리하는 HTTP 서버 생성"""
+        return _ThreadPoolHTTPServer(
+            server_address, self._create_handler_class(), self.max_workers
+        )
 
     def _create_handler_class(self):
         """Request Handler 클래스 생성"""
         app = self.app
 
+        async def dispatch(request: HttpRequest):
+            # 이벤트 루프 안에서 호출하므로 handle_request는 코루틴을 반환
+            return await app.handle_request(request)
+
         class VesselHandler(http.server.SimpleHTTPRequestHandler):
+            # HTTP/1.1 keep-alive (응답마다 Content-Length를 보내므로 연결 재사용 가능)
+            protocol_version = "HTTP/1.1"
+            # 작은 JSON 응답이 Nagle 알고리즘으로 지연되지 않도록 TCP_NODELAY 설정
+            disable_nagle_algorithm = True
+            # 유휴 keep-alive 연결이 워커 스레드를 붙잡지 않도록 읽기 타임아웃(초)
+            timeout = 15
+
             def do_GET(self):
                 self._handle_request("GET")
 
@@ -73,45 +200,319 @@ class DevServer:
 
             def _handle_request(self, method: str):
                 try:
-                    # 요청 바디 읽기
-                    content_length = int(self.headers.get("Content-Length", 0))
-                    body_bytes = (
-                        self.rfile.read(content_length) if content_length > 0 else b""
-                    )
+                    body_bytes = self._read_body()
+                except ValueError as e:
+                    # 바디 길이를 알 수 없으면 남은 바이트가 다음 요청으로
+                    # 해석되지 않도록 연결을 닫음 (send_error가 close 처리)
+                    self.send_error(400, str(e))
+                    return
+
+                try:
+                    # 요청 바디 디코딩
+                    body = _decode_body(body_bytes)
 
                     # HttpRequest 생성
                     request = HttpRequest(
                         method=method,
-                        path=self.path.split("?")[0],
-                        headers=dict(self.headers),
-                        body=json.loads(body_bytes) if body_bytes else {},
+                        path=self.path.partition("?")[0],
+                        headers=self._collect_headers(),
+                        body=body,
                     )
 
-                    # 요청 처리 (async 지원)
-                    # asyncio.run()을 사용하여 async 함수를 동기적으로 실행
-                    response = asyncio.run(app.handle_request(request))
+                    # 요청 처리 (서버 이벤트 루프에서 실행)
+                    response = self.server.run_coroutine(dispatch(request))
 
                     # 응답 전송
-                    self.send_response(response.status_code)
-                    self.send_header("Content-Type", "application/json")
+                    self._write_response(
+                        response.status_code,
+                        response.headers,
+                        _json_dumps(response.body),
+                    )
+
+                except Exception as e:
+                    logger.error("Error handling request: %s", e, exc_info=True)
+                    self.send_error(500, str(e))
 
-                    # 응답 헤더 추가
-                    if hasattr(response, "headers"):
-                        for key, value in response.headers.items():
-                            self.send_header(key, value)
+            def _write_response(self, status_code: int, headers, body: bytes):
+                """
+                상태 줄, 헤더, 바디를 하나의 버퍼로 조립해 한 번에 전송
 
-                    self.end_headers()
+                send_response/send_header/end_headers는 헤더마다 문자열을 만들고
+                인코딩하므로, 직접 조립하여 쓰기 호출을 한 번으로 줄입니다.
+                """
+                self.log_request(status_code)
+                buffer = bytearray(
+                    b"%s %d %s\r\n"
+                    % (
+                        self.protocol_version.encode("ascii"),
+                        status_code,
+                        _REASON_PHRASES.get(status_code, b""),
+                    )
+                )
+                buffer += b"Server: %s\r\nDate: %s\r\n" % (
+                    self.version_string().encode("latin-1"),
+                    self.date_time_string().encode("latin-1"),
+                )
+                buffer += b"Content-Type: application/json\r\n"
+                if headers:
+                    for key, value in headers.items():
+                        buffer += f"{key}: {value}\r\n".encode("latin-1")
+                buffer += b"Content-Length: %d\r\n\r\n" % len(body)
+                buffer += body
+                self.wfile.write(buffer)
 
-                    # 응답 바디
-                    response_body = json.dumps(response.body).encode("utf-8")
-                    self.wfile.write(response_body)
+            def _collect_headers(self) -> Dict[str, str]:
+                """
+                요청 헤더를 dict로 변환
 
-                except Exception as e:
-                    logger.error(f"Error handling request: {e}", exc_info=True)
-                    self.send_error(500, str(e))
+                dict(self.headers)는 키마다 HTTPMessage의 대소문자 무시 선형 탐색을
+                반복하므로, items()를 한 번 순회하며 같은 이름은 첫 값을 유지합니다.
+                """
+                headers: Dict[str, str] = {}
+                for key, value in self.headers.items():
+                    headers.setdefault(key, value)
+                return headers
+
+            def _read_body(self) -> Union[bytes, bytearray]:
+                """
+                Content-Length만큼 요청 바디를 청크 단위로 읽기
+
+                Transfer-Encoding: chunked 바디는 끝까지 읽어 keep-alive 연결의
+                다음 요청과 섞이지 않게 합니다.
+
+                Raises:
+                    ValueError: 지원하지 않는 Transfer-Encoding 또는 잘못된 청크
+                """
+                transfer_encoding = self.headers.get("Transfer-Encoding")
+                if transfer_encoding is not None and _is_chunked(transfer_encoding):
+                    return self._read_chunked_body()
+
+                remaining = int(self.headers.get("Content-Length", 0))
+                if remaining <= _READ_CHUNK_SIZE:
+                    # 작은 바디(대부분의 JSON 요청)는 한 번에 읽어 복사 없이 사용
+                    return self.rfile.read(remaining) if remaining > 0 else b""
+                buffer = bytearray()
+                while remaining > 0:
+                    chunk = self.rfile.read(min(remaining, _READ_CHUNK_SIZE))
+                    if not chunk:
+                        break
+                    buffer += chunk
+                    remaining -= len(chunk)
+                return buffer
+
+            def _read_chunked_body(self) -> bytearray:
+                """Transfer-Encoding: chunked 바디를 마지막 청크와 trailer까지 읽기"""
+                buffer = bytearray()
+                while True:
+                    size = _parse_chunk_size(self.rfile.readline(_READ_CHUNK_SIZE))
+                    if size == 0:
+                        break
+                    chunk = self.rfile.read(size)
+                    if len(chunk) != size or self.rfile.readline(3) != b"\r\n":
+                        raise ValueError("Incomplete chunked body")
+                    buffer += chunk
+                # trailer 헤더는 빈 줄까지 읽고 버림
+                readline = self.rfile.readline
+                while readline(_READ_CHUNK_SIZE) not in (b"\r\n", b"\n", b""):
+                    pass
+                return buffer
 
             def log_message(self, format, *args):
                 # 커스텀 로깅
-                logger.info(f"{self.address_string()} - {format % args}")
+                # 로그 레벨에서 걸러지면 문자열 포매팅을 하지 않도록 인자로 전달
+                logger.info("%s - " + format, self.address_string(), *args)
 
         return VesselHandler
+
+
+class AsyncDevServer:
+    """
+    asyncio 기반 개발용 HTTP 서버
+
+    asyncio.start_server로 연결을 받아 하나의 이벤트 루프에서 처리하므로
+    연결마다 스레드를 만들지 않습니다. HTTP/1.1 keep-alive를 지원하며,
+    요청은 app.handle_request를 await하여 처리합니다.
+
+    주의: 프로덕션에서는 Uvicorn 등을 사용할 것
+    """
+
+    # 요청 줄 + 헤더의 최대 크기
+    max_header_size = 64 * 1024
+
+    def __init__(self, app: "Application", host: str = "0.0.0.0", port: int = 8080):
+        self.app = app
+        self.host = host
+        self.port = port
+
+    def run(self):
+        """서버 실행"""
+        logger.info("=" * 60)
+        logger.info("🚢 Vessel Application Starting...")
+        logger.info("   Host: %s", self.host)
+        logger.info("   Port: %s", self.port)
+        logger.info("   Debug: %s", self.app.debug)
+        logger.info("=" * 60)
+        logger.info("Starting development server (asyncio)...")
+        logger.info("(Use an ASGI/WSGI server like Uvicorn for production)")
+
+        try:
+            asyncio.run(self._serve_forever())
+        except KeyboardInterrupt:
+            logger.info("\n🛑 Shutting down server...")
+        except Exception as e:
+            logger.error("Failed to start server: %s", e, exc_info=True)
+
+    async def start(self) -> asyncio.AbstractServer:
+        """현재 이벤트 루프에서 연결 수신 시작"""
+        return await asyncio.start_server(
+            self._handle_connection,
+            self.host,
+            self.port,
+            limit=self.max_header_size,
+        )
+
+    async def _serve_forever(self):
+        server = await self.start()
+        async with server:
+            logger.info("✓ Server running at http://%s:%s", self.host, self.port)
+            logger.info("Press CTRL+C to stop")
+            await server.serve_forever()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        """연결 하나에서 keep-alive가 끝날 때까지 요청 처리"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(_encode_response(431, None, b"", False))
+                    break
+
+                try:
+                    request, keep_alive = await self._read_request(reader, head)
+                except (
+                    ValueError,
+                    asyncio.IncompleteReadError,
+                    asyncio.LimitOverrunError,
+                ):
+                    writer.write(_encode_response(400, None, b"", False))
+                    break
+
+                try:
+                    response = await self.app.handle_request(request)
+                    data = _encode_response(
+                        response.status_code,
+                        response.headers,
+                        _json_dumps(response.body),
+                        keep_alive,
+                    )
+                except Exception as e:
+                    logger.error("Error handling request: %s", e, exc_info=True)
+                    data = _encode_response(500, None, b"", False)
+                    keep_alive = False
+
+                writer.write(data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader, head: bytes):
+        """
+        요청 줄/헤더를 해석하고 바디를 읽어 HttpRequest 생성
+
+        Returns:
+            (HttpRequest, keep_alive)
+
+        Raises:
+            ValueError: 요청 줄이나 헤더 형식이 잘못된 경우
+        """
+        request_line, *header_lines = head[:-4].decode("latin-1").split("\r\n")
+        method, target, version = request_line.split(" ", 2)
+
+        headers: Dict[str, str] = {}
+        content_length = 0
+        connection = ""
+        chunked = False
+        for line in header_lines:
+            name, separator, value = line.partition(":")
+            if not separator:
+                raise ValueError(f"Malformed header line: {line!r}")
+            name = name.strip()
+            value = value.strip()
+            headers[name] = value
+            lower_name = name.lower()
+            if lower_name == "content-length":
+                content_length = int(value)
+            elif lower_name == "connection":
+                connection = value.lower()
+            elif lower_name == "transfer-encoding":
+                chunked = _is_chunked(value)
+
+        if chunked:
+            body_bytes = await self._read_chunked_body(reader)
+        elif content_length:
+            body_bytes = await reader.readexactly(content_length)
+        else:
+            body_bytes = b""
+
+        path, _, query = target.partition("?")
+        request = HttpRequest(
+            method=method,
+            path=path,
+            headers=headers,
+            query_params=dict(parse_qsl(query)) if query else {},
+            body=_decode_body(body_bytes),
+        )
+
+        if version == "HTTP/1.1":
+            keep_alive = connection != "close"
+        else:
+            keep_alive = connection == "keep-alive"
+        return request, keep_alive
+
+    @staticmethod
+    async def _read_chunked_body(reader: asyncio.StreamReader) -> bytearray:
+        """
+        Transfer-Encoding: chunked 바디를 마지막 청크와 trailer까지 읽기
+
+        Raises:
+            ValueError: 청크 크기 줄이나 청크 끝의 CRLF가 잘못된 경우
+        """
+        buffer = bytearray()
+        while True:
+            size = _parse_chunk_size(await reader.readuntil(b"\r\n"))
+            if size == 0:
+                break
+            buffer += await reader.readexactly(size)
+            if await reader.readexactly(2) != b"\r\n":
+                raise ValueError("Incomplete chunked body")
+        # trailer 헤더는 빈 줄까지 읽고 버림
+        while await reader.readuntil(b"\r\n") != b"\r\n":
+            pass
+        return buffer
+
+
+def _encode_response(
+    status_code: int, headers: Optional[Dict[str, str]], body: bytes, keep_alive: bool
+) -> bytes:
+    """상태 줄, 헤더, 바디를 하나의 HTTP/1.1 응답 바이트로 조립"""
+    buffer = bytearray(
+        b"HTTP/1.1 %d %s\r\n" % (status_code, _REASON_PHRASES.get(status_code, b""))
+    )
+    buffer += b"Date: %s\r\n" % formatdate(usegmt=True).encode("ascii")
+    buffer += b"Content-Type: application/json\r\n"
+    if headers:
+        for key, value in headers.items():
+            buffer += f"{key}: {value}\r\n".encode("latin-1")
+    buffer += b"Connection: %s\r\n" % (b"keep-alive" if keep_alive else b"close")
+    buffer += b"Content-Length: %d\r\n\r\n" % len(body)
+    buffer += body
+    return bytes(buffer)